@@ -0,0 +1,35 @@
+"""Add user data versions
+
+Revision ID: a8e4b6c2f9d3
+Revises: f1c7d3e9a0b5
+Create Date: 2026-10-19 17:21:54.388410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8e4b6c2f9d3'
+down_revision: Union[str, None] = 'f1c7d3e9a0b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create user_data_versions table; a missing row means all versions are 0
+    op.create_table('user_data_versions',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('watches', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('images', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('values', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('readings', sa.BigInteger(), server_default='0', nullable=False),
+    sa.Column('services', sa.BigInteger(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_data_versions')
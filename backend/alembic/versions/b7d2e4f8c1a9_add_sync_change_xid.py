@@ -0,0 +1,44 @@
+"""Add sync change transaction ids
+
+Revision ID: b7d2e4f8c1a9
+Revises: a8e4b6c2f9d3
+Create Date: 2026-10-19 18:41:05.302917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2e4f8c1a9'
+down_revision: Union[str, None] = 'a8e4b6c2f9d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYNC_TABLES = [
+    'watches',
+    'watch_images',
+    'service_history',
+    'market_values',
+    'movement_accuracy_readings',
+    'sync_tombstones',
+]
+
+
+def upgrade() -> None:
+    # Existing rows sort before every new change; clients holding a token from
+    # before this revision restart with a full sync
+    for table in SYNC_TABLES:
+        op.add_column(
+            table,
+            sa.Column('change_xid', sa.BigInteger(), nullable=False, server_default='0'),
+        )
+        op.alter_column(table, 'change_xid', server_default=None)
+        op.create_index(op.f(f'ix_{table}_change_xid'), table, ['change_xid'], unique=False)
+
+
+def downgrade() -> None:
+    for table in reversed(SYNC_TABLES):
+        op.drop_index(op.f(f'ix_{table}_change_xid'), table_name=table)
+        op.drop_column(table, 'change_xid')
@@ -0,0 +1,65 @@
+"""Add sync change tracking
+
+Revision ID: c3d9f1a2b7e4
+Revises: a6eaf56ae254
+Create Date: 2026-10-19 10:12:41.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d9f1a2b7e4'
+down_revision: Union[str, None] = 'a6eaf56ae254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SYNC_TABLES = [
+    'watches',
+    'watch_images',
+    'service_history',
+    'market_values',
+    'movement_accuracy_readings',
+]
+
+
+def upgrade() -> None:
+    # Shared change counter
+    op.execute(sa.schema.CreateSequence(sa.Sequence('sync_change_seq')))
+
+    # Stamp existing rows so a first sync (since=0) returns everything
+    for table in SYNC_TABLES:
+        op.add_column(table, sa.Column('change_seq', sa.BigInteger(), nullable=True))
+        op.execute(f"UPDATE {table} SET change_seq = nextval('sync_change_seq')")
+        op.alter_column(table, 'change_seq', nullable=False)
+        op.create_index(op.f(f'ix_{table}_change_seq'), table, ['change_seq'], unique=False)
+
+    # Create sync_tombstones table
+    op.create_table(
+        'sync_tombstones',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('change_seq', sa.BigInteger(), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('entity', sa.String(length=50), nullable=False),
+        sa.Column('entity_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sync_tombstones_change_seq'), 'sync_tombstones', ['change_seq'], unique=False)
+    op.create_index(op.f('ix_sync_tombstones_user_id'), 'sync_tombstones', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_sync_tombstones_user_id'), table_name='sync_tombstones')
+    op.drop_index(op.f('ix_sync_tombstones_change_seq'), table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+
+    for table in reversed(SYNC_TABLES):
+        op.drop_index(op.f(f'ix_{table}_change_seq'), table_name=table)
+        op.drop_column(table, 'change_seq')
+
+    op.execute(sa.schema.DropSequence(sa.Sequence('sync_change_seq')))
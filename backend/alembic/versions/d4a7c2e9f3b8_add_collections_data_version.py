@@ -0,0 +1,27 @@
+"""Add collections data version
+
+Revision ID: d4a7c2e9f3b8
+Revises: b7d2e4f8c1a9
+Create Date: 2026-10-19 21:12:37.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7c2e9f3b8'
+down_revision: Union[str, None] = 'b7d2e4f8c1a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Collection names are embedded in watch responses, so their ETags need
+    # a counter bumped on collection writes
+    op.add_column('user_data_versions', sa.Column('collections', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('user_data_versions', 'collections')
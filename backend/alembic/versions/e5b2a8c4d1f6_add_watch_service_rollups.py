@@ -0,0 +1,66 @@
+"""Add watch service rollups
+
+Revision ID: e5b2a8c4d1f6
+Revises: c3d9f1a2b7e4
+Create Date: 2026-10-19 14:36:08.201947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2a8c4d1f6'
+down_revision: Union[str, None] = 'c3d9f1a2b7e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create watch_service_rollups table
+    op.create_table('watch_service_rollups',
+    sa.Column('watch_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('service_count', sa.Integer(), nullable=False),
+    sa.Column('total_costs', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('last_service_date', sa.DateTime(), nullable=True),
+    sa.Column('next_service_due', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['watch_id'], ['watches.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('watch_id')
+    )
+    op.create_index('ix_watch_service_rollups_user_next_due', 'watch_service_rollups', ['user_id', 'next_service_due'], unique=False)
+
+    # Backfill rollups for watches that already have service records
+    op.execute("""
+        INSERT INTO watch_service_rollups
+            (watch_id, user_id, service_count, total_costs,
+             last_service_date, next_service_due, updated_at)
+        SELECT w.id,
+               w.user_id,
+               count(s.id),
+               coalesce((
+                   SELECT jsonb_object_agg(t.currency, t.total)
+                   FROM (
+                       SELECT coalesce(s2.cost_currency, 'USD') AS currency,
+                              sum(s2.cost) AS total
+                       FROM service_history s2
+                       WHERE s2.watch_id = w.id AND s2.cost IS NOT NULL
+                       GROUP BY 1
+                   ) t
+               ), '{}'::jsonb),
+               max(s.service_date),
+               (array_agg(s.next_service_due ORDER BY s.service_date DESC))[1],
+               now() AT TIME ZONE 'utc'
+        FROM watches w
+        JOIN service_history s ON s.watch_id = w.id
+        GROUP BY w.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_watch_service_rollups_user_next_due', table_name='watch_service_rollups')
+    op.drop_table('watch_service_rollups')
@@ -0,0 +1,27 @@
+"""Add saved search seen matches
+
+Revision ID: f1c7d3e9a0b5
+Revises: e5b2a8c4d1f6
+Create Date: 2026-10-19 16:02:27.734115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c7d3e9a0b5'
+down_revision: Union[str, None] = 'e5b2a8c4d1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('saved_searches', sa.Column('seen_match_ids', sa.JSON(), nullable=True))
+    op.add_column('saved_searches', sa.Column('seen_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('saved_searches', 'seen_at')
+    op.drop_column('saved_searches', 'seen_match_ids')
@@ -1,13 +1,18 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from app.config import settings
 from app.core.deps import get_current_user
 from app.core.security import (
     create_access_token,
     create_refresh_token,
     decode_token,
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    password_needs_rehash,
+    verify_password_async,
 )
 from app.database import get_db
 from app.models.user import User, UserRole
@@ -25,34 +30,42 @@ from app.utils.logging import log_security_event
 router = APIRouter()
 
 
+def _get_user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.query(User).filter(User.email == email).first()
+
+
 @router.post(
     "/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED
 )
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user"""
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_in_threadpool(_get_user_by_email, db, user_data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
-    # Check if this is the first user (should be admin)
-    user_count = db.query(User).count()
-    is_first_user = user_count == 0
-
-    # Create new user
-    hashed_password = get_password_hash(user_data.password)
-    new_user = User(
-        email=user_data.email,
-        full_name=user_data.full_name,
-        hashed_password=hashed_password,
-        role=UserRole.admin if is_first_user else UserRole.user,
-    )
+    # Hash on the dedicated password executor, off the shared threadpool
+    hashed_password = await get_password_hash_async(user_data.password)
 
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    def create_user() -> User:
+        # Check if this is the first user (should be admin)
+        is_first_user = db.query(User).count() == 0
+
+        new_user = User(
+            email=user_data.email,
+            full_name=user_data.full_name,
+            hashed_password=hashed_password,
+            role=UserRole.admin if is_first_user else UserRole.user,
+        )
+
+        db.add(new_user)
+        db.commit()
+        db.refresh(new_user)
+        return new_user
+
+    new_user = await run_in_threadpool(create_user)
 
     # Log successful registration
     log_security_event(
@@ -67,10 +80,15 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(user_data: UserLogin, db: Session = Depends(get_db)):
-    """Login with email and password"""
+async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+    """
+    Login with email and password.
+
+    Hashes made with a different bcrypt cost than BCRYPT_ROUNDS are
+    transparently re-hashed with the configured cost.
+    """
     # Find user by email
-    user = db.query(User).filter(User.email == user_data.email).first()
+    user = await run_in_threadpool(_get_user_by_email, db, user_data.email)
     if not user:
         log_security_event(
             "login_failed", email=user_data.email, details={"reason": "user_not_found"}
@@ -81,7 +99,7 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
         )
 
     # Verify password
-    if not verify_password(user_data.password, user.hashed_password):
+    if not await verify_password_async(user_data.password, user.hashed_password):
         log_security_event(
             "login_failed",
             user_id=str(user.id),
@@ -93,12 +111,26 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
             detail="Incorrect email or password",
         )
 
+    # Read before the commit below expires the user, which would reload it
+    # with a blocking query on the event loop
+    user_id, email = str(user.id), user.email
+
+    # Upgrade the hash if the configured cost has changed
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await get_password_hash_async(user_data.password)
+        await run_in_threadpool(db.commit)
+        log_security_event(
+            "password_rehashed",
+            user_id=user_id,
+            details={"rounds": settings.BCRYPT_ROUNDS},
+        )
+
     # Log successful login
-    log_security_event("login_success", user_id=str(user.id), email=user.email)
+    log_security_event("login_success", user_id=user_id, email=email)
 
     # Generate tokens
-    access_token = create_access_token(data={"sub": str(user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data={"sub": user_id})
+    refresh_token = create_refresh_token(data={"sub": user_id})
 
     return TokenResponse(access_token=access_token, refresh_token=refresh_token)
 
@@ -166,14 +198,14 @@ def update_me(
 
 
 @router.post("/change-password", status_code=status.HTTP_204_NO_CONTENT)
-def change_password(
+async def change_password(
     password_data: UserChangePassword,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Change current user password"""
     # Verify current password
-    if not verify_password(
+    if not await verify_password_async(
         password_data.current_password, current_user.hashed_password
     ):
         raise HTTPException(
@@ -181,7 +213,9 @@ def change_password(
         )
 
     # Update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
-    db.commit()
+    current_user.hashed_password = await get_password_hash_async(
+        password_data.new_password
+    )
+    await run_in_threadpool(db.commit)
 
     return None
@@ -0,0 +1,150 @@
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.deps import get_current_user
+from app.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.backup import BackupResponse, RestoreResponse
+from app.utils.backup import (
+    BackupError,
+    BackupNotFoundError,
+    create_backup,
+    list_backups,
+    restore_backup,
+)
+from app.utils.logging import log_security_event
+
+router = APIRouter()
+
+
+def resolve_backup_user(
+    user_id: Optional[UUID], current_user: User, db: Session
+) -> UUID:
+    """Get the user whose backups are managed; only admins may pick another user"""
+    if user_id is None or user_id == current_user.id:
+        return current_user.id
+
+    if current_user.role != UserRole.admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required"
+        )
+
+    if not db.query(User.id).filter(User.id == user_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
+
+    return user_id
+
+
+def _backup_response(manifest: dict) -> BackupResponse:
+    return BackupResponse(
+        id=manifest["id"],
+        user_id=manifest["user_id"],
+        kind=manifest["kind"],
+        parent_id=manifest["parent_id"],
+        created_at=manifest["created_at"],
+        row_counts=manifest["row_counts"],
+        file_count=len(manifest["files"]),
+        blob_count=len(manifest["blobs"]),
+        size_bytes=manifest["size_bytes"],
+    )
+
+
+@router.post("/", response_model=BackupResponse, status_code=status.HTTP_201_CREATED)
+def create_account_backup(
+    incremental: bool = Query(
+        default=True,
+        description="Only store changes since the latest backup (a full backup is made if there is none)",
+    ),
+    user_id: Optional[UUID] = Query(
+        default=None, description="User to back up (admin only)"
+    ),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Back up all collections, watches, history and uploaded files of an account
+    into a compressed archive in BACKUP_DIR.
+    """
+    target_user_id = resolve_backup_user(user_id, current_user, db)
+
+    manifest = create_backup(
+        db,
+        target_user_id,
+        settings.BACKUP_DIR,
+        settings.UPLOAD_DIR,
+        incremental=incremental,
+    )
+
+    log_security_event(
+        "backup_created",
+        user_id=str(current_user.id),
+        details={"backup_id": manifest["id"], "target_user_id": str(target_user_id)},
+    )
+
+    return _backup_response(manifest)
+
+
+@router.get("/", response_model=List[BackupResponse])
+def list_account_backups(
+    user_id: Optional[UUID] = Query(
+        default=None, description="User whose backups to list (admin only)"
+    ),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """List an account's backups, newest first"""
+    target_user_id = resolve_backup_user(user_id, current_user, db)
+
+    manifests = list_backups(settings.BACKUP_DIR, target_user_id)
+    return [_backup_response(manifest) for manifest in reversed(manifests)]
+
+
+@router.post("/{backup_id}/restore", response_model=RestoreResponse)
+def restore_account_backup(
+    backup_id: str,
+    user_id: Optional[UUID] = Query(
+        default=None, description="User whose backup to restore (admin only)"
+    ),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Restore an account to the state captured by a backup.
+
+    Records created after the backup are removed, and deleted or changed
+    uploaded files are written back.
+    """
+    target_user_id = resolve_backup_user(user_id, current_user, db)
+
+    try:
+        result = restore_backup(
+            db, target_user_id, backup_id, settings.BACKUP_DIR, settings.UPLOAD_DIR
+        )
+        db.commit()
+    except BackupNotFoundError as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except BackupError as e:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Backup references data that no longer exists",
+        )
+
+    log_security_event(
+        "backup_restored",
+        user_id=str(current_user.id),
+        details={"backup_id": backup_id, "target_user_id": str(target_user_id)},
+    )
+
+    return result
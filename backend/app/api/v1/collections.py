@@ -1,11 +1,11 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_data_versions
 from app.database import get_db
 from app.models.collection import Collection
 from app.models.user import User
@@ -15,15 +15,34 @@ from app.schemas.collection import (
     CollectionResponse,
     CollectionUpdate,
 )
+from app.utils.conditional import not_modified, resource_etag
+from app.utils.data_version import DataVersions, bump_data_versions
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[CollectionResponse])
 def list_collections(
-    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    current_user: User = Depends(get_current_user),
+    versions: DataVersions = Depends(get_data_versions),
+    db: Session = Depends(get_db),
 ):
-    """Get all collections for the current user"""
+    """
+    Get all collections for the current user.
+
+    Responses carry an ETag covering the user's collections and the watches
+    counted in them; a matching If-None-Match is answered with 304.
+    """
+    etag = resource_etag(
+        request, "collection-list", versions, ("collections", "watches")
+    )
+    cached = not_modified(if_none_match, etag, response)
+    if cached:
+        return cached
+
     collections = (
         db.query(Collection, func.count(Watch.id).label("watch_count"))
         .outerjoin(Watch, Watch.collection_id == Collection.id)
@@ -33,9 +52,9 @@ def list_collections(
         .all()
     )
 
-    result = []
-    for collection, watch_count in collections:
-        collection_dict = {
+    # Plain dicts: the response model validates and dumps them in one pass
+    return [
+        {
             "id": collection.id,
             "user_id": collection.user_id,
             "name": collection.name,
@@ -46,9 +65,8 @@ def list_collections(
             "updated_at": collection.updated_at,
             "watch_count": watch_count,
         }
-        result.append(CollectionResponse(**collection_dict))
-
-    return result
+        for collection, watch_count in collections
+    ]
 
 
 @router.post(
@@ -203,9 +221,13 @@ def delete_collection(
         )
 
     # Set all watches in this collection to have NULL collection_id
-    db.query(Watch).filter(Watch.collection_id == collection_id).update(
-        {"collection_id": None}
+    moved = (
+        db.query(Watch)
+        .filter(Watch.collection_id == collection_id)
+        .update({"collection_id": None})
     )
+    if moved:
+        bump_data_versions(db, current_user.id, "watches")
 
     # Delete the collection
     db.delete(collection)
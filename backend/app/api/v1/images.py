@@ -1,7 +1,15 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    UploadFile,
+    status,
+)
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -12,6 +20,7 @@ from app.models.watch import Watch
 from app.models.watch_image import ImageSourceEnum, WatchImage
 from app.schemas.watch_image import UpdateImageRequest, WatchImageResponse
 from app.utils.file_upload import delete_file, save_uploaded_file, validate_image_file
+from app.utils.image_cache import delete_print_image, get_print_image
 
 router = APIRouter()
 
@@ -52,6 +61,7 @@ def verify_watch_ownership(watch_id: UUID, current_user: User, db: Session) -> W
 )
 async def upload_image(
     watch_id: UUID,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -62,6 +72,7 @@ async def upload_image(
     - Validates file type and size
     - Saves file to storage
     - Creates database record
+    - Pre-renders the print rendition used by PDF exports
     - Returns image metadata with URL
     """
     # Verify watch ownership
@@ -118,6 +129,11 @@ async def upload_image(
     db.commit()
     db.refresh(watch_image)
 
+    # Render the PDF print rendition after the response is sent
+    background_tasks.add_task(
+        get_print_image, watch_image.file_path, settings.UPLOAD_DIR
+    )
+
     return watch_image
 
 
@@ -244,8 +260,9 @@ def delete_image(
     db.delete(image)
     db.commit()
 
-    # Delete physical file
+    # Delete physical file and its cached print rendition
     delete_file(file_path)
+    delete_print_image(file_path, settings.UPLOAD_DIR)
 
     # If this was the primary image, promote the next one
     if was_primary:
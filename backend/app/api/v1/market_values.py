@@ -3,11 +3,20 @@ from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import case, desc, func
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import case, desc, func, insert, select, update
 from sqlalchemy.orm import Session
 
-from app.core.deps import get_current_user, get_db
+from app.core.deps import get_current_user, get_data_versions, get_db
 from app.models.collection import Collection
 from app.models.market_value import MarketValue
 from app.models.reference import Brand
@@ -15,15 +24,24 @@ from app.models.user import User
 from app.models.watch import Watch
 from app.schemas.market_value import (
     CollectionAnalytics,
+    MarketValueBulkCreate,
+    MarketValueBulkResult,
     MarketValueCreate,
     MarketValueResponse,
     MarketValueUpdate,
     WatchAnalytics,
 )
+from app.utils.cache import entity_tag, user_tag
+from app.utils.conditional import not_modified, resource_etag
+from app.utils.data_version import DataVersions, bump_data_versions
+from app.utils.single_flight import shared_response
 
 router = APIRouter()
 collection_analytics_router = APIRouter()
 
+# Rows inserted per multi-row INSERT during bulk uploads
+BULK_INSERT_BATCH_SIZE = 1000
+
 
 @collection_analytics_router.get(
     "/collection-analytics", response_model=CollectionAnalytics
@@ -32,12 +50,28 @@ def get_collection_analytics(
     currency: str = Query("USD", description="Base currency for analytics"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    versions: DataVersions = Depends(get_data_versions),
 ):
     """
     Get analytics for the entire collection: total value, ROI, breakdowns by brand/collection.
     Optimized with SQL aggregation queries for performance.
     Note: This simplified version assumes all values are in the same currency.
+
+    Concurrent identical requests share one computation.
     """
+    return shared_response(
+        "collection_analytics",
+        versions.cache_key(f"collection-analytics:{currency}", "watches", "values"),
+        CollectionAnalytics,
+        lambda: _collection_analytics(db, current_user, currency),
+        tags=[user_tag(current_user.id)],
+    )
+
+
+def _collection_analytics(
+    db: Session, current_user: User, currency: str
+) -> CollectionAnalytics:
+    """Compute collection analytics with SQL aggregation"""
     # Total watches count
     total_watches = (
         db.query(func.count(Watch.id)).filter(Watch.user_id == current_user.id).scalar()
@@ -210,6 +244,96 @@ def verify_watch_ownership(watch_id: UUID, current_user: User, db: Session) -> W
     return watch
 
 
+def refresh_current_market_values(db: Session, watch_ids) -> int:
+    """
+    Set each watch's denormalized current value to its latest market value.
+
+    Runs as a single UPDATE ... FROM (SELECT DISTINCT ON ...) statement
+    regardless of how many watches are affected.
+
+    Returns:
+        Number of watches updated
+    """
+    latest = (
+        select(
+            MarketValue.watch_id,
+            MarketValue.value,
+            MarketValue.currency,
+            MarketValue.recorded_at,
+        )
+        .where(MarketValue.watch_id.in_(watch_ids))
+        .distinct(MarketValue.watch_id)
+        .order_by(MarketValue.watch_id, desc(MarketValue.recorded_at))
+        .subquery()
+    )
+
+    result = db.execute(
+        update(Watch)
+        .where(Watch.id == latest.c.watch_id)
+        .values(
+            current_market_value=latest.c.value,
+            current_market_currency=latest.c.currency,
+            last_value_update=latest.c.recorded_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+
+@router.post(
+    "/market-values/bulk",
+    response_model=MarketValueBulkResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def bulk_create_market_values(
+    bulk_data: MarketValueBulkCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Create many market value records, across any of the user's watches, at once.
+
+    Values are inserted in batches, then every affected watch's current market
+    value is refreshed in a single statement. All watches must belong to the
+    current user, otherwise nothing is created.
+    """
+    watch_ids = {item.watch_id for item in bulk_data.values}
+
+    owned_ids = set(
+        db.scalars(
+            select(Watch.id).where(
+                Watch.id.in_(watch_ids), Watch.user_id == current_user.id
+            )
+        )
+    )
+    if owned_ids != watch_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Watch not found"
+        )
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "watch_id": item.watch_id,
+            "value": item.value,
+            "currency": item.currency,
+            "source": item.source,
+            "notes": item.notes,
+            "recorded_at": item.recorded_at or now,
+        }
+        for item in bulk_data.values
+    ]
+
+    for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+        db.execute(insert(MarketValue), rows[start : start + BULK_INSERT_BATCH_SIZE])
+
+    watches_updated = refresh_current_market_values(db, watch_ids)
+    bump_data_versions(db, current_user.id, "values", "watches")
+    db.commit()
+
+    return MarketValueBulkResult(created=len(rows), watches_updated=watches_updated)
+
+
 @router.post(
     "/{watch_id}/market-values",
     response_model=MarketValueResponse,
@@ -259,6 +383,8 @@ def create_market_value(
 @router.get("/{watch_id}/market-values", response_model=List[MarketValueResponse])
 def list_market_values(
     watch_id: UUID,
+    request: Request,
+    response: Response,
     start_date: Optional[datetime] = Query(
         None, description="Filter values from this date"
     ),
@@ -266,16 +392,26 @@ def list_market_values(
         None, description="Filter values until this date"
     ),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records"),
+    if_none_match: Optional[str] = Header(default=None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    versions: DataVersions = Depends(get_data_versions),
 ):
     """
     List all market value records for a watch, ordered by date (most recent first).
     Optionally filter by date range.
+
+    Responses carry an ETag covering the user's market values; a matching
+    If-None-Match is answered with 304.
     """
     # Verify watch ownership
     watch = verify_watch_ownership(watch_id, current_user, db)
 
+    etag = resource_etag(request, "market-value-list", versions, ("values",), watch.id)
+    cached = not_modified(if_none_match, etag, response)
+    if cached:
+        return cached
+
     # Build query
     query = db.query(MarketValue).filter(MarketValue.watch_id == watch.id)
 
@@ -428,10 +564,24 @@ def get_watch_analytics(
     watch_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    versions: DataVersions = Depends(get_data_versions),
 ):
     """
     Get analytics for a specific watch: ROI, value changes, etc.
+
+    Concurrent identical requests share one computation.
     """
+    return shared_response(
+        "watch_analytics",
+        versions.cache_key(f"watch-analytics:{watch_id}", "watches", "values"),
+        WatchAnalytics,
+        lambda: _watch_analytics(db, current_user, watch_id),
+        tags=[user_tag(current_user.id), entity_tag("watch", watch_id)],
+    )
+
+
+def _watch_analytics(db: Session, current_user: User, watch_id: UUID) -> WatchAnalytics:
+    """Compute ROI and value changes for one of the user's watches"""
     # Verify watch ownership
     watch = verify_watch_ownership(watch_id, current_user, db)
 
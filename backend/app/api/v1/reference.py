@@ -1,40 +1,92 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.deps import get_current_admin
 from app.database import get_db
-from app.models.reference import Brand, Complication, MovementType
+from app.models.user import User
 from app.schemas.reference import (
     BrandResponse,
     ComplicationResponse,
     MovementTypeResponse,
+    ReferenceReloadResponse,
 )
+from app.utils.export_cache import etag_matches
+from app.utils.logging import log_security_event
+from app.utils.reference_data import get_reference_snapshot, reload_reference_snapshot
 
 router = APIRouter()
 
 
+def _reference_response(
+    name: str, if_none_match: Optional[str], db: Session
+) -> Response:
+    """Serve a reference list from the pre-serialized snapshot"""
+    snapshot = get_reference_snapshot(db)
+    etag = snapshot.etags[name]
+
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    return Response(
+        content=snapshot.payloads[name],
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
+
+
 @router.get("/brands", response_model=List[BrandResponse])
-def list_brands(db: Session = Depends(get_db)):
+def list_brands(
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+):
     """Get all watch brands ordered by sort_order"""
-    return db.query(Brand).order_by(Brand.sort_order, Brand.name).all()
+    return _reference_response("brands", if_none_match, db)
 
 
 @router.get("/movement-types", response_model=List[MovementTypeResponse])
-def list_movement_types(db: Session = Depends(get_db)):
+def list_movement_types(
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+):
     """Get all movement types ordered by sort_order"""
-    return (
-        db.query(MovementType)
-        .order_by(MovementType.sort_order, MovementType.name)
-        .all()
-    )
+    return _reference_response("movement-types", if_none_match, db)
 
 
 @router.get("/complications", response_model=List[ComplicationResponse])
-def list_complications(db: Session = Depends(get_db)):
+def list_complications(
+    if_none_match: Optional[str] = Header(default=None),
+    db: Session = Depends(get_db),
+):
     """Get all complications ordered by sort_order"""
-    return (
-        db.query(Complication)
-        .order_by(Complication.sort_order, Complication.name)
-        .all()
+    return _reference_response("complications", if_none_match, db)
+
+
+@router.post("/reload", response_model=ReferenceReloadResponse)
+def reload_reference_data(
+    current_admin: User = Depends(get_current_admin),
+    db: Session = Depends(get_db),
+):
+    """
+    Reload the reference data snapshot from the database (admin only).
+
+    Use after changing reference tables outside the API, e.g. by a migration.
+    Only the worker handling the request is refreshed; other workers pick up
+    changes on restart or when they next see an unknown id.
+    """
+    counts = reload_reference_snapshot(db).counts()
+
+    log_security_event(
+        "admin_reload_reference_data",
+        user_id=str(current_admin.id),
+        details=counts,
+    )
+
+    return ReferenceReloadResponse(
+        brands=counts["brands"],
+        movement_types=counts["movement-types"],
+        complications=counts["complications"],
     )
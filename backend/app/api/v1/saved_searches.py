@@ -1,17 +1,26 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session, joinedload
 
-from app.core.deps import get_current_user, get_db
+from app.core.deps import get_current_user, get_data_versions, get_db
+from app.database import use_primary
 from app.models.saved_search import SavedSearch
 from app.models.user import User
+from app.models.watch import Watch
 from app.schemas.saved_search import (
     SavedSearchCreate,
     SavedSearchResponse,
+    SavedSearchResults,
     SavedSearchUpdate,
 )
+from app.utils.data_version import DataVersions
+from app.utils.saved_search import (
+    invalidate_saved_search,
+    record_seen_matches,
+    run_saved_search,
+)
 
 router = APIRouter()
 
@@ -82,6 +91,70 @@ def get_saved_search(
     return saved_search
 
 
+@router.get("/{search_id}/results", response_model=SavedSearchResults)
+def get_saved_search_results(
+    search_id: UUID,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    current_user: User = Depends(get_current_user),
+    versions: DataVersions = Depends(get_data_versions),
+    db: Session = Depends(get_db),
+):
+    """
+    Run a saved search and return a page of matching watches.
+
+    The stored filters are compiled once per worker and the matching ids are
+    cached until the user's watches change. new_match_ids lists watches that
+    did not match the last time the search was run.
+    """
+    # Recording the seen matches writes, and the stored matches are read back
+    # for it, so this request runs on the primary
+    use_primary(db)
+
+    saved_search = (
+        db.query(SavedSearch)
+        .filter(SavedSearch.id == search_id, SavedSearch.user_id == current_user.id)
+        .first()
+    )
+
+    if not saved_search:
+        raise HTTPException(status_code=404, detail="Saved search not found")
+
+    try:
+        watch_ids, data_version = run_saved_search(db, saved_search, versions)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    seen_at = saved_search.seen_at
+    new_match_ids = record_seen_matches(db, saved_search, watch_ids)
+    db.commit()
+
+    # Load just the requested page, in result order
+    page_ids = watch_ids[offset : offset + limit]
+    watches = {
+        watch.id: watch
+        for watch in db.query(Watch)
+        .options(
+            joinedload(Watch.brand),
+            joinedload(Watch.collection),
+            joinedload(Watch.images),
+        )
+        .filter(Watch.id.in_(page_ids))
+        .all()
+    }
+
+    return dict(
+        search_id=saved_search.id,
+        items=[watches[watch_id] for watch_id in page_ids if watch_id in watches],
+        total=len(watch_ids),
+        limit=limit,
+        offset=offset,
+        new_match_ids=new_match_ids,
+        seen_at=seen_at,
+        data_version=data_version,
+    )
+
+
 @router.put("/{search_id}", response_model=SavedSearchResponse)
 def update_saved_search(
     search_id: UUID,
@@ -118,8 +191,12 @@ def update_saved_search(
     # Update fields
     if search_data.name is not None:
         saved_search.name = search_data.name
-    if search_data.filters is not None:
+    if search_data.filters is not None and search_data.filters != saved_search.filters:
         saved_search.filters = search_data.filters
+        # Matches of the old filters say nothing about what is new now
+        saved_search.seen_match_ids = None
+        saved_search.seen_at = None
+        invalidate_saved_search(saved_search.id)
 
     db.commit()
     db.refresh(saved_search)
@@ -145,5 +222,6 @@ def delete_saved_search(
 
     db.delete(saved_search)
     db.commit()
+    invalidate_saved_search(search_id)
 
     return None
@@ -1,27 +1,51 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.config import settings
 from app.core.deps import get_current_user, get_db
-from app.models.service_history import ServiceDocument, ServiceHistory
+from app.models.reference import Brand
+from app.models.service_history import (
+    ServiceDocument,
+    ServiceHistory,
+    WatchServiceRollup,
+)
 from app.models.user import User
 from app.models.watch import Watch
 from app.schemas.service_history import (
+    ServiceCostSummary,
     ServiceDocumentResponse,
     ServiceHistoryCreate,
+    ServiceHistoryListItem,
     ServiceHistoryResponse,
     ServiceHistoryUpdate,
+    UpcomingServiceResponse,
 )
 from app.utils.file_upload import (
     delete_file,
     save_service_document,
     validate_document_file,
 )
+from app.utils.service_rollup import refresh_service_rollups
 
 router = APIRouter()
+service_rollup_router = APIRouter()
+
+CENT = Decimal("0.01")
 
 
 def verify_watch_ownership(watch_id: UUID, current_user: User, db: Session) -> Watch:
@@ -116,34 +140,72 @@ def create_service_history(
     )
 
     db.add(service)
+    db.flush()
+    refresh_service_rollups(db, [watch.id])
     db.commit()
     db.refresh(service)
 
     return service
 
 
-@router.get("/{watch_id}/service-history", response_model=List[ServiceHistoryResponse])
+@router.get("/{watch_id}/service-history", response_model=List[ServiceHistoryListItem])
 def list_service_history(
     watch_id: UUID,
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
+    include_documents: bool = Query(
+        default=True, description="Include document details, not just counts"
+    ),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    List all service history records for a watch, ordered by date (most recent first).
+    List service history records for a watch, ordered by date (most recent first).
+
+    Each record carries its document count. Documents are loaded with a
+    second IN query for the page rather than joined, so records with many
+    documents don't multiply the result rows; pass include_documents=false to
+    skip them entirely. The total number of records is returned in the
+    X-Total-Count header.
     """
     # Verify watch ownership
     watch = verify_watch_ownership(watch_id, current_user, db)
 
-    # Query service history with eager loading of documents
-    services = (
-        db.query(ServiceHistory)
-        .options(joinedload(ServiceHistory.documents))
+    document_count = (
+        select(func.count(ServiceDocument.id))
+        .where(ServiceDocument.service_history_id == ServiceHistory.id)
+        .correlate(ServiceHistory)
+        .scalar_subquery()
+    )
+    query = db.query(ServiceHistory, document_count).filter(
+        ServiceHistory.watch_id == watch.id
+    )
+    if include_documents:
+        query = query.options(selectinload(ServiceHistory.documents))
+
+    total = (
+        db.query(func.count(ServiceHistory.id))
         .filter(ServiceHistory.watch_id == watch.id)
-        .order_by(ServiceHistory.service_date.desc())
+        .scalar()
+    )
+    rows = (
+        query.order_by(ServiceHistory.service_date.desc(), ServiceHistory.id)
+        .offset(offset)
+        .limit(limit)
         .all()
     )
 
-    return services
+    response.headers["X-Total-Count"] = str(total)
+    columns = ServiceHistory.__table__.columns.keys()
+    return [
+        {
+            **{column: getattr(service, column) for column in columns},
+            "document_count": count,
+            "documents": service.documents if include_documents else None,
+        }
+        for service, count in rows
+    ]
 
 
 @router.get(
@@ -182,6 +244,8 @@ def update_service_history(
     for field, value in update_data.items():
         setattr(service, field, value)
 
+    db.flush()
+    refresh_service_rollups(db, [watch_id])
     db.commit()
     db.refresh(service)
 
@@ -210,11 +274,96 @@ def delete_service_history(
 
     # Delete service record (cascade will remove documents from DB)
     db.delete(service)
+    db.flush()
+    refresh_service_rollups(db, [watch_id])
     db.commit()
 
     return None
 
 
+# Rollups across all of a user's watches
+
+
+@service_rollup_router.get(
+    "/service-history/upcoming", response_model=List[UpcomingServiceResponse]
+)
+def list_upcoming_services(
+    days: int = Query(90, ge=0, le=3650, description="Look-ahead window in days"),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    List watches whose next service is due within the given number of days,
+    soonest first. Overdue services are included.
+    Served from the per-watch rollups with a range scan on
+    (user_id, next_service_due).
+    """
+    now = datetime.utcnow()
+    rows = (
+        db.query(WatchServiceRollup, Watch.model, Brand.name)
+        .join(Watch, Watch.id == WatchServiceRollup.watch_id)
+        .join(Brand, Brand.id == Watch.brand_id)
+        .filter(
+            WatchServiceRollup.user_id == current_user.id,
+            WatchServiceRollup.next_service_due <= now + timedelta(days=days),
+        )
+        .order_by(WatchServiceRollup.next_service_due)
+        .limit(limit)
+        .all()
+    )
+
+    return [
+        UpcomingServiceResponse(
+            watch_id=rollup.watch_id,
+            brand_name=brand_name,
+            model=model,
+            service_count=rollup.service_count,
+            last_service_date=rollup.last_service_date,
+            next_service_due=rollup.next_service_due,
+            overdue=rollup.next_service_due < now,
+        )
+        for rollup, model, brand_name in rows
+    ]
+
+
+@service_rollup_router.get(
+    "/service-history/summary", response_model=ServiceCostSummary
+)
+def get_service_summary(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get total service spend per currency and the next due date across all of
+    the user's watches, from the per-watch rollups.
+    """
+    rollups = (
+        db.query(WatchServiceRollup)
+        .filter(
+            WatchServiceRollup.user_id == current_user.id,
+            WatchServiceRollup.service_count > 0,
+        )
+        .all()
+    )
+
+    # JSONB numbers come back as floats; costs have two decimal places
+    total_costs = {}
+    for rollup in rollups:
+        for currency, amount in rollup.total_costs.items():
+            amount = Decimal(str(amount)).quantize(CENT)
+            total_costs[currency] = total_costs.get(currency, 0) + amount
+
+    due_dates = [r.next_service_due for r in rollups if r.next_service_due]
+
+    return ServiceCostSummary(
+        watches_serviced=len(rollups),
+        service_count=sum(r.service_count for r in rollups),
+        total_costs=total_costs,
+        next_service_due=min(due_dates, default=None),
+    )
+
+
 # Document management endpoints
 
 
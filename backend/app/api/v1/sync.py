@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_current_user
+from app.database import get_db
+from app.models.user import User
+from app.schemas.sync import SyncResponse
+from app.utils.sync import (
+    DEFAULT_SYNC_LIMIT,
+    MAX_SYNC_LIMIT,
+    SYNC_TOKEN_PATTERN,
+    collect_changes,
+)
+
+router = APIRouter()
+
+
+@router.get("/sync", response_model=SyncResponse)
+def sync_changes(
+    since: str = Query(
+        "0",
+        pattern=SYNC_TOKEN_PATTERN,
+        description="Token returned by the previous sync",
+    ),
+    limit: int = Query(DEFAULT_SYNC_LIMIT, ge=1, le=MAX_SYNC_LIMIT),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Get watches, images, service records, market values and accuracy readings
+    created, updated or deleted since a change token.
+
+    Start with since=0 for a full snapshot, then pass back the returned token.
+    Changes of transactions still in progress are held back until every older
+    transaction has finished, so a token never skips a change.
+    Deleted rows are listed under `deleted`; a deleted watch implies all of its
+    child rows are gone too. While `has_more` is true, call again immediately
+    with the new token.
+    """
+    return collect_changes(db, current_user.id, since, limit)
@@ -2,14 +2,24 @@ from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_current_admin
-from app.core.security import get_password_hash
+from app.core.password_hashing import password_hasher
+from app.core.security import get_password_hash_async
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.schemas.user import UserAdminPasswordReset, UserAdminUpdate, UserResponse
+from app.schemas.user import (
+    PasswordHashingStats,
+    SingleFlightStats,
+    UserAdminPasswordReset,
+    UserAdminUpdate,
+    UserResponse,
+)
+from app.utils.cache import cache_invalidate_tags, user_tag
 from app.utils.logging import log_security_event
+from app.utils.single_flight import single_flight
 
 router = APIRouter()
 
@@ -30,6 +40,18 @@ def list_users(
     return users
 
 
+@router.get("/password-hashing", response_model=PasswordHashingStats)
+def get_password_hashing_stats(current_admin: User = Depends(get_current_admin)):
+    """Get password hashing queue depth and timing counters (admin only)"""
+    return password_hasher.stats()
+
+
+@router.get("/single-flight", response_model=SingleFlightStats)
+def get_single_flight_stats(current_admin: User = Depends(get_current_admin)):
+    """Get shared-computation hit and coalesce counters (admin only)"""
+    return single_flight.stats()
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user(
     user_id: UUID,
@@ -89,26 +111,30 @@ def update_user_role(
 
 
 @router.post("/{user_id}/reset-password", status_code=status.HTTP_204_NO_CONTENT)
-def reset_user_password(
+async def reset_user_password(
     user_id: UUID,
     password_data: UserAdminPasswordReset,
     db: Session = Depends(get_db),
     current_admin: User = Depends(get_current_admin),
 ):
     """Reset a user's password (admin only)"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await run_in_threadpool(db.get, User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
 
-    user.hashed_password = get_password_hash(password_data.new_password)
-    db.commit()
+    # Read before the commit expires the admin (same session), which would
+    # reload it with a blocking query on the event loop
+    admin_id = str(current_admin.id)
+
+    user.hashed_password = await get_password_hash_async(password_data.new_password)
+    await run_in_threadpool(db.commit)
 
     log_security_event(
         "admin_reset_user_password",
-        user_id=str(current_admin.id),
-        details={"target_user_id": str(user.id)},
+        user_id=admin_id,
+        details={"target_user_id": str(user_id)},
     )
 
     return None
@@ -141,5 +167,6 @@ def delete_user(
 
     db.delete(user)
     db.commit()
+    cache_invalidate_tags(user_tag(user_id))
 
     return None
@@ -1,34 +1,98 @@
-from typing import Optional
+import os
+import tempfile
+from typing import BinaryIO, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy import asc, desc, func, or_
-from sqlalchemy.orm import Session, joinedload
+from pydantic import ValidationError
+from sqlalchemy import (
+    String,
+    cast,
+    func,
+    insert,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session, joinedload, selectinload
 
-from app.core.deps import get_current_user
+from app.config import settings
+from app.core.deps import get_current_user, get_data_versions
 from app.database import get_db
 from app.models.collection import Collection
+from app.models.market_value import MarketValue
 from app.models.reference import Brand, MovementType
+from app.models.service_history import ServiceHistory
 from app.models.user import User
 from app.models.watch import ConditionEnum, Watch
 from app.models.watch_image import ImageSourceEnum, WatchImage
 from app.schemas.watch import (
     PaginatedWatchResponse,
     WatchCreate,
+    WatchExportInclude,
+    WatchImportError,
+    WatchImportResult,
     WatchListResponse,
     WatchResponse,
     WatchUpdate,
 )
+from app.schemas.watch_image import WatchImageResponse
+from app.utils.conditional import not_modified, resource_etag
+from app.utils.data_export import (
+    EXPORT_FORMATS,
+    WATCH_EXPORT_COLUMNS,
+    iter_csv,
+    iter_ndjson,
+    watch_to_export_dict,
+)
+from app.utils.data_version import DataVersions, bump_data_versions
+from app.utils.export_cache import etag_matches, export_cache, make_etag
 from app.utils.google_images import fetch_watch_images
-from app.utils.pdf_export import generate_collection_pdf, generate_watch_pdf
-from app.utils.qr_code import generate_watch_qr_code
+from app.utils.pdf_export import (
+    generate_collection_pdf,
+    generate_collection_pdf_stream,
+    generate_qr_label_sheet,
+    generate_watch_pdf,
+)
+from app.utils.pdf_parallel import (
+    generate_collection_pdf_parallel,
+    generate_watch_pdfs_zip,
+)
+from app.utils.qr_code import (
+    QR_FORMATS,
+    get_watch_qr_image,
+    watch_qr_etag,
+    watch_qr_url,
+)
+from app.utils.reference_data import get_reference_snapshot, reference_exists
+from app.utils.single_flight import single_flight
+from app.utils.watch_filters import compile_watch_filters, watch_order_by
+from app.utils.watch_import import (
+    IMPORT_FORMATS,
+    detect_import_format,
+    format_validation_errors,
+    iter_import_rows,
+    resolve_import_references,
+)
 
 router = APIRouter()
 
 
 @router.get("/", response_model=PaginatedWatchResponse)
 def list_watches(
+    request: Request,
+    response: Response,
     collection_id: Optional[UUID] = None,
     brand_id: Optional[UUID] = None,
     movement_type_id: Optional[UUID] = None,
@@ -46,10 +110,29 @@ def list_watches(
     sort_order: str = Query(default="desc", regex="^(asc|desc)$"),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
+    if_none_match: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_user),
+    versions: DataVersions = Depends(get_data_versions),
     db: Session = Depends(get_db),
 ):
-    """List watches with advanced filtering, search, sorting, and pagination"""
+    """
+    List watches with advanced filtering, search, sorting, and pagination.
+
+    Responses carry an ETag covering the user's watches, images and
+    collections and the brand names; a matching If-None-Match is answered
+    with 304 before the list is queried.
+    """
+    etag = resource_etag(
+        request,
+        "watch-list",
+        versions,
+        ("watches", "images", "collections"),
+        get_reference_snapshot(db).etag("brands"),
+    )
+    cached = not_modified(if_none_match, etag, response)
+    if cached:
+        return cached
+
     # Base query with relationships loaded
     query = (
         db.query(Watch)
@@ -61,81 +144,38 @@ def list_watches(
         .filter(Watch.user_id == current_user.id)
     )
 
-    # Apply filters
-    if collection_id:
-        query = query.filter(Watch.collection_id == collection_id)
-
-    if brand_id:
-        query = query.filter(Watch.brand_id == brand_id)
-
-    if movement_type_id:
-        query = query.filter(Watch.movement_type_id == movement_type_id)
-
-    if condition:
-        query = query.filter(Watch.condition == condition)
-
-    # Price range filters
-    if min_price is not None:
-        query = query.filter(Watch.purchase_price >= min_price)
-
-    if max_price is not None:
-        query = query.filter(Watch.purchase_price <= max_price)
-
-    # Market value range filters
-    if min_value is not None:
-        query = query.filter(Watch.current_market_value >= min_value)
-
-    if max_value is not None:
-        query = query.filter(Watch.current_market_value <= max_value)
-
-    # Date range filters
-    if purchase_date_from:
-        query = query.filter(Watch.purchase_date >= purchase_date_from)
-
-    if purchase_date_to:
-        query = query.filter(Watch.purchase_date <= purchase_date_to)
-
-    # Enhanced search with PostgreSQL full-text search for better performance
-    if search:
-        # Use full-text search for model field (indexed)
-        # Fall back to ILIKE for other fields (less common searches)
-        query = query.join(Brand).filter(
-            or_(
-                func.to_tsvector("english", Watch.model).op("@@")(
-                    func.plainto_tsquery("english", search)
-                ),
-                func.to_tsvector("english", Brand.name).op("@@")(
-                    func.plainto_tsquery("english", search)
-                ),
-                Watch.reference_number.ilike(f"%{search}%"),
-                Watch.serial_number.ilike(f"%{search}%"),
-                Watch.notes.ilike(f"%{search}%"),
-            )
+    try:
+        criteria = compile_watch_filters(
+            {
+                "collection_id": collection_id,
+                "brand_id": brand_id,
+                "movement_type_id": movement_type_id,
+                "condition": condition,
+                "search": search,
+                "min_price": min_price,
+                "max_price": max_price,
+                "min_value": min_value,
+                "max_value": max_value,
+                "purchase_date_from": purchase_date_from,
+                "purchase_date_to": purchase_date_to,
+            }
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    query = query.filter(*criteria)
 
     # Get total count before pagination
     total = query.count()
 
     # Apply sorting
-    sort_column = getattr(Watch, sort_by)
-    if sort_order == "desc":
-        query = query.order_by(desc(sort_column))
-    else:
-        query = query.order_by(asc(sort_column))
+    query = query.order_by(*watch_order_by(sort_by, sort_order))
 
     # Apply pagination
     watches = query.offset(offset).limit(limit).all()
 
-    # Convert to list response format with primary image
-    items = []
-    for watch in watches:
-        watch_dict = WatchListResponse.model_validate(watch).model_dump()
-        # Find and attach primary image
-        primary_image = next((img for img in watch.images if img.is_primary), None)
-        watch_dict["primary_image"] = primary_image
-        items.append(WatchListResponse(**watch_dict))
-
-    return PaginatedWatchResponse(items=items, total=total, limit=limit, offset=offset)
+    # Validated from the ORM objects and dumped to JSON in a single pass by
+    # the response model (primary_image comes from Watch.primary_image)
+    return {"items": watches, "total": total, "limit": limit, "offset": offset}
 
 
 @router.post("/", response_model=WatchResponse, status_code=status.HTTP_201_CREATED)
@@ -146,20 +186,14 @@ def create_watch(
 ):
     """Create a new watch"""
     # Verify brand exists
-    brand = db.query(Brand).filter(Brand.id == watch_data.brand_id).first()
-    if not brand:
+    if not reference_exists(db, "brands", watch_data.brand_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Brand not found"
         )
 
     # Verify movement type exists if provided
     if watch_data.movement_type_id:
-        movement_type = (
-            db.query(MovementType)
-            .filter(MovementType.id == watch_data.movement_type_id)
-            .first()
-        )
-        if not movement_type:
+        if not reference_exists(db, "movement-types", watch_data.movement_type_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Movement type not found"
             )
@@ -190,13 +224,209 @@ def create_watch(
     return WatchResponse.model_validate(new_watch)
 
 
+# Rows inserted per multi-row INSERT during bulk imports
+IMPORT_BATCH_SIZE = 500
+
+
+def _import_watch_rows(
+    db: Session, user_id: UUID, file: BinaryIO, fmt: str
+) -> WatchImportResult:
+    """Validate import rows and insert the valid ones in batches"""
+    lookups = {
+        "brand": {name.casefold(): id for id, name in db.query(Brand.id, Brand.name)},
+        "movement_type": {
+            name.casefold(): id
+            for id, name in db.query(MovementType.id, MovementType.name)
+        },
+        "collection": {
+            name.casefold(): id
+            for id, name in db.query(Collection.id, Collection.name).filter(
+                Collection.user_id == user_id
+            )
+        },
+    }
+    known_ids = {column: set(ids.values()) for column, ids in lookups.items()}
+
+    errors = []
+    batch = []
+    imported = 0
+
+    for row_number, row in iter_import_rows(file, fmt):
+        if isinstance(row, ValueError):
+            errors.append(WatchImportError(row=row_number, errors=[str(row)]))
+            continue
+
+        row_errors = resolve_import_references(row, lookups, known_ids)
+        if row_errors:
+            errors.append(WatchImportError(row=row_number, errors=row_errors))
+            continue
+
+        try:
+            watch_data = WatchCreate.model_validate(row)
+        except ValidationError as e:
+            errors.append(
+                WatchImportError(row=row_number, errors=format_validation_errors(e))
+            )
+            continue
+
+        batch.append({"user_id": user_id, **watch_data.model_dump()})
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            db.execute(insert(Watch), batch)
+            imported += len(batch)
+            batch = []
+
+    if batch:
+        db.execute(insert(Watch), batch)
+        imported += len(batch)
+
+    if imported:
+        bump_data_versions(db, user_id, "watches")
+    db.commit()
+
+    return WatchImportResult(imported=imported, failed=len(errors), errors=errors)
+
+
+@router.post("/import", response_model=WatchImportResult)
+async def import_watches(
+    request: Request,
+    fmt: Optional[str] = Query(
+        default=None,
+        alias="format",
+        pattern="^(csv|ndjson)$",
+        description="Body format; defaults to the request Content-Type",
+    ),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Import many watches from a CSV (with a header row) or JSON-lines body.
+
+    Columns match the watch create fields. Brand, movement type and collection
+    may be given by name (brand, movement_type, collection) instead of id, and
+    CSV complications are separated by ";" or "|". Valid rows are inserted in
+    batches; rows that fail validation are skipped and reported by row number.
+    """
+    fmt = fmt or detect_import_format(request.headers.get("content-type"))
+    if fmt not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or pass format",
+        )
+
+    # Spool the body so large imports are parsed without holding it in memory
+    with tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as body:
+        size = 0
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > settings.MAX_UPLOAD_SIZE:
+                max_size_mb = settings.MAX_UPLOAD_SIZE / (1024 * 1024)
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Import exceeds maximum allowed size of {max_size_mb}MB",
+                )
+            body.write(chunk)
+        body.seek(0)
+
+        try:
+            return await run_in_threadpool(
+                _import_watch_rows, db, current_user.id, body, fmt
+            )
+        except ValueError as e:
+            db.rollback()
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+# Watches loaded per server-side cursor fetch during data exports
+DATA_EXPORT_BATCH_SIZE = 500
+
+
+@router.get("/export")
+def export_watches_data(
+    fmt: str = Query(
+        default="csv",
+        alias="format",
+        pattern="^(csv|ndjson)$",
+        description="Output format: csv or ndjson (JSON lines)",
+    ),
+    collection_id: Optional[UUID] = None,
+    include: List[WatchExportInclude] = Query(
+        default=[], description="History to include with each watch"
+    ),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Export all user watches (or watches in a specific collection) as CSV or
+    JSON lines, optionally with their market value, service and accuracy history.
+
+    Rows are streamed from a server-side cursor, so memory use does not grow
+    with the size of the collection. CSV output uses the bulk import columns,
+    with any history written as JSON in its own column.
+    """
+    include = [item.value for item in dict.fromkeys(include)]
+
+    query = (
+        db.query(Watch)
+        .options(
+            joinedload(Watch.brand),
+            joinedload(Watch.collection),
+            joinedload(Watch.movement_type),
+            *(selectinload(getattr(Watch, name)) for name in include),
+        )
+        .filter(Watch.user_id == current_user.id)
+    )
+    if collection_id:
+        query = query.filter(Watch.collection_id == collection_id)
+
+    watches = query.order_by(Watch.created_at, Watch.id).yield_per(
+        DATA_EXPORT_BATCH_SIZE
+    )
+    records = (watch_to_export_dict(watch, include) for watch in watches)
+
+    if fmt == "csv":
+        content = iter_csv(records, WATCH_EXPORT_COLUMNS + include)
+    else:
+        content = iter_ndjson(records)
+
+    return StreamingResponse(
+        content,
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="watches.{fmt}"'},
+    )
+
+
 @router.get("/{watch_id}", response_model=WatchResponse)
 def get_watch(
     watch_id: UUID,
+    request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_user),
+    versions: DataVersions = Depends(get_data_versions),
     db: Session = Depends(get_db),
 ):
-    """Get a specific watch with all details"""
+    """
+    Get a specific watch with all details.
+
+    Responses carry an ETag covering the user's watches, images and
+    collections and the brand and movement type names; a matching
+    If-None-Match is answered with 304 before the watch is loaded.
+    """
+    etag = resource_etag(
+        request,
+        "watch",
+        versions,
+        ("watches", "images", "collections"),
+        watch_id,
+        get_reference_snapshot(db).etag("brands", "movement-types"),
+    )
+    cached = not_modified(if_none_match, etag, response)
+    # The ETag alone does not show the watch exists (e.g. "If-None-Match: *")
+    if cached and db.scalar(
+        select(Watch.id).where(Watch.id == watch_id, Watch.user_id == current_user.id)
+    ):
+        return cached
+
     watch = (
         db.query(Watch)
         .options(
@@ -238,20 +468,14 @@ def update_watch(
 
     # Verify brand exists if being updated
     if watch_data.brand_id:
-        brand = db.query(Brand).filter(Brand.id == watch_data.brand_id).first()
-        if not brand:
+        if not reference_exists(db, "brands", watch_data.brand_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Brand not found"
             )
 
     # Verify movement type exists if being updated
     if watch_data.movement_type_id:
-        movement_type = (
-            db.query(MovementType)
-            .filter(MovementType.id == watch_data.movement_type_id)
-            .first()
-        )
-        if not movement_type:
+        if not reference_exists(db, "movement-types", watch_data.movement_type_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Movement type not found"
             )
@@ -309,6 +533,10 @@ def delete_watch(
     return None
 
 
+# QR codes never change for a given watch/base URL/size/format
+QR_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
 @router.get("/{watch_id}/qr-code")
 def get_watch_qr_code(
     watch_id: UUID,
@@ -316,16 +544,27 @@ def get_watch_qr_code(
         default="http://localhost:8080",
         description="Base URL for the watch detail page",
     ),
+    size: int = Query(default=10, ge=1, le=40, description="Pixels per QR module"),
+    fmt: str = Query(
+        default="png",
+        alias="format",
+        pattern="^(png|svg)$",
+        description="Image format: png (raster) or svg (vector)",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Generate a QR code for a watch that links to its detail page.
-    Returns a PNG image that can be downloaded, printed, or displayed.
+    Returns a PNG (or, with format=svg, a resolution-independent SVG) image
+    that can be downloaded, printed, or displayed.
+
+    Rendered images are cached and served with long-lived cache headers.
     """
     # Verify watch exists and belongs to current user
     watch = (
-        db.query(Watch)
+        db.query(Watch.id)
         .filter(Watch.id == watch_id, Watch.user_id == current_user.id)
         .first()
     )
@@ -335,37 +574,142 @@ def get_watch_qr_code(
             status_code=status.HTTP_404_NOT_FOUND, detail="Watch not found"
         )
 
-    # Generate QR code
-    qr_buffer = generate_watch_qr_code(str(watch_id), base_url)
+    etag = watch_qr_etag(str(watch_id), base_url, size, fmt)
+    headers = {"ETag": etag, "Cache-Control": QR_CACHE_CONTROL}
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    headers["Content-Disposition"] = f'inline; filename="watch-{watch_id}-qr.{fmt}"'
+    return Response(
+        content=get_watch_qr_image(str(watch_id), base_url, size, fmt),
+        media_type=QR_FORMATS[fmt],
+        headers=headers,
+    )
+
+
+# Bump when the PDF layout changes so cached exports are re-rendered
+PDF_EXPORT_VERSION = 2
+
+# Number of watches loaded per round trip when streaming exports
+EXPORT_BATCH_SIZE = 100
+
+# Bytes read per chunk when serving cached export files
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _export_fingerprint(db: Session, *criteria) -> str:
+    """
+    Summarize everything a PDF export of the matching watches depends on.
+
+    Combines counts and latest change timestamps of the watches and their
+    images, service history and market values (plus the primary image ids)
+    in a single round trip, and the brand and movement type names embedded
+    in the rendered PDF.
+    """
+
+    def child_summary(model, timestamp_column):
+        return (
+            select(func.concat(func.count(model.id), ":", func.max(timestamp_column)))
+            .join(Watch, Watch.id == model.watch_id)
+            .where(*criteria)
+            .scalar_subquery()
+        )
+
+    primary_images = (
+        select(
+            func.string_agg(
+                cast(WatchImage.id, String),
+                aggregate_order_by(literal_column("','"), WatchImage.id),
+            )
+        )
+        .join(Watch, Watch.id == WatchImage.watch_id)
+        .where(*criteria, WatchImage.is_primary.is_(True))
+        .scalar_subquery()
+    )
+
+    watches = (
+        select(func.concat(func.count(Watch.id), ":", func.max(Watch.updated_at)))
+        .where(*criteria)
+        .scalar_subquery()
+    )
+
+    row = db.execute(
+        select(
+            watches,
+            child_summary(WatchImage, WatchImage.created_at),
+            primary_images,
+            child_summary(ServiceHistory, ServiceHistory.updated_at),
+            child_summary(MarketValue, MarketValue.recorded_at),
+        )
+    ).one()
+    reference = get_reference_snapshot(db).etag("brands", "movement-types")
+
+    return "|".join(str(part) for part in (*row, reference))
+
+
+def _watch_pdf_filename(watch: Watch) -> str:
+    """Build a safe PDF filename for a single watch"""
+    brand_name = watch.brand.name if watch.brand else "Unknown"
+    model = watch.model.replace("/", "-").replace(" ", "_")
+    return f"{brand_name}_{model}.pdf".replace(" ", "_")
+
+
+def _open_export(endpoint: str, etag: str, render) -> BinaryIO:
+    """
+    Open the cached export for an ETag, rendering it if needed.
+
+    The file is opened here so another worker evicting the entry cannot
+    pull it out from under the response; an entry evicted between lookup
+    and open is rendered again.
+    """
+    path = single_flight.run(endpoint, etag, render, lambda: export_cache.get(etag))
+    try:
+        return open(path, "rb")
+    except FileNotFoundError:
+        return open(render(), "rb")
+
+
+def _cached_export_response(
+    file: BinaryIO, etag: str, filename: str, media_type: str = "application/pdf"
+) -> StreamingResponse:
+    """Serve an open cached export with its validator"""
+    size = os.fstat(file.fileno()).st_size
+
+    def chunks():
+        with file:
+            while chunk := file.read(EXPORT_CHUNK_SIZE):
+                yield chunk
 
-    # Return as streaming response
     return StreamingResponse(
-        qr_buffer,
-        media_type="image/png",
-        headers={"Content-Disposition": f'inline; filename="watch-{watch_id}-qr.png"'},
+        chunks(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",
+        },
     )
 
 
 @router.get("/{watch_id}/export/pdf")
 def export_watch_pdf(
     watch_id: UUID,
+    if_none_match: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Export a single watch as a PDF document.
     Includes all watch details, images, service history, and analytics.
+
+    Rendered PDFs are cached by content fingerprint; repeat downloads are
+    served from the cache, or answered with 304 when If-None-Match matches.
     """
-    # Load watch with all relationships
     watch = (
         db.query(Watch)
-        .options(
-            joinedload(Watch.brand),
-            joinedload(Watch.movement_type),
-            joinedload(Watch.collection),
-            joinedload(Watch.images),
-            joinedload(Watch.service_history),
-        )
+        .options(joinedload(Watch.brand))
         .filter(Watch.id == watch_id, Watch.user_id == current_user.id)
         .first()
     )
@@ -375,61 +719,90 @@ def export_watch_pdf(
             status_code=status.HTTP_404_NOT_FOUND, detail="Watch not found"
         )
 
-    # Convert to dict for PDF generation
-    from app.schemas.watch import WatchResponse
+    # Safe filename
+    filename = _watch_pdf_filename(watch)
+
+    fingerprint = _export_fingerprint(
+        db, Watch.id == watch_id, Watch.user_id == current_user.id
+    )
+    etag = make_etag("watch-pdf", PDF_EXPORT_VERSION, watch_id, fingerprint)
+
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    def render():
+        # Load watch with all relationships
+        watch = (
+            db.query(Watch)
+            .options(
+                joinedload(Watch.brand),
+                joinedload(Watch.movement_type),
+                joinedload(Watch.collection),
+                joinedload(Watch.images),
+                joinedload(Watch.service_history),
+            )
+            .filter(Watch.id == watch_id, Watch.user_id == current_user.id)
+            .populate_existing()
+            .first()
+        )
 
-    watch_data = WatchResponse.model_validate(watch).model_dump()
+        # Convert to dict for PDF generation
+        watch_data = WatchResponse.model_validate(watch).model_dump()
 
-    # Generate PDF
-    pdf_buffer = generate_watch_pdf(watch_data)
+        # Generate PDF
+        pdf_buffer = generate_watch_pdf(watch_data)
 
-    # Safe filename
-    brand_name = watch.brand.name if watch.brand else "Unknown"
-    model = watch.model.replace("/", "-").replace(" ", "_")
-    filename = f"{brand_name}_{model}.pdf".replace(" ", "_")
+        return export_cache.put(etag, pdf_buffer)
 
-    return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    # Concurrent downloads of the same version share one render
+    return _cached_export_response(
+        _open_export("watch_pdf", etag, render), etag, filename
     )
 
 
+def _watch_export_dict(watch: Watch) -> dict:
+    """Serialize a watch for collection exports, including its primary image"""
+    watch_dict = WatchListResponse.model_validate(watch).model_dump()
+    primary_image = next((img for img in watch.images if img.is_primary), None)
+    if primary_image is None and watch.images:
+        primary_image = watch.images[0]
+    if primary_image is not None:
+        watch_dict["primary_image"] = WatchImageResponse.model_validate(
+            primary_image
+        ).model_dump()
+    return watch_dict
+
+
 @router.get("/export/pdf")
 def export_all_watches_pdf(
     collection_id: Optional[UUID] = None,
+    stream: bool = Query(
+        default=False,
+        description="Page through watches and spool the PDF to disk (for large collections)",
+    ),
+    parallel: bool = Query(
+        default=False,
+        description="Render chunks of watches across worker processes and merge them",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     Export all user watches (or watches in a specific collection) as a PDF document.
+
+    Rendered PDFs are cached by content fingerprint; repeat downloads are
+    served from the cache, or answered with 304 when If-None-Match matches.
     """
-    # Build query
-    query = (
-        db.query(Watch)
-        .options(
-            joinedload(Watch.brand),
-            joinedload(Watch.collection),
-            joinedload(Watch.images),
-        )
-        .filter(Watch.user_id == current_user.id)
-    )
+    criteria = [Watch.user_id == current_user.id]
 
     # Filter by collection if specified
     if collection_id:
-        query = query.filter(Watch.collection_id == collection_id)
+        criteria.append(Watch.collection_id == collection_id)
 
-    watches = query.order_by(Watch.brand_id, Watch.model).all()
-
-    if not watches:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="No watches found"
-        )
-
-    # Convert to list of dicts
-    from app.schemas.watch import WatchListResponse
-
-    watches_data = [WatchListResponse.model_validate(w).model_dump() for w in watches]
+    query = db.query(Watch).filter(*criteria)
 
     # Determine collection name
     if collection_id:
@@ -444,16 +817,224 @@ def export_all_watches_pdf(
     else:
         collection_name = "My Watch Collection"
 
-    # Generate PDF
-    pdf_buffer = generate_collection_pdf(watches_data, collection_name)
-
     # Safe filename
     filename = f"{collection_name.replace(' ', '_')}.pdf"
 
-    return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    fingerprint = _export_fingerprint(db, *criteria)
+    if fingerprint.startswith("0:"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No watches found"
+        )
+
+    # The modes lay out the same content but produce different bytes, so
+    # each gets its own validator and cache entry
+    mode = "stream" if stream else "parallel" if parallel else "default"
+    etag = make_etag(
+        "collection-pdf",
+        PDF_EXPORT_VERSION,
+        current_user.id,
+        collection_id,
+        collection_name,
+        mode,
+        fingerprint,
+    )
+
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    def render():
+        if stream:
+            # Totals come from SQL so watches only need to be visited once
+            total_watches, total_purchase, total_current = query.with_entities(
+                func.count(Watch.id),
+                func.sum(Watch.purchase_price),
+                func.sum(Watch.current_market_value),
+            ).one()
+
+            watches = (
+                query.options(
+                    joinedload(Watch.brand),
+                    joinedload(Watch.collection),
+                    selectinload(Watch.images),
+                )
+                .order_by(Watch.brand_id, Watch.model)
+                .yield_per(EXPORT_BATCH_SIZE)
+            )
+
+            pdf_file = generate_collection_pdf_stream(
+                (_watch_export_dict(w) for w in watches),
+                collection_name,
+                total_watches=total_watches,
+                total_purchase=float(total_purchase or 0),
+                total_current=float(total_current or 0),
+            )
+
+            with pdf_file:
+                return export_cache.put(etag, pdf_file)
+
+        watches = (
+            query.options(
+                joinedload(Watch.brand),
+                joinedload(Watch.collection),
+                joinedload(Watch.images),
+            )
+            .order_by(Watch.brand_id, Watch.model)
+            .all()
+        )
+
+        # Convert to list of dicts
+        watches_data = [_watch_export_dict(w) for w in watches]
+
+        # Generate PDF
+        if parallel:
+            with generate_collection_pdf_parallel(
+                watches_data, collection_name
+            ) as pdf_file:
+                return export_cache.put(etag, pdf_file)
+
+        pdf_buffer = generate_collection_pdf(watches_data, collection_name)
+
+        return export_cache.put(etag, pdf_buffer)
+
+    # Concurrent downloads of the same version share one render
+    return _cached_export_response(
+        _open_export("collection_pdf", etag, render), etag, filename
+    )
+
+
+@router.get("/export/zip")
+def export_watches_pdf_zip(
+    collection_id: Optional[UUID] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Export one PDF per watch (optionally limited to a collection) as a ZIP archive.
+
+    Watch PDFs are rendered in parallel across worker processes. Archives are
+    cached by content fingerprint like the other PDF exports.
+    """
+    criteria = [Watch.user_id == current_user.id]
+    if collection_id:
+        criteria.append(Watch.collection_id == collection_id)
+
+    fingerprint = _export_fingerprint(db, *criteria)
+    if fingerprint.startswith("0:"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No watches found"
+        )
+
+    etag = make_etag(
+        "watch-pdf-zip",
+        PDF_EXPORT_VERSION,
+        current_user.id,
+        collection_id,
+        fingerprint,
+    )
+
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    def render():
+        watches = (
+            db.query(Watch)
+            .options(
+                joinedload(Watch.brand),
+                joinedload(Watch.movement_type),
+                joinedload(Watch.collection),
+                selectinload(Watch.images),
+                selectinload(Watch.service_history),
+            )
+            .filter(*criteria)
+            .order_by(Watch.brand_id, Watch.model)
+            .all()
+        )
+
+        items = [
+            (
+                _watch_pdf_filename(watch),
+                WatchResponse.model_validate(watch).model_dump(),
+            )
+            for watch in watches
+        ]
+
+        with generate_watch_pdfs_zip(items) as zip_file:
+            return export_cache.put(etag, zip_file)
+
+    # Concurrent downloads of the same version share one render
+    return _cached_export_response(
+        _open_export("watch_pdf_zip", etag, render),
+        etag,
+        "watch_pdfs.zip",
+        media_type="application/zip",
+    )
+
+
+@router.get("/export/qr-labels")
+def export_qr_labels(
+    collection_id: Optional[UUID] = None,
+    base_url: str = Query(
+        default="http://localhost:8080",
+        description="Base URL for the watch detail pages",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Export a printable PDF sheet of QR code labels for all user watches
+    (or the watches in a specific collection).
+    """
+    criteria = [Watch.user_id == current_user.id]
+    if collection_id:
+        criteria.append(Watch.collection_id == collection_id)
+
+    watches = (
+        db.query(Watch.id, Watch.model, Watch.reference_number, Watch.updated_at)
+        .add_columns(Brand.name.label("brand_name"))
+        .outerjoin(Brand, Brand.id == Watch.brand_id)
+        .filter(*criteria)
+        .order_by(Watch.brand_id, Watch.model)
+        .all()
+    )
+
+    if not watches:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="No watches found"
+        )
+
+    etag = make_etag(
+        "qr-labels",
+        PDF_EXPORT_VERSION,
+        current_user.id,
+        base_url,
+        get_reference_snapshot(db).etag("brands"),
+        *((w.id, w.updated_at) for w in watches),
+    )
+
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    def render():
+        labels = [
+            {
+                "qr_data": watch_qr_url(str(w.id), base_url),
+                "title": f"{w.brand_name or 'Unknown'} {w.model}",
+                "subtitle": w.reference_number,
+            }
+            for w in watches
+        ]
+        return export_cache.put(etag, generate_qr_label_sheet(labels))
+
+    return _cached_export_response(
+        _open_export("qr_labels", etag, render), etag, "watch_qr_labels.pdf"
     )
 
 
@@ -11,12 +11,24 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str
 
+    # Read replicas (comma-separated SQLAlchemy URLs, empty = primary only)
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_MAX_LAG_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL: float = 2.0
+    REPLICA_STICKY_PRIMARY_SECONDS: int = 10
+
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
 
+    # Password hashing (0 workers = half the CPU cores); hashes made with a
+    # different cost are upgraded on the next successful login
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 0
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
     # CORS
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost"
 
@@ -24,6 +36,33 @@ class Settings(BaseSettings):
     UPLOAD_DIR: str = "/app/storage/uploads"
     BACKUP_DIR: str = "/app/storage/backups"
     MAX_UPLOAD_SIZE: int = 20971520  # 20MB
+    EXPORT_CACHE_DIR: str = "/app/storage/cache/exports"
+    EXPORT_CACHE_MAX_BYTES: int = 536870912  # 512MB
+    QR_CACHE_DIR: str = "/app/storage/cache/qr"
+    QR_CACHE_MAX_BYTES: int = 67108864  # 64MB
+    QR_MEMORY_CACHE_SIZE: int = 1024
+
+    # PDF rendering (0 = one worker process per CPU core)
+    PDF_RENDER_WORKERS: int = 0
+
+    # Redis cache; each worker also keeps recent entries in memory for up to
+    # CACHE_LOCAL_TTL_SECONDS, invalidated across workers over pub/sub
+    REDIS_HOST: str = "redis"
+    REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_PASSWORD: str = ""
+    CACHE_LOCAL_MAX_ENTRIES: int = 2048
+    CACHE_LOCAL_TTL_SECONDS: float = 10.0
+    CACHE_RECONNECT_SECONDS: float = 5.0
+
+    # Concurrent identical analytics/export requests share one computation;
+    # with the Redis lock enabled this also holds across workers
+    SINGLE_FLIGHT_REDIS_LOCK: bool = True
+    SINGLE_FLIGHT_TIMEOUT_SECONDS: float = 60.0
+    SINGLE_FLIGHT_RESULT_SECONDS: int = 10
+
+    # Prometheus metrics at /metrics (scrape each worker directly)
+    METRICS_ENABLED: bool = True
 
     @property
     def database_url(self) -> str:
@@ -32,6 +71,12 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def replica_urls_list(self) -> List[str]:
+        return [
+            url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()
+        ]
+
     @property
     def allowed_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
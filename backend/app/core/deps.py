@@ -5,8 +5,9 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.orm import Session
 
 from app.core.security import decode_token
-from app.database import get_db
+from app.database import get_db, route_session_for_user
 from app.models.user import User, UserRole
+from app.utils.data_version import DataVersions, load_data_versions
 
 security = HTTPBearer()
 
@@ -41,6 +42,9 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Keep this user's reads on the primary right after their own writes
+    route_session_for_user(db, user_id)
+
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise HTTPException(
@@ -75,3 +79,10 @@ def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
             status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required"
         )
     return current_user
+
+
+def get_data_versions(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+) -> DataVersions:
+    """Dependency to get the current user's data versions for cache keys"""
+    return load_data_versions(db, current_user.id)
@@ -0,0 +1,162 @@
+"""
+Dedicated, bounded executor for bcrypt hashing and verification
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from app.config import settings
+from app.utils.metrics import Counter, Gauge, registry
+
+T = TypeVar("T")
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the password hashing queue is full"""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on its own small thread pool so a burst of logins cannot
+    occupy the threadpool shared by every other sync handler.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism.
+    Jobs beyond ``workers + max_queue`` outstanding are rejected immediately
+    with PasswordHashingBusy instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._wait_seconds = 0.0
+        self._work_seconds = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    def submit(self, fn: Callable[..., T], *args) -> "Future[T]":
+        """
+        Queue a hashing job.
+
+        Args:
+            fn: Function to run (e.g. bcrypt.checkpw wrapper)
+            *args: Arguments for fn
+
+        Returns:
+            Future resolving to fn's result
+
+        Raises:
+            PasswordHashingBusy: If the queue is full
+        """
+        with self._lock:
+            if self._pending >= self.workers + self.max_queue:
+                self._rejected += 1
+                raise PasswordHashingBusy()
+            self._pending += 1
+            executor = self._get_executor()
+
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self._running += 1
+                self._wait_seconds += started - submitted
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._work_seconds += time.perf_counter() - started
+
+        def done(future: Future) -> None:
+            with self._lock:
+                self._pending -= 1
+                if future.cancelled() or future.exception() is not None:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+        future = executor.submit(job)
+        future.add_done_callback(done)
+        return future
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """Run a hashing job and wait for it without blocking the event loop"""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def stats(self) -> dict:
+        """Get a snapshot of queue depth and timing counters"""
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "avg_wait_ms": (
+                    self._wait_seconds / finished * 1000 if finished else 0.0
+                ),
+                "avg_work_ms": (
+                    self._work_seconds / finished * 1000 if finished else 0.0
+                ),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads if they were started"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS or max(1, (os.cpu_count() or 2) // 2),
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+def _hashing_jobs() -> dict:
+    stats = password_hasher.stats()
+    return {(result,): stats[result] for result in ("completed", "failed", "rejected")}
+
+
+def _hashing_queue() -> dict:
+    stats = password_hasher.stats()
+    return {("running",): stats["running"], ("queued",): stats["queued"]}
+
+
+registry.register(
+    Counter(
+        "password_hash_jobs_total",
+        "Password hashing jobs by result",
+        ["result"],
+        collect=_hashing_jobs,
+    )
+)
+registry.register(
+    Gauge(
+        "password_hash_jobs",
+        "Password hashing jobs running or waiting for a worker",
+        ["state"],
+        collect=_hashing_queue,
+    )
+)
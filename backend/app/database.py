@@ -1,25 +1,312 @@
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from fastapi import Request
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from app.config import settings
+from app.utils.cache import cache_flag_exists, cache_flag_set
+from app.utils.metrics import DB_POOL_CHECKOUT_WAIT, Gauge, record_query, registry
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool recording how long each checkout waits for a connection"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(
+                time.perf_counter() - start, self.logging_name or "primary"
+            )
+
+
+# Engines reported in the pool metrics, by name -> (engine, capacity)
+instrumented_engines: Dict[str, tuple] = {}
+
+
+def instrument_engine(engine: Engine, name: str, capacity: int) -> None:
+    """
+    Count queries and their duration for an engine.
+
+    Queries are attributed to the current request (see MetricsMiddleware),
+    so per-request query counts expose N+1 patterns.
+
+    Args:
+        engine: Engine to instrument
+        name: Engine label in the metrics, e.g. "primary"
+        capacity: pool_size + max_overflow, for the saturation gauge
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if context is not None:
+            context._metrics_start = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        start = getattr(context, "_metrics_start", None)
+        if start is not None:
+            record_query(name, time.perf_counter() - start)
+
+    instrumented_engines[name] = (engine, capacity)
+
+
+def _pool_connections() -> dict:
+    values = {}
+    for name, (engine, _) in instrumented_engines.items():
+        pool = engine.pool
+        values[(name, "checked_out")] = pool.checkedout()
+        values[(name, "idle")] = pool.checkedin()
+        values[(name, "overflow")] = max(pool.overflow(), 0)
+    return values
+
+
+def _pool_saturation() -> dict:
+    return {
+        (name,): engine.pool.checkedout() / capacity
+        for name, (engine, capacity) in instrumented_engines.items()
+        if capacity and isinstance(engine.pool, QueuePool)
+    }
+
+
+registry.register(
+    Gauge(
+        "db_pool_connections",
+        "Pooled database connections by state",
+        ["engine", "state"],
+        collect=_pool_connections,
+    )
+)
+registry.register(
+    Gauge(
+        "db_pool_saturation",
+        "Checked out connections as a fraction of pool_size + max_overflow",
+        ["engine"],
+        collect=_pool_saturation,
+    )
+)
+
+POOL_SIZE = 20  # Maximum pool connections
+MAX_OVERFLOW = 10  # Additional connections beyond pool_size
+REPLICA_POOL_SIZE = 10
+REPLICA_MAX_OVERFLOW = 5
 
 engine = create_engine(
     settings.database_url,
-    pool_size=20,  # Maximum pool connections
-    max_overflow=10,  # Additional connections beyond pool_size
+    poolclass=TimedQueuePool,
+    pool_logging_name="primary",
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW,
     pool_pre_ping=True,  # Verify connections before use
     pool_recycle=3600,  # Recycle connections after 1 hour
     echo=False,  # Disable SQL logging in production
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+instrument_engine(engine, "primary", POOL_SIZE + MAX_OVERFLOW)
+
+# Optional read replicas for read-only (GET/HEAD) handlers
+replica_engines: List[Engine] = [
+    create_engine(
+        url,
+        poolclass=TimedQueuePool,
+        pool_logging_name=f"replica-{index}",
+        pool_size=REPLICA_POOL_SIZE,
+        max_overflow=REPLICA_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        echo=False,
+    )
+    for index, url in enumerate(settings.replica_urls_list)
+]
+for index, replica in enumerate(replica_engines):
+    instrument_engine(
+        replica, f"replica-{index}", REPLICA_POOL_SIZE + REPLICA_MAX_OVERFLOW
+    )
+
+# Seconds of replay lag; 0 when the replica has applied everything it received
+REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """)
+
+READ_ONLY_METHODS = {"GET", "HEAD"}
+
+
+class ReplicaLagMonitor:
+    """
+    Tracks whether each replica is within the configured staleness tolerance.
+
+    Lag is measured at most once per check interval per replica so routing
+    a read costs a dictionary lookup rather than an extra round trip. Only
+    one thread measures a given replica at a time, outside the lock; other
+    threads keep using its last known status meanwhile, so a hanging
+    replica cannot stall routing.
+    """
+
+    def __init__(self, max_lag_seconds: float, check_interval: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._status: Dict[Engine, tuple] = {}
+        self._measuring: Set[Engine] = set()
+        self._lock = threading.Lock()
+
+    def is_fresh(self, replica: Engine) -> bool:
+        status = self._status.get(replica)
+        if status and time.monotonic() - status[0] < self.check_interval:
+            return status[1]
+
+        with self._lock:
+            if replica in self._measuring:
+                # Unmeasured replicas are treated as stale
+                return bool(status and status[1])
+            self._measuring.add(replica)
+
+        fresh = False
+        try:
+            fresh = self._measure(replica)
+        finally:
+            with self._lock:
+                self._status[replica] = (time.monotonic(), fresh)
+                self._measuring.discard(replica)
+        return fresh
+
+    def _measure(self, replica: Engine) -> bool:
+        try:
+            with replica.connect() as conn:
+                lag = conn.execute(REPLICA_LAG_SQL).scalar()
+            return lag is not None and float(lag) <= self.max_lag_seconds
+        except Exception:
+            # Unreachable replicas are treated as stale until the next check
+            return False
+
+
+class StickyPrimaryRegistry:
+    """
+    Remembers users who recently wrote so their reads stay on the primary.
+
+    This keeps read-your-writes semantics for the short window in which a
+    replica may not yet have replayed the user's own mutation. Marks are
+    stored in Redis so a read served by any worker sees them; the worker
+    that handled the write also remembers it locally in case Redis is down.
+    """
+
+    def __init__(self, window_seconds: int):
+        self.window_seconds = window_seconds
+        self._until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def mark(self, user_id: str) -> None:
+        cache_flag_set(self._flag(user_id), self.window_seconds)
+        with self._lock:
+            self._until[user_id] = time.monotonic() + self.window_seconds
+            # Opportunistically drop expired entries to keep the map small
+            if len(self._until) > 10000:
+                now = time.monotonic()
+                self._until = {k: v for k, v in self._until.items() if v > now}
+
+    def is_sticky(self, user_id: str) -> bool:
+        until = self._until.get(user_id)
+        if until is not None and until > time.monotonic():
+            return True
+        return cache_flag_exists(self._flag(user_id))
+
+    @staticmethod
+    def _flag(user_id: str) -> str:
+        return f"sticky-primary:{user_id}"
+
+
+replica_lag_monitor = ReplicaLagMonitor(
+    settings.REPLICA_MAX_LAG_SECONDS, settings.REPLICA_LAG_CHECK_INTERVAL
+)
+sticky_primary = StickyPrimaryRegistry(settings.REPLICA_STICKY_PRIMARY_SECONDS)
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica when the session is marked read-only.
+
+    Writes, flushes and any session not explicitly marked via
+    ``info["read_only"]`` always use the primary engine.
+    """
+
+    replicas: List[Engine] = replica_engines
+    lag_monitor: ReplicaLagMonitor = replica_lag_monitor
+    _replica_cycle = itertools.count()
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if not self.replicas or self._flushing or not self.info.get("read_only"):
+            return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+        replica = self.info.get("replica")
+        if replica is None:
+            replica = self._choose_replica()
+            # Pin the choice so a request sees one consistent snapshot
+            self.info["replica"] = replica or False
+        return replica or super().get_bind(mapper=mapper, clause=clause, **kw)
+
+    def _choose_replica(self) -> Optional[Engine]:
+        start = next(self._replica_cycle)
+        for i in range(len(self.replicas)):
+            replica = self.replicas[(start + i) % len(self.replicas)]
+            if self.lag_monitor.is_fresh(replica):
+                return replica
+        return None
+
+
+SessionLocal = sessionmaker(
+    class_=RoutingSession, autocommit=False, autoflush=False, bind=engine
+)
 
 Base = declarative_base()
 
 
-def get_db():
+def use_primary(db: Session) -> None:
+    """
+    Send the rest of a read-only request's queries to the primary.
+
+    For GET handlers that also write: only flushes are routed to the primary
+    by RoutingSession, and a replica rejects any other write.
+    """
+    db.info["read_only"] = False
+
+
+def route_session_for_user(db: Session, user_id: str) -> None:
+    """
+    Apply per-user read-your-writes routing to a request session.
+
+    A mutation marks the user sticky to the primary for a short window;
+    reads from a sticky user are pulled back onto the primary. Nothing is
+    tracked when no replicas are configured.
+    """
+    if not getattr(db, "replicas", None):
+        return
+
+    if not db.info.get("read_only"):
+        if db.info.get("request_method") is not None:
+            sticky_primary.mark(user_id)
+        return
+
+    if sticky_primary.is_sticky(user_id):
+        use_primary(db)
+
+
+def get_db(request: Request):
     """Dependency for getting database sessions"""
     db = SessionLocal()
+    db.info["request_method"] = request.method
+    db.info["read_only"] = request.method in READ_ONLY_METHODS
     try:
         yield db
     finally:
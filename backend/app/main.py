@@ -1,8 +1,13 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.v1 import (
     auth,
+    backups,
     collections,
     images,
     market_values,
@@ -10,13 +15,36 @@ from app.api.v1 import (
     reference,
     saved_searches,
     service_history,
+    sync,
     users,
     watches,
 )
 from app.config import settings
+from app.core.password_hashing import PasswordHashingBusy, password_hasher
 from app.middleware.cache import CacheMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.utils.cache import invalidation_listener
+from app.utils.metrics import PROMETHEUS_CONTENT_TYPE
+from app.utils.metrics import registry as metrics_registry
+from app.utils.pdf_parallel import shutdown_render_pool
+from app.utils.reference_data import warm_reference_snapshot
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Serve reference data from memory from the first request
+    await run_in_threadpool(warm_reference_snapshot)
+    # Enable the in-process cache layer once invalidations are received
+    invalidation_listener.start()
+    yield
+    # Stop PDF render workers, password hashing and cache listener threads
+    shutdown_render_pool()
+    password_hasher.shutdown()
+    invalidation_listener.stop()
+
 
 app = FastAPI(
+    lifespan=lifespan,
     title="Watch Collection Tracker API",
     description="""
 # Watch Collection Tracker API
@@ -79,6 +107,8 @@ Authorization: Bearer <your_access_token>
         {"name": "Analytics", "description": "Collection-wide performance analytics"},
         {"name": "Saved Searches", "description": "Save and manage watch searches"},
         {"name": "User Management", "description": "Admin-only user management"},
+        {"name": "Backups", "description": "Account backup and restore"},
+        {"name": "Sync", "description": "Incremental change feed for local mirrors"},
         {
             "name": "Movement Accuracy",
             "description": "Watch movement accuracy tracking and drift calculations",
@@ -86,6 +116,16 @@ Authorization: Bearer <your_access_token>
     ],
 )
 
+
+@app.exception_handler(PasswordHashingBusy)
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusy):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many authentication requests, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
+
 # Cache middleware (must be before CORS)
 app.add_middleware(CacheMiddleware, cache_time=300)
 
@@ -96,8 +136,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count"],
 )
 
+# Request metrics (outermost, so time spent in the other middleware counts)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(
@@ -108,6 +153,9 @@ app.include_router(
 )
 app.include_router(watches.router, prefix="/api/v1/watches", tags=["Watches"])
 app.include_router(images.router, prefix="/api/v1/watches", tags=["Images"])
+app.include_router(
+    service_history.service_rollup_router, prefix="/api/v1", tags=["Service History"]
+)
 app.include_router(
     service_history.router, prefix="/api/v1/watches", tags=["Service History"]
 )
@@ -122,6 +170,8 @@ app.include_router(
     saved_searches.router, prefix="/api/v1/saved-searches", tags=["Saved Searches"]
 )
 app.include_router(users.router, prefix="/api/v1/users", tags=["User Management"])
+app.include_router(backups.router, prefix="/api/v1/backups", tags=["Backups"])
+app.include_router(sync.router, prefix="/api/v1", tags=["Sync"])
 # Movement accuracy - atomic-time is public (no auth), watch-specific routes require auth
 app.include_router(
     movement_accuracy.atomic_time_router, prefix="/api/v1", tags=["Movement Accuracy"]
@@ -139,3 +189,12 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+if settings.METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return PlainTextResponse(
+            metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE
+        )
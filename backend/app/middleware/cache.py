@@ -2,39 +2,71 @@
 Caching middleware for API responses
 """
 
-from typing import Callable
+from typing import Iterable, Tuple
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+# (path prefix, Cache-Control value, replace a header set by the endpoint),
+# checked in order; the first matching prefix wins
+DEFAULT_CACHE_RULES = (
+    # Cache reference data for 1 hour
+    ("/api/v1/reference/", "public, max-age=3600", True),
+    # Cache static uploads forever (immutable)
+    ("/uploads/", "public, max-age=31536000, immutable", True),
+    # No cache for other API endpoints unless the endpoint set its own
+    ("/api/", "no-cache, no-store, must-revalidate", False),
+)
 
-class CacheMiddleware(BaseHTTPMiddleware):
+CACHE_CONTROL = b"cache-control"
+
+
+class CacheMiddleware:
     """
     Middleware to add cache headers for GET requests.
+
+    Implemented as plain ASGI so responses (including streamed PDFs and
+    images) pass straight through; only the response start message is
+    touched.
     """
 
-    def __init__(self, app, cache_time: int = 300):
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        cache_time: int = 300,
+        rules: Iterable[Tuple[str, str, bool]] = DEFAULT_CACHE_RULES,
+    ):
+        self.app = app
         self.cache_time = cache_time
+        self.rules = tuple(
+            (prefix, value.encode("latin-1"), override)
+            for prefix, value, override in rules
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        for prefix, value, override in self.rules:
+            if path.startswith(prefix):
+                break
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cache_control(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                has_header = any(key.lower() == CACHE_CONTROL for key, _ in headers)
+                if override and has_header:
+                    headers = [
+                        (key, v) for key, v in headers if key.lower() != CACHE_CONTROL
+                    ]
+                    has_header = False
+                if not has_header:
+                    headers.append((CACHE_CONTROL, value))
+                    message = {**message, "headers": headers}
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response = await call_next(request)
-
-        # Add cache headers for GET requests to reference data
-        if request.method == "GET":
-            # Cache reference data for 1 hour
-            if "/reference/" in str(request.url.path):
-                response.headers["Cache-Control"] = "public, max-age=3600"
-            # Cache static uploads forever (immutable)
-            elif "/uploads/" in str(request.url.path):
-                response.headers["Cache-Control"] = (
-                    "public, max-age=31536000, immutable"
-                )
-            # No cache for other API endpoints (default)
-            elif "/api/" in str(request.url.path):
-                response.headers["Cache-Control"] = (
-                    "no-cache, no-store, must-revalidate"
-                )
-
-        return response
+        await self.app(scope, receive, send_with_cache_control)
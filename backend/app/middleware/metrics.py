@@ -0,0 +1,92 @@
+"""
+Request metrics middleware
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import (
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DB_SECONDS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    RequestStats,
+    current_request_stats,
+)
+
+# Route label for requests no route matches (scanners, typos), so they
+# cannot create a series per path
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Get the template of the route that handled a request.
+
+    The router leaves the matched route in the scope. Routes of an included
+    router only know their own path (/{watch_id}), so the include prefix is
+    recovered from the request path: it is the literal part before the
+    longest suffix the route matches.
+
+    Args:
+        scope: ASGI scope after the request was handled
+
+    Returns:
+        The route template, e.g. /api/v1/watches/{watch_id}
+    """
+    route = scope.get("route")
+    path_regex = getattr(route, "path_regex", None)
+    if path_regex is None:
+        return UNMATCHED_ROUTE
+    path = scope["path"]
+    start = 0
+    while start != -1:
+        if path_regex.match(path[start:]):
+            return path[:start] + route.path
+        start = path.find("/", start + 1)
+    return route.path
+
+
+class MetricsMiddleware:
+    """
+    Middleware recording latency and database work per route template
+    (e.g. /api/v1/watches/{watch_id}), not per raw path, and requests in
+    flight.
+
+    Implemented as plain ASGI like CacheMiddleware, so the request context
+    variable set here is seen by handlers and their database queries.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = "500"
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        HTTP_REQUESTS_IN_FLIGHT.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec(method)
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start, method, route, status
+            )
+            HTTP_REQUEST_DB_QUERIES.observe(stats.db_queries, method, route)
+            HTTP_REQUEST_DB_SECONDS.observe(stats.db_seconds, method, route)
+            current_request_stats.reset(token)
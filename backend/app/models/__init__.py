@@ -1,9 +1,15 @@
 from app.models.collection import Collection
+from app.models.data_version import UserDataVersion
 from app.models.market_value import MarketValue
 from app.models.movement_accuracy import MovementAccuracyReading
 from app.models.reference import Brand, Complication, MovementType
 from app.models.saved_search import SavedSearch
-from app.models.service_history import ServiceDocument, ServiceHistory
+from app.models.service_history import (
+    ServiceDocument,
+    ServiceHistory,
+    WatchServiceRollup,
+)
+from app.models.sync import SyncTombstone
 from app.models.user import User
 from app.models.watch import Watch
 from app.models.watch_image import WatchImage
@@ -18,7 +24,10 @@ __all__ = [
     "WatchImage",
     "ServiceHistory",
     "ServiceDocument",
+    "WatchServiceRollup",
     "MarketValue",
     "SavedSearch",
     "MovementAccuracyReading",
+    "SyncTombstone",
+    "UserDataVersion",
 ]
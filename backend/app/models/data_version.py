@@ -0,0 +1,130 @@
+from collections import defaultdict
+
+from sqlalchemy import BigInteger, Column, ForeignKey, event, select
+from sqlalchemy.dialects.postgresql import UUID, insert
+from sqlalchemy.orm import Session
+
+from app.database import Base
+
+# Entity families with their own counter, and the tables in each
+DATA_VERSION_FAMILIES = (
+    "watches",
+    "images",
+    "values",
+    "readings",
+    "services",
+    "collections",
+)
+DATA_VERSION_TABLES = {
+    "collections": "collections",
+    "watches": "watches",
+    "watch_images": "images",
+    "market_values": "values",
+    "movement_accuracy_readings": "readings",
+    "service_history": "services",
+    "service_documents": "services",
+}
+
+
+class UserDataVersion(Base):
+    """
+    Per-user counters bumped in the same transaction as every write to the
+    user's data, one per entity family. A missing row means all zeros.
+    """
+
+    __tablename__ = "user_data_versions"
+
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    watches = Column(BigInteger, nullable=False, default=0, server_default="0")
+    images = Column(BigInteger, nullable=False, default=0, server_default="0")
+    values = Column(BigInteger, nullable=False, default=0, server_default="0")
+    readings = Column(BigInteger, nullable=False, default=0, server_default="0")
+    services = Column(BigInteger, nullable=False, default=0, server_default="0")
+    collections = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+def increment_data_versions(connection, user_id, families) -> None:
+    """
+    Bump the given counters of a user by one.
+
+    Args:
+        connection: Connection (or session) in the writing transaction
+        user_id: User whose data changed
+        families: Names from DATA_VERSION_FAMILIES
+    """
+    table = UserDataVersion.__table__
+    statement = insert(table).values(
+        user_id=user_id, **{family: 1 for family in families}
+    )
+    connection.execute(
+        statement.on_conflict_do_update(
+            index_elements=[table.c.user_id],
+            set_={family: table.c[family] + 1 for family in families},
+        )
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def bump_data_versions_on_flush(session: Session, flush_context) -> None:
+    """Bump the data versions of every user whose rows were just flushed"""
+    from app.models.service_history import ServiceHistory
+    from app.models.watch import Watch
+
+    changed = [
+        obj
+        for obj in (*session.new, *session.deleted)
+        if getattr(obj, "__tablename__", None) in DATA_VERSION_TABLES
+    ]
+    changed += [
+        obj
+        for obj in session.dirty
+        if getattr(obj, "__tablename__", None) in DATA_VERSION_TABLES
+        and session.is_modified(obj, include_collections=False)
+    ]
+    if not changed:
+        return
+
+    deleted_users = {
+        obj.id
+        for obj in session.deleted
+        if getattr(obj, "__tablename__", None) == "users"
+    }
+
+    def watch_owner(watch_id):
+        # Still in the identity map in after_flush, even if just deleted
+        watch = session.identity_map.get(session.identity_key(Watch, watch_id))
+        if watch is not None:
+            return watch.user_id
+        return session.execute(
+            select(Watch.user_id).where(Watch.id == watch_id)
+        ).scalar()
+
+    def service_watch(service_id):
+        service = session.identity_map.get(
+            session.identity_key(ServiceHistory, service_id)
+        )
+        if service is not None:
+            return service.watch_id
+        return session.execute(
+            select(ServiceHistory.watch_id).where(ServiceHistory.id == service_id)
+        ).scalar()
+
+    families_by_user = defaultdict(set)
+    for obj in changed:
+        user_id = getattr(obj, "user_id", None)
+        if user_id is None:
+            watch_id = getattr(obj, "watch_id", None)
+            if watch_id is None:
+                watch_id = service_watch(obj.service_history_id)
+            user_id = watch_owner(watch_id) if watch_id is not None else None
+        if user_id is None or user_id in deleted_users:
+            continue
+        families_by_user[user_id].add(DATA_VERSION_TABLES[obj.__tablename__])
+
+    connection = session.connection()
+    for user_id, families in families_by_user.items():
+        increment_data_versions(connection, user_id, sorted(families))
@@ -7,6 +7,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.sync import change_seq_column, change_xid_column
 
 
 class ValueSourceEnum(str, enum.Enum):
@@ -41,5 +42,9 @@ class MarketValue(Base):
     # Timestamp
     recorded_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
+    # Change token for incremental sync
+    change_seq = change_seq_column()
+    change_xid = change_xid_column()
+
     # Relationships
     watch = relationship("Watch", back_populates="market_values")
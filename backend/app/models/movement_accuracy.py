@@ -15,6 +15,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.sync import change_seq_column, change_xid_column
 
 
 class MovementAccuracyReading(Base):
@@ -74,6 +75,10 @@ class MovementAccuracyReading(Base):
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
 
+    # Change token for incremental sync
+    change_seq = change_seq_column()
+    change_xid = change_xid_column()
+
     # Relationships
     watch = relationship("Watch", back_populates="accuracy_readings")
 
@@ -17,6 +17,9 @@ class SavedSearch(Base):
     )
     name = Column(String(100), nullable=False)
     filters = Column(JSON, nullable=False)
+    # Watch ids matched when the search was last run, for new-match detection
+    seen_match_ids = Column(JSON)
+    seen_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
@@ -1,11 +1,21 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.sync import change_seq_column, change_xid_column
 
 
 class ServiceHistory(Base):
@@ -40,6 +50,10 @@ class ServiceHistory(Base):
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
 
+    # Change token for incremental sync
+    change_seq = change_seq_column()
+    change_xid = change_xid_column()
+
     # Relationships
     watch = relationship("Watch", back_populates="service_history")
     documents = relationship(
@@ -69,3 +83,36 @@ class ServiceDocument(Base):
 
     # Relationships
     service = relationship("ServiceHistory", back_populates="documents")
+
+
+class WatchServiceRollup(Base):
+    """
+    Per-watch service aggregates, refreshed whenever the watch's service
+    records change (see app.utils.service_rollup).
+    """
+
+    __tablename__ = "watch_service_rollups"
+
+    watch_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("watches.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    service_count = Column(Integer, nullable=False, default=0)
+    # Total spend per currency, e.g. {"USD": 1250.0, "CHF": 400.0}
+    total_costs = Column(JSONB, nullable=False, default=dict)
+    last_service_date = Column(DateTime)
+    # next_service_due of the most recent service
+    next_service_due = Column(DateTime)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_watch_service_rollups_user_next_due", "user_id", "next_service_due"),
+    )
@@ -0,0 +1,109 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    ForeignKey,
+    Sequence,
+    String,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Session
+
+from app.database import Base
+
+# Shared, monotonically increasing change counter. Every insert or update of a
+# synced row stamps it with the next value, and every delete leaves a tombstone
+# stamped the same way, so one number orders all changes across tables.
+sync_change_seq = Sequence("sync_change_seq", metadata=Base.metadata)
+
+# Id of the writing transaction. Sequence values are taken when a row is
+# written, not when it commits, so a smaller change_seq can become visible
+# after a larger one; GET /sync only hands out changes whose transaction is
+# older than every transaction still running (see app.utils.sync).
+CURRENT_XACT_ID = text("pg_current_xact_id()::text::bigint")
+
+# Tables mirrored by GET /sync, in foreign key order
+SYNC_TABLES = (
+    "watches",
+    "watch_images",
+    "service_history",
+    "market_values",
+    "movement_accuracy_readings",
+)
+
+
+def change_seq_column() -> Column:
+    """Build the change_seq column carried by every synced table"""
+    return Column(
+        BigInteger,
+        default=sync_change_seq.next_value(),
+        onupdate=sync_change_seq.next_value(),
+        nullable=False,
+        index=True,
+    )
+
+
+def change_xid_column() -> Column:
+    """Build the change_xid column carried by every synced table"""
+    return Column(
+        BigInteger,
+        default=CURRENT_XACT_ID,
+        onupdate=CURRENT_XACT_ID,
+        nullable=False,
+        index=True,
+    )
+
+
+class SyncTombstone(Base):
+    __tablename__ = "sync_tombstones"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    change_seq = Column(
+        BigInteger, default=sync_change_seq.next_value(), nullable=False, index=True
+    )
+    change_xid = change_xid_column()
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    entity = Column(String(50), nullable=False)
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    deleted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+@event.listens_for(Session, "before_flush")
+def record_sync_tombstones(session: Session, flush_context, instances) -> None:
+    """Leave a tombstone for every synced row deleted through the ORM"""
+    from app.models.watch import Watch
+
+    deleted = list(session.deleted)
+    # A deleted account takes its tombstones with it, so none are needed
+    deleted_users = {
+        obj.id for obj in deleted if getattr(obj, "__tablename__", None) == "users"
+    }
+
+    for obj in deleted:
+        table = getattr(obj, "__tablename__", None)
+        if table not in SYNC_TABLES:
+            continue
+
+        user_id = getattr(obj, "user_id", None)
+        if user_id is None:
+            # Child rows belong to whoever owns their watch, which is still in
+            # the identity map when it is being deleted in the same flush
+            with session.no_autoflush:
+                watch = session.get(Watch, obj.watch_id)
+            if watch is None:
+                continue
+            user_id = watch.user_id
+        if user_id in deleted_users:
+            continue
+
+        session.add(SyncTombstone(user_id=user_id, entity=table, entity_id=obj.id))
@@ -16,6 +16,7 @@ from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.sync import change_seq_column, change_xid_column
 
 
 class ConditionEnum(str, enum.Enum):
@@ -86,6 +87,10 @@ class Watch(Base):
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
 
+    # Change token for incremental sync
+    change_seq = change_seq_column()
+    change_xid = change_xid_column()
+
     # Relationships
     user = relationship("User", back_populates="watches")
     collection = relationship("Collection", back_populates="watches")
@@ -103,3 +108,8 @@ class Watch(Base):
     accuracy_readings = relationship(
         "MovementAccuracyReading", back_populates="watch", cascade="all, delete-orphan"
     )
+
+    @property
+    def primary_image(self):
+        """Image marked as primary, if any (uses the loaded images)"""
+        return next((image for image in self.images if image.is_primary), None)
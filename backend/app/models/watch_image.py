@@ -7,6 +7,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.database import Base
+from app.models.sync import change_seq_column, change_xid_column
 
 
 class ImageSourceEnum(str, enum.Enum):
@@ -50,5 +51,9 @@ class WatchImage(Base):
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Change token for incremental sync
+    change_seq = change_seq_column()
+    change_xid = change_xid_column()
+
     # Relationships
     watch = relationship("Watch", back_populates="images")
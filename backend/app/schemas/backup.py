@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class BackupResponse(BaseModel):
+    id: str
+    user_id: UUID
+    kind: str
+    parent_id: Optional[str]
+    created_at: datetime
+    row_counts: Dict[str, int]
+    file_count: int
+    blob_count: int
+    size_bytes: int
+
+
+class RestoreResponse(BaseModel):
+    backup_id: str
+    rows_restored: Dict[str, int]
+    rows_deleted: Dict[str, int]
+    files_restored: int
@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -34,6 +34,25 @@ class MarketValueCreate(BaseModel):
     recorded_at: Optional[datetime] = None  # Optional, defaults to now if not provided
 
 
+class MarketValueBulkItem(MarketValueCreate):
+    """Schema for one market value in a bulk upload"""
+
+    watch_id: UUID
+
+
+class MarketValueBulkCreate(BaseModel):
+    """Schema for creating many market values at once"""
+
+    values: List[MarketValueBulkItem] = Field(..., min_length=1, max_length=10000)
+
+
+class MarketValueBulkResult(BaseModel):
+    """Result of a bulk market value upload"""
+
+    created: int
+    watches_updated: int
+
+
 class MarketValueUpdate(BaseModel):
     """Schema for updating market value"""
 
@@ -28,3 +28,9 @@ class ComplicationResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class ReferenceReloadResponse(BaseModel):
+    brands: int
+    movement_types: int
+    complications: int
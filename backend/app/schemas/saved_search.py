@@ -1,9 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.schemas.watch import WatchListResponse
+
 
 class SavedSearchBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
@@ -27,3 +29,15 @@ class SavedSearchResponse(SavedSearchBase):
 
     class Config:
         from_attributes = True
+
+
+class SavedSearchResults(BaseModel):
+    search_id: UUID
+    items: List[WatchListResponse]
+    total: int
+    limit: int
+    offset: int
+    # Matches that were not there when the search was last run
+    new_match_ids: List[UUID]
+    seen_at: Optional[datetime]
+    data_version: str
@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, computed_field
@@ -68,3 +68,36 @@ class ServiceHistoryResponse(ServiceHistoryBase):
 
     class Config:
         from_attributes = True
+
+
+class ServiceHistoryListItem(ServiceHistoryBase):
+    """Schema for a service history record in a list"""
+
+    id: UUID
+    watch_id: UUID
+    created_at: datetime
+    updated_at: datetime
+    document_count: int
+    # None when the list was requested without documents
+    documents: Optional[List[ServiceDocumentResponse]] = None
+
+
+class UpcomingServiceResponse(BaseModel):
+    """Schema for a watch with service coming due"""
+
+    watch_id: UUID
+    brand_name: str
+    model: str
+    service_count: int
+    last_service_date: Optional[datetime] = None
+    next_service_due: datetime
+    overdue: bool
+
+
+class ServiceCostSummary(BaseModel):
+    """Schema for service totals across a user's watches"""
+
+    watches_serviced: int
+    service_count: int
+    total_costs: Dict[str, Decimal]
+    next_service_due: Optional[datetime] = None
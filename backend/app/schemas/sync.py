@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SyncTombstoneResponse(BaseModel):
+    entity: str
+    id: UUID
+    deleted_at: datetime
+
+
+class SyncResponse(BaseModel):
+    token: str
+    has_more: bool
+    watches: List[Dict[str, Any]]
+    watch_images: List[Dict[str, Any]]
+    service_history: List[Dict[str, Any]]
+    market_values: List[Dict[str, Any]]
+    movement_accuracy_readings: List[Dict[str, Any]]
+    deleted: List[SyncTombstoneResponse]
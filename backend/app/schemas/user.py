@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
@@ -62,3 +62,29 @@ class UserAdminPasswordReset(BaseModel):
     """Admin-only password reset schema"""
 
     new_password: str = Field(..., min_length=8, max_length=100)
+
+
+class PasswordHashingStats(BaseModel):
+    workers: int
+    max_queue: int
+    running: int
+    queued: int
+    completed: int
+    failed: int
+    rejected: int
+    avg_wait_ms: float
+    avg_work_ms: float
+
+
+class SingleFlightCounters(BaseModel):
+    calls: int
+    hits: int
+    coalesced: int
+    remote_waits: int
+    executions: int
+    failures: int
+
+
+class SingleFlightStats(BaseModel):
+    in_flight: int
+    endpoints: Dict[str, SingleFlightCounters]
@@ -1,3 +1,4 @@
+import enum
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
@@ -148,3 +149,20 @@ class PaginatedWatchResponse(BaseModel):
     total: int
     limit: int
     offset: int
+
+
+class WatchImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+
+class WatchImportResult(BaseModel):
+    imported: int
+    failed: int
+    errors: List[WatchImportError]
+
+
+class WatchExportInclude(str, enum.Enum):
+    MARKET_VALUES = "market_values"
+    SERVICE_HISTORY = "service_history"
+    ACCURACY_READINGS = "accuracy_readings"
@@ -8,6 +8,8 @@ from typing import Optional, Tuple
 
 import httpx
 
+from app.utils.metrics import AsyncInstrumentedTransport
+
 logger = logging.getLogger(__name__)
 
 # WorldTimeAPI endpoint
@@ -27,7 +29,9 @@ async def get_atomic_time(tz: str = "UTC") -> Tuple[datetime, bool]:
         is_atomic_source is False if API failed and server time was used
     """
     try:
-        async with httpx.AsyncClient(timeout=API_TIMEOUT) as client:
+        async with httpx.AsyncClient(
+            timeout=API_TIMEOUT, transport=AsyncInstrumentedTransport("worldtimeapi")
+        ) as client:
             # Normalize timezone for API
             api_tz = tz if tz else "UTC"
             url = f"{WORLD_TIME_API_URL}/{api_tz}"
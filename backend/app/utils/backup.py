@@ -0,0 +1,522 @@
+"""
+Incremental, content-addressed account backups stored under BACKUP_DIR
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import tarfile
+import tempfile
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import DateTime, Numeric, Uuid, delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.collection import Collection
+from app.models.data_version import DATA_VERSION_FAMILIES
+from app.models.market_value import MarketValue
+from app.models.movement_accuracy import MovementAccuracyReading
+from app.models.saved_search import SavedSearch
+from app.models.service_history import ServiceDocument, ServiceHistory
+from app.models.sync import SYNC_TABLES
+from app.models.watch import Watch
+from app.models.watch_image import WatchImage
+from app.utils.data_export import model_to_dict
+from app.utils.data_version import bump_data_versions
+from app.utils.service_rollup import refresh_service_rollups
+from app.utils.sync import (
+    SNAPSHOT_XMIN_SQL,
+    SyncPosition,
+    format_token,
+    parse_token,
+    record_tombstones,
+)
+
+BACKUP_FORMAT_VERSION = 2
+
+# Tables in foreign key order, i.e. the order they are restored in
+BACKUP_TABLES = [
+    ("collections", Collection),
+    ("watches", Watch),
+    ("watch_images", WatchImage),
+    ("service_history", ServiceHistory),
+    ("service_documents", ServiceDocument),
+    ("market_values", MarketValue),
+    ("movement_accuracy_readings", MovementAccuracyReading),
+    ("saved_searches", SavedSearch),
+]
+
+# Tables whose uploaded files are backed up, with their directory under uploads
+FILE_TABLES = {"watch_images": "", "service_documents": "service-docs/"}
+
+# Rows read per server-side cursor fetch / written per upsert
+BACKUP_BATCH_SIZE = 1000
+RESTORE_BATCH_SIZE = 500
+
+BACKUP_ID_PATTERN = re.compile(r"^\d{8}T\d{12}Z-(full|incremental)$")
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class BackupError(Exception):
+    """Raised when a backup cannot be applied"""
+
+
+class BackupNotFoundError(BackupError):
+    """Raised when a backup (or part of its chain) does not exist"""
+
+
+def _user_filter(model, user_id: uuid.UUID):
+    """Build the WHERE clause selecting a user's rows of a backed up table"""
+    if hasattr(model, "user_id"):
+        return model.user_id == user_id
+
+    user_watches = select(Watch.id).where(Watch.user_id == user_id)
+    if hasattr(model, "watch_id"):
+        return model.watch_id.in_(user_watches)
+
+    # Service documents hang off service records
+    return model.service_history_id.in_(
+        select(ServiceHistory.id).where(ServiceHistory.watch_id.in_(user_watches))
+    )
+
+
+def _decode_row(model, row: dict) -> dict:
+    """Convert JSON values from an archive back into column types"""
+    decoded = {}
+    for column in model.__table__.columns:
+        # Restored rows take a fresh change token so sync clients see them
+        if column.key not in row or column.key in ("change_seq", "change_xid"):
+            continue
+        value = row[column.key]
+        if value is not None:
+            if isinstance(column.type, Uuid):
+                value = uuid.UUID(value)
+            elif isinstance(column.type, DateTime):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Numeric):
+                value = Decimal(value)
+        decoded[column.key] = value
+    return decoded
+
+
+def hash_file(path: Path) -> str:
+    """Get the SHA-256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def user_backup_dir(backup_dir: str, user_id: uuid.UUID) -> Path:
+    """Get the directory holding a user's backups"""
+    return Path(backup_dir) / str(user_id)
+
+
+def list_backups(backup_dir: str, user_id: uuid.UUID) -> List[dict]:
+    """
+    List a user's backup manifests, oldest first.
+
+    Args:
+        backup_dir: Base backup directory
+        user_id: Owner of the backups
+
+    Returns:
+        Manifest dictionaries
+    """
+    directory = user_backup_dir(backup_dir, user_id)
+    if not directory.exists():
+        return []
+
+    manifests = []
+    for path in sorted(directory.glob("*.json")):
+        if BACKUP_ID_PATTERN.match(path.stem):
+            with open(path) as f:
+                manifests.append(json.load(f))
+    return manifests
+
+
+def load_manifest(backup_dir: str, user_id: uuid.UUID, backup_id: str) -> dict:
+    """
+    Load the manifest of one backup.
+
+    Raises:
+        BackupNotFoundError: If the backup does not exist
+    """
+    if not BACKUP_ID_PATTERN.match(backup_id):
+        raise BackupNotFoundError("Backup not found")
+
+    path = user_backup_dir(backup_dir, user_id) / f"{backup_id}.json"
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise BackupNotFoundError("Backup not found")
+
+
+def backup_chain(backup_dir: str, user_id: uuid.UUID, backup_id: str) -> List[dict]:
+    """
+    Get the manifests needed to restore a backup, from its full backup onward.
+
+    Raises:
+        BackupNotFoundError: If any backup in the chain is missing
+    """
+    chain = [load_manifest(backup_dir, user_id, backup_id)]
+    while chain[0]["parent_id"]:
+        chain.insert(0, load_manifest(backup_dir, user_id, chain[0]["parent_id"]))
+    return chain
+
+
+def archive_path(backup_dir: str, user_id: uuid.UUID, backup_id: str) -> Path:
+    """
+    Get the archive of one backup.
+
+    Raises:
+        BackupNotFoundError: If the archive is missing
+    """
+    path = user_backup_dir(backup_dir, user_id) / f"{backup_id}.tar.gz"
+    if not path.is_file():
+        raise BackupNotFoundError("Backup archive not found")
+    return path
+
+
+def _parse_mark(mark: Optional[str]) -> Optional[SyncPosition]:
+    """
+    Parse a high-water mark from a previous manifest.
+
+    Returns None for no mark, or for the updated_at timestamps recorded by
+    earlier backups, so the table is written in full once.
+    """
+    if not mark:
+        return None
+    try:
+        return parse_token(mark)
+    except ValueError:
+        return None
+
+
+def _dump_table(
+    db: Session, model, user_id: uuid.UUID, since: Optional[str], horizon: int
+) -> Tuple[tempfile.SpooledTemporaryFile, int, Optional[str]]:
+    """
+    Write a user's rows of one table as JSON lines.
+
+    Tables carrying a (change_xid, change_seq) change token only write rows
+    changed after ``since``; other tables are written in full. The new mark
+    is the horizon rather than the largest token written: a transaction at or
+    above it may still commit rows below tokens already seen, and those must
+    be picked up by the next backup.
+
+    Args:
+        db: Database session
+        model: Backed up model
+        user_id: Owner of the rows
+        since: High-water mark of the parent backup, if any
+        horizon: Snapshot xmin read before any table was dumped
+
+    Returns:
+        (spooled file, row count, new high-water mark)
+    """
+    query = select(model).where(_user_filter(model, user_id))
+
+    tracks_changes = hasattr(model, "change_xid")
+    position = _parse_mark(since) if tracks_changes else None
+    if position:
+        query = query.where(tuple_(model.change_xid, model.change_seq) > position)
+
+    output = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    count = 0
+
+    rows = db.execute(query.execution_options(yield_per=BACKUP_BATCH_SIZE)).scalars()
+    for obj in rows:
+        output.write(json.dumps(model_to_dict(obj), separators=(",", ":")).encode())
+        output.write(b"\n")
+        count += 1
+
+    output.seek(0)
+    if not tracks_changes:
+        return output, count, None
+    return output, count, format_token(max(position or (0, 0), (horizon, 0)))
+
+
+def _collect_files(
+    db: Session, user_id: uuid.UUID, upload_dir: str, previous: Dict[str, list]
+) -> Dict[str, list]:
+    """
+    Map each of the user's uploaded files to [size, mtime, sha256].
+
+    Hashes are reused from the previous backup while a file's size and
+    modification time are unchanged, so unchanged uploads are never re-read.
+    """
+    files = {}
+    for table, prefix in FILE_TABLES.items():
+        model = dict(BACKUP_TABLES)[table]
+        paths = db.scalars(select(model.file_path).where(_user_filter(model, user_id)))
+        for file_path in paths:
+            relative = f"{prefix}{file_path}"
+            path = Path(upload_dir) / relative
+            try:
+                stat = path.stat()
+            except OSError:
+                print(f"Backup skipping missing upload {relative}")
+                continue
+
+            known = previous.get(relative)
+            if known and known[0] == stat.st_size and known[1] == stat.st_mtime:
+                files[relative] = known
+            else:
+                files[relative] = [stat.st_size, stat.st_mtime, hash_file(path)]
+    return files
+
+
+def _add_bytes(archive: tarfile.TarFile, name: str, fileobj, size: int) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = size
+    info.mtime = int(datetime.utcnow().timestamp())
+    archive.addfile(info, fileobj)
+
+
+def create_backup(
+    db: Session,
+    user_id: uuid.UUID,
+    backup_dir: str,
+    upload_dir: str,
+    incremental: bool = True,
+) -> dict:
+    """
+    Write a compressed backup archive of a user's data and uploads.
+
+    Incremental backups build on the user's latest backup: synced tables
+    only include rows whose change token is past that backup's high-water
+    marks, and only uploads whose content hash is not already stored in the
+    backup chain are copied. Marks come from the writing transaction ids
+    (see collect_changes), not timestamps, so rows committed late are never
+    skipped.
+
+    Args:
+        db: Database session
+        user_id: User to back up
+        backup_dir: Base backup directory
+        upload_dir: Base directory for uploads
+        incremental: Build on the latest backup if there is one
+
+    Returns:
+        Manifest of the new backup
+    """
+    directory = user_backup_dir(backup_dir, user_id)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    existing = list_backups(backup_dir, user_id) if incremental else []
+    parent = existing[-1] if existing else None
+    chain = backup_chain(backup_dir, user_id, parent["id"]) if parent else []
+    stored_blobs = {blob for manifest in chain for blob in manifest["blobs"]}
+
+    created_at = datetime.utcnow()
+    kind = "incremental" if parent else "full"
+    backup_id = f"{created_at.strftime('%Y%m%dT%H%M%S%f')}Z-{kind}"
+
+    manifest = {
+        "format_version": BACKUP_FORMAT_VERSION,
+        "id": backup_id,
+        "user_id": str(user_id),
+        "kind": kind,
+        "parent_id": parent["id"] if parent else None,
+        "created_at": created_at.isoformat(),
+        "row_counts": {},
+        "high_water_marks": {},
+        "ids": {},
+        "files": {},
+        "blobs": [],
+    }
+
+    # Read before any rows: every transaction below it has committed or
+    # aborted, so its changes are in this backup or never will be
+    horizon = db.execute(SNAPSHOT_XMIN_SQL).scalar_one()
+
+    archive_path = directory / f"{backup_id}.tar.gz"
+    fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as raw, tarfile.open(
+            fileobj=raw, mode="w:gz"
+        ) as archive:
+            for table, model in BACKUP_TABLES:
+                since = parent["high_water_marks"].get(table) if parent else None
+                rows, count, high_water_mark = _dump_table(
+                    db, model, user_id, since, horizon
+                )
+                with rows:
+                    rows.seek(0, os.SEEK_END)
+                    size = rows.tell()
+                    rows.seek(0)
+                    _add_bytes(archive, f"tables/{table}.ndjson", rows, size)
+
+                manifest["row_counts"][table] = count
+                if high_water_mark:
+                    manifest["high_water_marks"][table] = high_water_mark
+                # Live ids let a restore drop rows deleted since earlier backups
+                manifest["ids"][table] = [
+                    str(row_id)
+                    for row_id in db.scalars(
+                        select(model.id).where(_user_filter(model, user_id))
+                    )
+                ]
+
+            manifest["files"] = _collect_files(
+                db, user_id, upload_dir, parent["files"] if parent else {}
+            )
+            for relative, (_, _, digest) in sorted(manifest["files"].items()):
+                if digest in stored_blobs:
+                    continue
+                archive.add(Path(upload_dir) / relative, arcname=f"blobs/{digest}")
+                stored_blobs.add(digest)
+                manifest["blobs"].append(digest)
+
+            data = json.dumps(manifest).encode("utf-8")
+            _add_bytes(archive, "manifest.json", io.BytesIO(data), len(data))
+
+        os.replace(tmp_name, archive_path)
+    except Exception:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+    manifest["size_bytes"] = archive_path.stat().st_size
+    with open(directory / f"{backup_id}.json", "w") as f:
+        json.dump(manifest, f)
+
+    return manifest
+
+
+def _iter_table_rows(archive: tarfile.TarFile, table: str) -> Iterator[dict]:
+    member = archive.extractfile(f"tables/{table}.ndjson")
+    for line in member:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _upsert(db: Session, model, rows: List[dict]) -> None:
+    statement = insert(model).values(rows)
+    update_columns = {
+        column.key: statement.excluded[column.key]
+        for column in model.__table__.columns
+        if not column.primary_key
+    }
+    db.execute(
+        statement.on_conflict_do_update(index_elements=[model.id], set_=update_columns)
+    )
+
+
+def restore_backup(
+    db: Session,
+    user_id: uuid.UUID,
+    backup_id: str,
+    backup_dir: str,
+    upload_dir: str,
+) -> dict:
+    """
+    Restore a user's data and uploads to the state captured by a backup.
+
+    The backup chain is applied from its full backup onward with batched
+    upserts, rows that did not exist at backup time are deleted, and missing
+    or changed upload files are written back. The caller commits.
+
+    Args:
+        db: Database session
+        user_id: Owner of the backup
+        backup_id: Backup to restore
+        backup_dir: Base backup directory
+        upload_dir: Base directory for uploads
+
+    Returns:
+        Counts of restored and deleted rows and restored files
+
+    Raises:
+        BackupNotFoundError: If the backup or part of its chain is missing
+        BackupError: If the archives are inconsistent
+    """
+    chain = backup_chain(backup_dir, user_id, backup_id)
+    target = chain[-1]
+    # Check every archive up front, before any data is touched
+    archives = {
+        manifest["id"]: archive_path(backup_dir, user_id, manifest["id"])
+        for manifest in chain
+    }
+
+    rows_restored = {table: 0 for table, _ in BACKUP_TABLES}
+    for manifest in chain:
+        with tarfile.open(archives[manifest["id"]], "r:gz") as archive:
+            for table, model in BACKUP_TABLES:
+                batch = []
+                for row in _iter_table_rows(archive, table):
+                    batch.append(_decode_row(model, row))
+                    if len(batch) >= RESTORE_BATCH_SIZE:
+                        _upsert(db, model, batch)
+                        rows_restored[table] += len(batch)
+                        batch = []
+                if batch:
+                    _upsert(db, model, batch)
+                    rows_restored[table] += len(batch)
+
+    rows_deleted = {}
+    for table, model in reversed(BACKUP_TABLES):
+        live_ids = [uuid.UUID(row_id) for row_id in target["ids"][table]]
+        deleted_ids = db.scalars(
+            delete(model)
+            .where(_user_filter(model, user_id), model.id.notin_(live_ids))
+            .returning(model.id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        rows_deleted[table] = len(deleted_ids)
+        if table in SYNC_TABLES:
+            record_tombstones(db, user_id, table, deleted_ids)
+
+    refresh_service_rollups(db, select(Watch.id).where(Watch.user_id == user_id))
+    bump_data_versions(db, user_id, *DATA_VERSION_FAMILIES)
+
+    # Work out which files need writing, then pull each blob from its archive
+    needed: Dict[str, List[Path]] = {}
+    upload_root = Path(upload_dir).resolve()
+    for relative, (size, _, digest) in target["files"].items():
+        path = upload_root / relative
+        if not path.resolve().is_relative_to(upload_root):
+            raise BackupError(f"Backup contains an invalid file path: {relative}")
+        try:
+            if path.stat().st_size == size and hash_file(path) == digest:
+                continue
+        except OSError:
+            pass
+        needed.setdefault(digest, []).append(path)
+
+    files_restored = 0
+    for manifest in chain:
+        blobs = needed.keys() & set(manifest["blobs"])
+        if not blobs:
+            continue
+        with tarfile.open(archives[manifest["id"]], "r:gz") as archive:
+            for member in archive:
+                digest = member.name.removeprefix("blobs/")
+                if digest not in blobs:
+                    continue
+                content = archive.extractfile(member).read()
+                for path in needed.pop(digest):
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    path.write_bytes(content)
+                    files_restored += 1
+
+    if needed:
+        raise BackupError("Backup chain is missing uploaded files")
+
+    return {
+        "backup_id": target["id"],
+        "rows_restored": rows_restored,
+        "rows_deleted": rows_deleted,
+        "files_restored": files_restored,
+    }
@@ -1,29 +1,199 @@
 """
-Redis caching utilities
+Two-tier caching: a small in-process LRU in front of Redis
+
+Values are serialized with orjson. While the invalidation listener is
+subscribed, each worker keeps recently used entries in memory for a few
+seconds; every write and invalidation is broadcast over Redis pub/sub so
+other workers drop their copies. Without Redis the helpers degrade to
+no-ops and reconnect automatically.
 """
 
-import json
-from typing import Any, Optional
+import asyncio
+import fnmatch
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Iterable, List, Optional
 
+import orjson
 import redis
+import redis.asyncio as aioredis
+
+from app.config import settings
+from app.utils.metrics import CACHE_LOOKUPS
+
+# Tag sets hold the keys of every entry registered under the tag
+TAG_PREFIX = "tag:"
+
+# Keys popped / scanned and deleted per round trip when invalidating
+INVALIDATE_BATCH_SIZE = 500
+
+# Pub/sub channel carrying keys and patterns to drop from local caches
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Lets a worker ignore its own invalidation messages
+WORKER_ID = uuid.uuid4().hex
+
+# Locks coordinating work across workers, see cache_lock_acquire
+LOCK_PREFIX = "lock:"
+
+# Short-lived markers shared by all workers, see cache_flag_set
+FLAG_PREFIX = "flag:"
+
+# Deletes a lock only if it still holds the caller's token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Redis errors after which the server is skipped until the retry time
+CONNECTION_ERRORS = (redis.ConnectionError, redis.TimeoutError)
+
+
+def user_tag(user_id) -> str:
+    """Tag for every cache entry derived from a user's data"""
+    return f"user:{user_id}"
+
+
+def entity_tag(entity: str, entity_id) -> str:
+    """Tag for every cache entry derived from one entity, e.g. a watch"""
+    return f"{entity}:{entity_id}"
+
+
+class LocalCache:
+    """
+    Bounded LRU of serialized entries with per-entry expiry.
+
+    Disabled until the invalidation listener is subscribed, since entries
+    could otherwise outlive writes made by other workers.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = False
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def set(self, key: str, data: bytes, ttl: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def delete_matching(self, pattern: str) -> None:
+        with self._lock:
+            for key in [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+local_cache = LocalCache(
+    settings.CACHE_LOCAL_MAX_ENTRIES, settings.CACHE_LOCAL_TTL_SECONDS
+)
+
+
+def _connection_kwargs() -> dict:
+    return {
+        "host": settings.REDIS_HOST,
+        "port": settings.REDIS_PORT,
+        "db": settings.REDIS_DB,
+        "password": settings.REDIS_PASSWORD or None,
+        "socket_connect_timeout": 2,
+        "socket_timeout": 2,
+        "health_check_interval": 30,
+    }
+
+
+# Connects lazily; the connection pool reconnects on its own after failures
+redis_client: Optional[redis.Redis] = redis.Redis(**_connection_kwargs())
+
+# After a connection failure Redis is skipped until this time, rather than
+# paying the connect timeout on every call
+_retry_at = 0.0
+
+
+def _redis_available() -> bool:
+    return time.monotonic() >= _retry_at
+
+
+def _mark_unavailable() -> None:
+    global _retry_at
+    _retry_at = time.monotonic() + settings.CACHE_RECONNECT_SECONDS
+
 
-# Redis client configuration
-redis_client = None
-
-try:
-    redis_client = redis.Redis(
-        host="redis",
-        port=6379,
-        db=0,
-        decode_responses=True,
-        socket_connect_timeout=2,
-        socket_timeout=2,
-    )
-    # Test connection
-    redis_client.ping()
-except (redis.ConnectionError, redis.TimeoutError):
-    # Redis not available, caching will be disabled
-    redis_client = None
+def _client() -> Optional[redis.Redis]:
+    return redis_client if redis_client is not None and _redis_available() else None
+
+
+def _invalidation(keys: Iterable[str] = (), pattern: Optional[str] = None) -> bytes:
+    message = {"origin": WORKER_ID, "keys": list(keys)}
+    if pattern is not None:
+        message["pattern"] = pattern
+    return orjson.dumps(message)
+
+
+def _queue_set(pipe, key: str, data: bytes, expire: int, tags: Iterable[str]) -> None:
+    pipe.setex(key, expire, data)
+    for tag in tags:
+        tag_key = TAG_PREFIX + tag
+        pipe.sadd(tag_key, key)
+        # NX covers a new set, GT extends an existing one
+        pipe.expire(tag_key, expire, nx=True)
+        pipe.expire(tag_key, expire, gt=True)
+    pipe.publish(INVALIDATION_CHANNEL, _invalidation([key]))
+
+
+def _local_ttl(pttl: int) -> Optional[float]:
+    """Local lifetime for an entry with the given Redis PTTL"""
+    return pttl / 1000 if pttl and pttl > 0 else None
+
+
+def handle_invalidation(data: bytes) -> None:
+    """Apply an invalidation message from another worker to the local cache"""
+    try:
+        message = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return
+    if message.get("origin") == WORKER_ID:
+        return
+    local_cache.delete(*message.get("keys", ()))
+    if message.get("pattern"):
+        local_cache.delete_matching(message["pattern"])
 
 
 def cache_get(key: str) -> Optional[Any]:
@@ -31,32 +201,67 @@ def cache_get(key: str) -> Optional[Any]:
     Get value from cache.
     Returns None if key doesn't exist or Redis is unavailable.
     """
-    if not redis_client:
-        return None
+    data = local_cache.get(key)
+    if data is not None:
+        CACHE_LOOKUPS.inc("local_hit")
+    else:
+        client = _client()
+        if not client:
+            CACHE_LOOKUPS.inc("error")
+            return None
+
+        try:
+            data, pttl = client.pipeline(transaction=False).get(key).pttl(key).execute()
+        except CONNECTION_ERRORS:
+            _mark_unavailable()
+            CACHE_LOOKUPS.inc("error")
+            return None
+        except redis.RedisError:
+            CACHE_LOOKUPS.inc("error")
+            return None
+        if data is None:
+            CACHE_LOOKUPS.inc("miss")
+            return None
+        CACHE_LOOKUPS.inc("redis_hit")
+        local_cache.set(key, data, _local_ttl(pttl))
 
     try:
-        data = redis_client.get(key)
-        if data:
-            return json.loads(data)
-        return None
-    except (redis.RedisError, json.JSONDecodeError):
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
         return None
 
 
-def cache_set(key: str, value: Any, expire: int = 300) -> bool:
+def cache_set(
+    key: str, value: Any, expire: int = 300, tags: Iterable[str] = ()
+) -> bool:
     """
     Set value in cache with expiration time in seconds.
+
+    The key is added to the set of each tag so cache_invalidate_tags can
+    remove it later. Tag sets live at least as long as their longest entry.
     Returns True if successful, False otherwise.
     """
-    if not redis_client:
+    try:
+        data = orjson.dumps(value)
+    except TypeError:
+        return False
+
+    client = _client()
+    if not client:
         return False
 
     try:
-        serialized = json.dumps(value)
-        redis_client.setex(key, expire, serialized)
-        return True
-    except (redis.RedisError, TypeError, json.JSONEncodeError):
+        pipe = client.pipeline(transaction=False)
+        _queue_set(pipe, key, data, expire, tags)
+        pipe.execute()
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
         return False
+    except redis.RedisError:
+        return False
+
+    local_cache.set(key, data, expire)
+    return True
 
 
 def cache_delete(key: str) -> bool:
@@ -64,38 +269,196 @@ def cache_delete(key: str) -> bool:
     Delete key from cache.
     Returns True if key was deleted, False otherwise.
     """
-    if not redis_client:
+    local_cache.delete(key)
+    client = _client()
+    if not client:
         return False
 
     try:
-        redis_client.delete(key)
+        pipe = client.pipeline(transaction=False)
+        pipe.delete(key)
+        pipe.publish(INVALIDATION_CHANNEL, _invalidation([key]))
+        pipe.execute()
         return True
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
+        return False
     except redis.RedisError:
         return False
 
 
+def cache_invalidate_tags(*tags: str, fallback_pattern: Optional[str] = None) -> int:
+    """
+    Delete every entry registered under any of the tags.
+
+    Work is proportional to the number of tagged entries. Keys are popped
+    from the tag sets in batches, so entries tagged while invalidation runs
+    are either deleted or left in the set for the next invalidation.
+
+    If none of the tag sets exist (e.g. entries were cached without tags)
+    and a fallback pattern is given, matching keys are cleared with SCAN.
+    Returns number of keys deleted.
+    """
+    client = _client()
+    if not client:
+        return 0
+
+    try:
+        tag_keys = [TAG_PREFIX + tag for tag in tags]
+        if fallback_pattern and tag_keys and not client.exists(*tag_keys):
+            return cache_clear_pattern(fallback_pattern)
+
+        deleted = 0
+        for tag_key in tag_keys:
+            while True:
+                keys = [
+                    _key_str(k) for k in client.spop(tag_key, INVALIDATE_BATCH_SIZE)
+                ]
+                if not keys:
+                    break
+                local_cache.delete(*keys)
+                pipe = client.pipeline(transaction=False)
+                pipe.unlink(*keys)
+                pipe.publish(INVALIDATION_CHANNEL, _invalidation(keys))
+                deleted += pipe.execute()[0]
+        return deleted
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
+        return 0
+    except redis.RedisError:
+        return 0
+
+
 def cache_clear_pattern(pattern: str) -> int:
     """
     Delete all keys matching pattern.
+
+    Uses incremental SCAN rather than KEYS, so Redis keeps serving other
+    clients while a large keyspace is walked. Prefer cache_invalidate_tags.
     Returns number of keys deleted.
     """
-    if not redis_client:
+    local_cache.delete_matching(pattern)
+    client = _client()
+    if not client:
         return 0
 
     try:
-        keys = redis_client.keys(pattern)
-        if keys:
-            return redis_client.delete(*keys)
+        deleted = 0
+        batch = []
+        for key in client.scan_iter(match=pattern, count=INVALIDATE_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= INVALIDATE_BATCH_SIZE:
+                deleted += client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += client.unlink(*batch)
+        client.publish(INVALIDATION_CHANNEL, _invalidation(pattern=pattern))
+        return deleted
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
         return 0
     except redis.RedisError:
         return 0
 
 
+def cache_lock_acquire(name: str, timeout: float) -> Optional[str]:
+    """
+    Try to take a lock shared by all workers.
+
+    The lock expires after timeout seconds in case its holder dies.
+    Returns a token for cache_lock_release if acquired, None if another
+    worker holds the lock or Redis is unavailable.
+    """
+    client = _client()
+    if not client:
+        return None
+
+    token = uuid.uuid4().hex
+    try:
+        if client.set(LOCK_PREFIX + name, token, nx=True, px=int(timeout * 1000)):
+            return token
+        return None
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
+        return None
+    except redis.RedisError:
+        return None
+
+
+def cache_lock_held(name: str) -> bool:
+    """
+    Check whether any worker holds a lock.
+    Returns False if Redis is unavailable.
+    """
+    client = _client()
+    if not client:
+        return False
+
+    try:
+        return bool(client.exists(LOCK_PREFIX + name))
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
+        return False
+    except redis.RedisError:
+        return False
+
+
+def cache_lock_release(name: str, token: str) -> None:
+    """Release a lock taken with cache_lock_acquire, unless it expired"""
+    client = _client()
+    if not client:
+        return
+
+    try:
+        client.eval(RELEASE_LOCK_SCRIPT, 1, LOCK_PREFIX + name, token)
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
+    except redis.RedisError:
+        pass
+
+
+def cache_flag_set(name: str, ttl: float) -> bool:
+    """
+    Set a marker visible to every worker for ttl seconds.
+    Returns True if successful, False if Redis is unavailable.
+    """
+    client = _client()
+    if not client or ttl <= 0:
+        return False
+
+    try:
+        client.set(FLAG_PREFIX + name, b"1", px=int(ttl * 1000))
+        return True
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
+        return False
+    except redis.RedisError:
+        return False
+
+
+def cache_flag_exists(name: str) -> bool:
+    """
+    Check whether a marker set with cache_flag_set is still live.
+    Returns False if Redis is unavailable.
+    """
+    client = _client()
+    if not client:
+        return False
+
+    try:
+        return bool(client.exists(FLAG_PREFIX + name))
+    except CONNECTION_ERRORS:
+        _mark_unavailable()
+        return False
+    except redis.RedisError:
+        return False
+
+
 def is_cache_available() -> bool:
     """
     Check if Redis cache is available.
     """
-    if not redis_client:
+    if redis_client is None:
         return False
 
     try:
@@ -103,3 +466,197 @@ def is_cache_available() -> bool:
         return True
     except redis.RedisError:
         return False
+
+
+def _key_str(key) -> str:
+    return key.decode() if isinstance(key, bytes) else key
+
+
+class InvalidationListener:
+    """
+    Background thread applying other workers' invalidations to the local
+    cache. The local cache is only enabled while subscribed; it is cleared
+    on every (re)subscribe, since messages may have been missed.
+    """
+
+    def __init__(self):
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="cache-invalidation", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        local_cache.enabled = False
+        local_cache.clear()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = redis.Redis(**_connection_kwargs()).pubsub(
+                    ignore_subscribe_messages=True
+                )
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                local_cache.clear()
+                local_cache.enabled = True
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message is not None:
+                        handle_invalidation(message["data"])
+            except redis.RedisError:
+                pass
+            finally:
+                local_cache.enabled = False
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except redis.RedisError:
+                        pass
+            self._stop.wait(settings.CACHE_RECONNECT_SECONDS)
+
+
+invalidation_listener = InvalidationListener()
+
+
+class AsyncCache:
+    """
+    Async counterpart of the module helpers for async handlers.
+
+    Shares the local cache and invalidation channel with the sync helpers.
+    A client is created per event loop, since redis.asyncio connections
+    cannot be shared between loops.
+    """
+
+    def __init__(self):
+        self._client: Optional[aioredis.Redis] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> Optional[aioredis.Redis]:
+        if not _redis_available():
+            return None
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = aioredis.Redis(**_connection_kwargs())
+            self._loop = loop
+        return self._client
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value from cache; None if missing or Redis is unavailable"""
+        data = local_cache.get(key)
+        if data is not None:
+            CACHE_LOOKUPS.inc("local_hit")
+        else:
+            client = self._get_client()
+            if not client:
+                CACHE_LOOKUPS.inc("error")
+                return None
+
+            try:
+                data, pttl = (
+                    await client.pipeline(transaction=False)
+                    .get(key)
+                    .pttl(key)
+                    .execute()
+                )
+            except CONNECTION_ERRORS:
+                _mark_unavailable()
+                CACHE_LOOKUPS.inc("error")
+                return None
+            except redis.RedisError:
+                CACHE_LOOKUPS.inc("error")
+                return None
+            if data is None:
+                CACHE_LOOKUPS.inc("miss")
+                return None
+            CACHE_LOOKUPS.inc("redis_hit")
+            local_cache.set(key, data, _local_ttl(pttl))
+
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return None
+
+    async def set(
+        self, key: str, value: Any, expire: int = 300, tags: Iterable[str] = ()
+    ) -> bool:
+        """Set value in cache; see cache_set"""
+        try:
+            data = orjson.dumps(value)
+        except TypeError:
+            return False
+
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            _queue_set(pipe, key, data, expire, tags)
+            await pipe.execute()
+        except CONNECTION_ERRORS:
+            _mark_unavailable()
+            return False
+        except redis.RedisError:
+            return False
+
+        local_cache.set(key, data, expire)
+        return True
+
+    async def delete(self, key: str) -> bool:
+        """Delete key from cache; see cache_delete"""
+        local_cache.delete(key)
+        client = self._get_client()
+        if not client:
+            return False
+
+        try:
+            pipe = client.pipeline(transaction=False)
+            pipe.delete(key)
+            pipe.publish(INVALIDATION_CHANNEL, _invalidation([key]))
+            await pipe.execute()
+            return True
+        except CONNECTION_ERRORS:
+            _mark_unavailable()
+            return False
+        except redis.RedisError:
+            return False
+
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Delete every entry registered under any of the tags"""
+        client = self._get_client()
+        if not client:
+            return 0
+
+        try:
+            deleted = 0
+            for tag in tags:
+                while True:
+                    popped = await client.spop(TAG_PREFIX + tag, INVALIDATE_BATCH_SIZE)
+                    keys: List[str] = [_key_str(k) for k in popped or ()]
+                    if not keys:
+                        break
+                    local_cache.delete(*keys)
+                    pipe = client.pipeline(transaction=False)
+                    pipe.unlink(*keys)
+                    pipe.publish(INVALIDATION_CHANNEL, _invalidation(keys))
+                    deleted += (await pipe.execute())[0]
+            return deleted
+        except CONNECTION_ERRORS:
+            _mark_unavailable()
+            return 0
+        except redis.RedisError:
+            return 0
+
+
+async_cache = AsyncCache()
@@ -0,0 +1,68 @@
+"""
+Cheap validators for conditional GETs of per-user API resources
+"""
+
+from typing import Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from app.utils.data_version import DataVersions
+from app.utils.export_cache import etag_matches, make_etag
+
+# Clients may store the response but must revalidate it with If-None-Match
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+def resource_etag(
+    request: Request,
+    kind: str,
+    versions: DataVersions,
+    families: Iterable[str],
+    *parts,
+) -> str:
+    """
+    Build the ETag of a per-user resource from the user's data versions.
+
+    The counters are bumped in the same transaction as every write, so the
+    ETag changes whenever a covered row is added, updated or removed, no
+    matter in which order concurrent writers commit. The query parameters
+    are included so each filter / page gets its own validator.
+
+    Args:
+        request: Current request
+        kind: Resource kind, e.g. "watch-list"
+        versions: The user's data versions, read before the resource
+        families: Data version families the resource is built from
+        *parts: Anything else the content depends on, e.g. a resource id or
+            the reference data ETag for embedded brand names
+
+    Returns:
+        Quoted ETag string
+    """
+    params = sorted(request.query_params.multi_items())
+    return make_etag(versions.etag(kind, *families), *parts, params)
+
+
+def not_modified(
+    if_none_match: Optional[str], etag: str, response: Response
+) -> Optional[Response]:
+    """
+    Answer a conditional GET.
+
+    Returns a 304 response when the client's copy is current; otherwise sets
+    the validator headers on the outgoing response and returns None.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the resource
+        response: Response the endpoint's result will be rendered into
+
+    Returns:
+        304 response, or None if the full response should be sent
+    """
+    headers = {"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
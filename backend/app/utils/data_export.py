@@ -0,0 +1,149 @@
+"""
+Machine-readable (CSV / JSON lines) serialization for watch exports
+"""
+
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, List, Sequence
+from uuid import UUID
+
+from sqlalchemy import inspect
+
+EXPORT_FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Watch columns in export order; names match the bulk import columns
+WATCH_EXPORT_COLUMNS = [
+    "id",
+    "brand",
+    "brand_id",
+    "model",
+    "reference_number",
+    "serial_number",
+    "collection",
+    "collection_id",
+    "movement_type",
+    "movement_type_id",
+    "purchase_date",
+    "retailer",
+    "purchase_price",
+    "purchase_currency",
+    "case_diameter",
+    "case_thickness",
+    "lug_width",
+    "water_resistance",
+    "power_reserve",
+    "complications",
+    "condition",
+    "current_market_value",
+    "current_market_currency",
+    "last_value_update",
+    "notes",
+    "created_at",
+    "updated_at",
+]
+
+# Rows buffered before a chunk is handed to the response
+ROWS_PER_CHUNK = 100
+
+
+def to_json_value(value: Any) -> Any:
+    """Convert a database value to a JSON-compatible value"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def model_to_dict(obj, exclude: Sequence[str] = ()) -> dict:
+    """Serialize an ORM object's column attributes"""
+    return {
+        attr.key: to_json_value(getattr(obj, attr.key))
+        for attr in inspect(obj).mapper.column_attrs
+        if attr.key not in exclude
+    }
+
+
+def watch_to_export_dict(watch, include: Iterable[str] = ()) -> dict:
+    """
+    Serialize a watch and, optionally, its history relationships.
+
+    Args:
+        watch: Watch with brand, collection and movement type loaded
+        include: Names of history relationships to add (e.g. "market_values")
+
+    Returns:
+        JSON-compatible dictionary
+    """
+    data = model_to_dict(watch, exclude=("user_id",))
+    data["brand"] = watch.brand.name if watch.brand else None
+    data["collection"] = watch.collection.name if watch.collection else None
+    data["movement_type"] = watch.movement_type.name if watch.movement_type else None
+
+    export = {column: data.get(column) for column in WATCH_EXPORT_COLUMNS}
+    for relationship in include:
+        export[relationship] = [
+            model_to_dict(record, exclude=("watch_id",))
+            for record in getattr(watch, relationship)
+        ]
+    return export
+
+
+def iter_ndjson(records: Iterable[dict]) -> Iterator[bytes]:
+    """
+    Encode records as JSON lines, a chunk of rows at a time.
+
+    Yields:
+        UTF-8 encoded chunks
+    """
+    lines = []
+    for record in records:
+        lines.append(json.dumps(record, separators=(",", ":")))
+        if len(lines) >= ROWS_PER_CHUNK:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        # Complications use the same separator the importer accepts
+        return ";".join(value)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, separators=(",", ":"))
+    return value
+
+
+def iter_csv(records: Iterable[dict], columns: List[str]) -> Iterator[bytes]:
+    """
+    Encode records as CSV with a header row, a chunk of rows at a time.
+
+    Nested history lists are written as JSON in their own column.
+
+    Yields:
+        UTF-8 encoded chunks
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+
+    rows = 0
+    for record in records:
+        writer.writerow([_csv_cell(record.get(column)) for column in columns])
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
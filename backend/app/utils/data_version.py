@@ -0,0 +1,86 @@
+"""
+Per-user data version counters for cache keys and validators
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.data_version import (
+    DATA_VERSION_FAMILIES,
+    UserDataVersion,
+    increment_data_versions,
+)
+from app.utils.export_cache import make_etag
+
+
+@dataclass(frozen=True)
+class DataVersions:
+    """Snapshot of a user's data version counters"""
+
+    user_id: UUID
+    watches: int = 0
+    images: int = 0
+    values: int = 0
+    readings: int = 0
+    services: int = 0
+    collections: int = 0
+
+    def token(self, *families: str) -> str:
+        """
+        Build a version token covering the given families (default all).
+
+        The token changes whenever data in any of the families changes, e.g.
+        token("watches", "images") -> "watches12.images3".
+        """
+        families = families or DATA_VERSION_FAMILIES
+        return ".".join(f"{family}{getattr(self, family)}" for family in families)
+
+    def cache_key(self, prefix: str, *families: str) -> str:
+        """Build a cache key scoped to the user and the given families"""
+        return f"{prefix}:{self.user_id}:{self.token(*families)}"
+
+    def etag(self, kind: str, *families: str) -> str:
+        """Build an ETag scoped to the user and the given families"""
+        return make_etag(kind, self.user_id, self.token(*families))
+
+
+def load_data_versions(db: Session, user_id: UUID) -> DataVersions:
+    """
+    Read a user's data versions with a single primary key lookup.
+
+    Read them before the data they validate: a concurrent write commits its
+    rows and its version bump together, so data read afterwards is never
+    older than the versions.
+
+    Args:
+        db: Database session
+        user_id: User to read
+
+    Returns:
+        Current versions (all zero if the user has never written data)
+    """
+    row = (
+        db.query(*(getattr(UserDataVersion, f) for f in DATA_VERSION_FAMILIES))
+        .filter(UserDataVersion.user_id == user_id)
+        .first()
+    )
+    if row is None:
+        return DataVersions(user_id=user_id)
+    return DataVersions(user_id=user_id, **row._asdict())
+
+
+def bump_data_versions(db: Session, user_id: UUID, *families: str) -> None:
+    """
+    Bump a user's data versions after bulk statements.
+
+    ORM flushes bump the versions automatically; Core insert/update/delete
+    statements bypass the flush and must call this instead.
+
+    Args:
+        db: Database session in the writing transaction
+        user_id: User whose data changed
+        *families: Names from DATA_VERSION_FAMILIES
+    """
+    increment_data_versions(db, user_id, families)
@@ -0,0 +1,185 @@
+"""
+Size-bounded disk cache for rendered exports
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from app.config import settings
+
+# Eviction frees space down to this fraction of the limit, so a full cache
+# rescans its directory once per that much new content rather than every put
+EVICT_TO_FRACTION = 0.9
+
+# Other workers write to the same directory unseen, so the tracked size is
+# resynced from disk at least this often
+RESCAN_SECONDS = 300
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from the parts that determine a response's content.
+
+    Args:
+        *parts: Values identifying the content (kind, user, params, fingerprint)
+
+    Returns:
+        Quoted ETag string
+    """
+    digest = hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client already has this representation
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+
+    return False
+
+
+class ExportCache:
+    """
+    Disk cache for rendered export files, evicting least recently used entries.
+
+    Entries are addressed by ETag, so a changed fingerprint simply produces a
+    new entry and stale ones age out once the size limit is reached.
+
+    The total size is tracked as entries are written, so the directory is
+    only scanned when the limit is crossed or the tracked size is due a
+    resync (see RESCAN_SECONDS).
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # Unknown until the first scan
+        self._scanned_at = 0.0
+
+    def path_for(self, etag: str) -> Path:
+        """Get the cache file path for an ETag"""
+        name = etag.strip('"')
+        return Path(self.directory) / name[:2] / name
+
+    def get(self, etag: str) -> Optional[Path]:
+        """
+        Get the cached file for an ETag, marking it as recently used.
+
+        Returns:
+            Path to the cached file, or None on a miss
+        """
+        path = self.path_for(etag)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, etag: str, source: BinaryIO) -> Path:
+        """
+        Store a rendered file under an ETag.
+
+        Args:
+            etag: ETag of the content
+            source: Binary file object positioned at the start of the content
+
+        Returns:
+            Path to the cached file
+        """
+        path = self.path_for(etag)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so readers never see partial content
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                shutil.copyfileobj(source, tmp)
+                size = tmp.tell()
+            try:
+                replaced = path.stat().st_size
+            except OSError:
+                replaced = 0
+            os.replace(tmp_name, path)
+        except Exception:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+        with self._lock:
+            if self._size is not None:
+                self._size += size - replaced
+            needs_scan = (
+                self._size is None
+                or self._size > self.max_bytes
+                or time.monotonic() - self._scanned_at > RESCAN_SECONDS
+            )
+        if needs_scan:
+            self.evict()
+        return path
+
+    def evict(self) -> int:
+        """
+        Scan the cache and, when it is over its size limit, delete least
+        recently used entries down to EVICT_TO_FRACTION of the limit.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            entries = []
+            total = 0
+            for path in Path(self.directory).glob("*/*"):
+                if path.name.startswith(".tmp-"):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            deleted = 0
+            if total > self.max_bytes:
+                target = self.max_bytes * EVICT_TO_FRACTION
+                for _, size, path in sorted(entries, key=lambda e: e[0]):
+                    if total <= target:
+                        break
+                    try:
+                        path.unlink()
+                        total -= size
+                        deleted += 1
+                    except OSError:
+                        pass
+
+            self._size = total
+            self._scanned_at = time.monotonic()
+            return deleted
+
+
+export_cache = ExportCache(settings.EXPORT_CACHE_DIR, settings.EXPORT_CACHE_MAX_BYTES)
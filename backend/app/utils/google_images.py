@@ -8,6 +8,8 @@ import httpx
 from bs4 import BeautifulSoup
 from PIL import Image
 
+from app.utils.metrics import AsyncInstrumentedTransport, InstrumentedTransport
+
 
 def fetch_watch_images(
     brand: str,
@@ -121,7 +123,11 @@ def _scrape_google_images(query: str, limit: int) -> List[str]:
 
     try:
         # Make request to Google Images
-        with httpx.Client(timeout=30.0, follow_redirects=True) as client:
+        with httpx.Client(
+            timeout=30.0,
+            follow_redirects=True,
+            transport=InstrumentedTransport("google-images"),
+        ) as client:
             response = client.get(search_url, headers=headers)
             response.raise_for_status()
 
@@ -191,7 +197,11 @@ def _download_and_process_image(
     """
     try:
         # Download image with timeout
-        with httpx.Client(timeout=30.0, follow_redirects=True) as client:
+        with httpx.Client(
+            timeout=30.0,
+            follow_redirects=True,
+            transport=InstrumentedTransport("image-download"),
+        ) as client:
             response = client.get(url)
             response.raise_for_status()
 
@@ -268,7 +278,9 @@ async def fetch_watch_images_from_urls(
 
     image_metadata = []
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with httpx.AsyncClient(
+        timeout=30.0, transport=AsyncInstrumentedTransport("image-download")
+    ) as client:
         for idx, url in enumerate(urls):
             try:
                 # Download image
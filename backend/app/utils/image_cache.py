@@ -0,0 +1,142 @@
+"""
+Print-resolution image cache for PDF exports
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image as PILImage
+
+# Images are printed at most 4 inches wide; 300 DPI is print quality
+PRINT_MAX_PIXELS = 1200
+PRINT_JPEG_QUALITY = 85
+
+
+def print_cache_dir_for(upload_dir: str) -> Path:
+    """
+    Get the print cache directory that sits next to an upload directory.
+
+    Args:
+        upload_dir: Base directory for uploads (e.g. /app/storage/uploads)
+
+    Returns:
+        Path to the print cache directory (e.g. /app/storage/cache/print)
+    """
+    return Path(upload_dir).parent / "cache" / "print"
+
+
+def print_image_cache_path(file_path: str, upload_dir: str) -> Path:
+    """
+    Get the cached print rendition path for an uploaded image.
+
+    The cache mirrors the upload layout, so each WatchImage (identified by its
+    relative file path) has exactly one rendition.
+
+    Args:
+        file_path: Relative path of the image (e.g. "watch_id/filename.png")
+        upload_dir: Base directory for uploads
+
+    Returns:
+        Path of the JPEG rendition
+    """
+    return print_cache_dir_for(upload_dir) / f"{file_path}.jpg"
+
+
+def render_print_image(
+    source: Path,
+    destination: Path,
+    max_pixels: int = PRINT_MAX_PIXELS,
+    quality: int = PRINT_JPEG_QUALITY,
+) -> None:
+    """
+    Downscale an image to print resolution and save it as a JPEG.
+
+    Args:
+        source: Path to the original image
+        destination: Path to write the JPEG rendition to
+        max_pixels: Maximum width and height of the rendition
+        quality: JPEG quality
+    """
+    with PILImage.open(source) as img:
+        # Let the JPEG decoder skip detail we are about to throw away
+        img.draft("RGB", (max_pixels, max_pixels))
+
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            background = PILImage.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel("A"))
+            img = background
+        elif img.mode != "RGB":
+            img = img.convert("RGB")
+
+        img.thumbnail((max_pixels, max_pixels), PILImage.LANCZOS)
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically so concurrent exports never read a partial file;
+        # the temporary name is unique per call, not just per process
+        fd, tmp_name = tempfile.mkstemp(
+            dir=destination.parent, prefix=f".{destination.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                img.save(tmp, format="JPEG", quality=quality, optimize=True)
+            os.replace(tmp_name, destination)
+        except Exception:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+
+def get_print_image(file_path: str, upload_dir: str) -> Optional[str]:
+    """
+    Get a print-resolution rendition of an uploaded image, creating it if needed.
+
+    Renditions are regenerated when the original is newer than the cached
+    copy. If the rendition cannot be produced the original path is returned.
+
+    Args:
+        file_path: Relative path of the image (e.g. "watch_id/filename.png")
+        upload_dir: Base directory for uploads
+
+    Returns:
+        Path to the image to embed, or None if the original does not exist
+    """
+    source = Path(upload_dir) / file_path
+    try:
+        source_mtime = source.stat().st_mtime
+    except OSError:
+        return None
+
+    cached = print_image_cache_path(file_path, upload_dir)
+    try:
+        if cached.stat().st_mtime >= source_mtime:
+            return str(cached)
+    except OSError:
+        pass
+
+    try:
+        render_print_image(source, cached)
+        return str(cached)
+    except Exception as e:
+        print(f"Failed to render print image for {file_path}: {e}")
+        return str(source)
+
+
+def delete_print_image(file_path: str, upload_dir: str) -> bool:
+    """
+    Delete the cached print rendition of an image.
+
+    Args:
+        file_path: Relative path of the image
+        upload_dir: Base directory for uploads
+
+    Returns:
+        True if a rendition was deleted, False otherwise
+    """
+    try:
+        print_image_cache_path(file_path, upload_dir).unlink()
+        return True
+    except OSError:
+        return False
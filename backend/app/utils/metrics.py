@@ -0,0 +1,362 @@
+"""
+In-process metrics exposed in the Prometheus text format
+
+Metrics are per worker process; Prometheus aggregates across workers when
+each is scraped (or sums the series by instance).
+"""
+
+import bisect
+import contextvars
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+
+import httpx
+
+LabelValues = Tuple[str, ...]
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers fast cached reads up to slow PDF renders
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Queries per request; N+1 regressions show up in the upper buckets
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """Base class for a named metric family with fixed label names"""
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._collect = collect
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, label_values: Sequence[str]) -> LabelValues:
+        if len(label_values) != len(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {self.label_names}, got {label_values}"
+            )
+        return tuple(str(v) for v in label_values)
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float]]:
+        if self._collect is not None:
+            values = self._collect()
+        else:
+            with self._lock:
+                values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield self.name, key, value
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for name, key, value in self.samples():
+            lines.append(
+                f"{name}{_format_labels(self.label_names, key)} {_format_value(value)}"
+            )
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing total"""
+
+    kind = "counter"
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        key = self._key(label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(self._key(label_values), 0.0)
+
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+
+    kind = "gauge"
+
+    def set(self, value: float, *label_values: str) -> None:
+        key = self._key(label_values)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        key = self._key(label_values)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, *label_values: str, amount: float = 1.0) -> None:
+        self.inc(*label_values, amount=-amount)
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(self._key(label_values), 0.0)
+
+
+class Histogram(Metric):
+    """Distribution of observations in cumulative buckets"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        key = self._key(label_values)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(self._key(label_values))
+        return int(sum(series[:-1])) if series else 0
+
+    def sum(self, *label_values: str) -> float:
+        series = self._series.get(self._key(label_values))
+        return series[-1] if series else 0.0
+
+    def samples(self) -> Iterable[Tuple[str, LabelValues, float]]:
+        with self._lock:
+            series = {key: list(values) for key, values in self._series.items()}
+        for key, values in sorted(series.items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), values[:-1]):
+                cumulative += count
+                yield f"{self.name}_bucket", key + (_format_value(bound),), cumulative
+            yield f"{self.name}_count", key, cumulative
+            yield f"{self.name}_sum", key, values[-1]
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        bucket_labels = self.label_names + ("le",)
+        for name, key, value in self.samples():
+            names = bucket_labels if name.endswith("_bucket") else self.label_names
+            lines.append(f"{name}{_format_labels(names, key)} {_format_value(value)}")
+        return lines
+
+
+M = TypeVar("M", bound=Metric)
+
+
+class Registry:
+    """Metric families rendered together for a scrape"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# HTTP server
+HTTP_REQUEST_DURATION = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Request latency by route template",
+        ["method", "route", "status"],
+    )
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.register(
+    Gauge(
+        "http_requests_in_flight",
+        "Requests currently being handled",
+        ["method"],
+    )
+)
+HTTP_REQUEST_DB_QUERIES = registry.register(
+    Histogram(
+        "http_request_db_queries",
+        "Database queries issued per request",
+        ["method", "route"],
+        buckets=QUERY_COUNT_BUCKETS,
+    )
+)
+HTTP_REQUEST_DB_SECONDS = registry.register(
+    Histogram(
+        "http_request_db_seconds",
+        "Cumulative database time per request",
+        ["method", "route"],
+    )
+)
+
+# Database
+DB_QUERIES = registry.register(
+    Counter("db_queries_total", "Database queries executed", ["engine"])
+)
+DB_QUERY_DURATION = registry.register(
+    Histogram("db_query_duration_seconds", "Database query latency", ["engine"])
+)
+DB_POOL_CHECKOUT_WAIT = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a pooled database connection",
+        ["engine"],
+    )
+)
+
+# Cache
+CACHE_LOOKUPS = registry.register(
+    Counter(
+        "cache_lookups_total",
+        "Cache reads by result (local_hit, redis_hit, miss, error)",
+        ["result"],
+    )
+)
+
+# Outbound HTTP
+OUTBOUND_HTTP_DURATION = registry.register(
+    Histogram(
+        "outbound_http_request_duration_seconds",
+        "Latency of requests to external services until response headers",
+        ["service", "method", "status"],
+    )
+)
+
+
+@dataclass
+class RequestStats:
+    """Database work attributed to the current request"""
+
+    db_queries: int = 0
+    db_seconds: float = 0.0
+
+
+# Set by the metrics middleware; copied into threadpool workers running sync
+# handlers, so queries made there are attributed to the request
+current_request_stats: contextvars.ContextVar[Optional[RequestStats]] = (
+    contextvars.ContextVar("current_request_stats", default=None)
+)
+
+
+def record_query(engine: str, seconds: float) -> None:
+    """Count a finished database query for the engine and current request"""
+    DB_QUERIES.inc(engine)
+    DB_QUERY_DURATION.observe(seconds, engine)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_seconds += seconds
+
+
+class InstrumentedTransport(httpx.BaseTransport):
+    """httpx transport recording latency to external services"""
+
+    def __init__(self, service: str, transport: Optional[httpx.BaseTransport] = None):
+        self.service = service
+        self._transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = self._transport.handle_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            OUTBOUND_HTTP_DURATION.observe(
+                time.perf_counter() - start, self.service, request.method, status
+            )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncInstrumentedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of InstrumentedTransport"""
+
+    def __init__(
+        self, service: str, transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.service = service
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = await self._transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            OUTBOUND_HTTP_DURATION.observe(
+                time.perf_counter() - start, self.service, request.method, status
+            )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
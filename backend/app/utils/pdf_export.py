@@ -1,8 +1,11 @@
 import os
+import tempfile
 from datetime import datetime
 from io import BytesIO
-from typing import List, Optional
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+from xml.sax.saxutils import escape
 
+from reportlab.graphics.shapes import Drawing, Rect
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.pagesizes import letter
@@ -18,6 +21,9 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+from app.utils.image_cache import get_print_image
+from app.utils.qr_code import qr_matrix
+
 
 def format_currency(amount: Optional[float], currency: str) -> str:
     """Format currency for display"""
@@ -91,9 +97,12 @@ def generate_watch_pdf(watch_data: dict, storage_path: str = "/app/storage") ->
         primary_image = next(
             (img for img in images if img.get("is_primary")), images[0]
         )
-        image_path = os.path.join(storage_path, "uploads", primary_image["file_path"])
+        # Embed a cached print-resolution rendition instead of the original
+        image_path = get_print_image(
+            primary_image["file_path"], os.path.join(storage_path, "uploads")
+        )
 
-        if os.path.exists(image_path):
+        if image_path:
             try:
                 img = Image(
                     image_path, width=4 * inch, height=4 * inch, kind="proportional"
@@ -338,29 +347,27 @@ def generate_watch_pdf(watch_data: dict, storage_path: str = "/app/storage") ->
     return buffer
 
 
-def generate_collection_pdf(
-    watches: List[dict],
-    collection_name: str = "My Collection",
-    storage_path: str = "/app/storage",
-) -> BytesIO:
-    """
-    Generate a PDF document for a collection of watches.
-
-    Args:
-        watches: List of watch data dictionaries
-        collection_name: Name of the collection
-        storage_path: Base path for uploaded images
+def _to_float(val) -> float:
+    """Convert value to float, handling strings and None"""
+    if val is None:
+        return 0
+    if isinstance(val, str):
+        try:
+            return float(val)
+        except ValueError:
+            return 0
+    return float(val)
 
-    Returns:
-        BytesIO buffer containing the PDF
-    """
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(
-        buffer, pagesize=letter, topMargin=0.5 * inch, bottomMargin=0.5 * inch
-    )
 
+def _collection_header_flowables(
+    collection_name: str,
+    total_watches: int,
+    total_purchase: float,
+    total_current: float,
+    styles,
+) -> list:
+    """Build the title and summary flowables for a collection PDF."""
     elements = []
-    styles = getSampleStyleSheet()
 
     # Title
     title_style = ParagraphStyle(
@@ -383,25 +390,10 @@ def generate_collection_pdf(
         spaceAfter=20,
         alignment=TA_CENTER,
     )
-    summary = Paragraph(f"Total Watches: {len(watches)}", subtitle_style)
+    summary = Paragraph(f"Total Watches: {total_watches}", subtitle_style)
     elements.append(summary)
     elements.append(Spacer(1, 0.3 * inch))
 
-    # Calculate total value
-    def to_float(val):
-        """Convert value to float, handling strings and None"""
-        if val is None:
-            return 0
-        if isinstance(val, str):
-            try:
-                return float(val)
-            except ValueError:
-                return 0
-        return float(val)
-
-    total_purchase = sum(to_float(w.get("purchase_price", 0)) for w in watches)
-    total_current = sum(to_float(w.get("current_market_value", 0)) for w in watches)
-
     if total_purchase > 0:
         summary_data = [
             ["Total Purchase Price:", f"USD {total_purchase:,.2f}"],
@@ -427,93 +419,101 @@ def generate_collection_pdf(
         elements.append(summary_table)
         elements.append(Spacer(1, 0.3 * inch))
 
-    # Watch list
-    for i, watch in enumerate(watches):
-        if i > 0:
-            elements.append(PageBreak())
+    return elements
 
-        # Generate individual watch content (without header/footer)
-        brand_name = watch.get("brand", {}).get("name", "Unknown")
-        model = watch.get("model", "Unknown Model")
 
-        heading_style = ParagraphStyle(
-            "WatchHeading",
-            parent=styles["Heading2"],
-            fontSize=18,
-            textColor=colors.HexColor("#1f2937"),
-            spaceAfter=20,
+def _collection_watch_flowables(watch: dict, styles, storage_path: str) -> list:
+    """Build the flowables for one watch section of a collection PDF."""
+    elements = []
+
+    # Generate individual watch content (without header/footer)
+    brand_name = (watch.get("brand") or {}).get("name", "Unknown")
+    model = watch.get("model", "Unknown Model")
+
+    heading_style = ParagraphStyle(
+        "WatchHeading",
+        parent=styles["Heading2"],
+        fontSize=18,
+        textColor=colors.HexColor("#1f2937"),
+        spaceAfter=20,
+    )
+    watch_title = Paragraph(f"{brand_name} {model}", heading_style)
+    elements.append(watch_title)
+
+    # Add watch image if available (full image list or list-view primary image)
+    images = watch.get("images") or (
+        [watch["primary_image"]] if watch.get("primary_image") else []
+    )
+    if images:
+        primary_image = next(
+            (img for img in images if img.get("is_primary")), images[0]
+        )
+        # Embed a cached print-resolution rendition instead of the original
+        image_path = get_print_image(
+            primary_image["file_path"], os.path.join(storage_path, "uploads")
         )
-        watch_title = Paragraph(f"{brand_name} {model}", heading_style)
-        elements.append(watch_title)
-
-        # Add watch image if available
-        images = watch.get("images", [])
-        if images:
-            primary_image = next(
-                (img for img in images if img.get("is_primary")), images[0]
-            )
-            image_path = os.path.join(
-                storage_path, "uploads", primary_image["file_path"]
-            )
 
-            if os.path.exists(image_path):
-                try:
-                    img = Image(
-                        image_path, width=3 * inch, height=3 * inch, kind="proportional"
-                    )
-                    img.hAlign = "CENTER"
-                    elements.append(img)
-                    elements.append(Spacer(1, 0.2 * inch))
-                except Exception:
-                    pass
-
-        # Watch details table
-        watch_data = []
-
-        if watch.get("reference_number"):
-            watch_data.append(["Reference:", watch["reference_number"]])
-        if watch.get("purchase_price"):
-            watch_data.append(
-                [
-                    "Purchase Price:",
-                    format_currency(
-                        watch["purchase_price"], watch.get("purchase_currency", "USD")
-                    ),
-                ]
-            )
-        if watch.get("current_market_value"):
-            watch_data.append(
+        if image_path:
+            try:
+                img = Image(
+                    image_path, width=3 * inch, height=3 * inch, kind="proportional"
+                )
+                img.hAlign = "CENTER"
+                elements.append(img)
+                elements.append(Spacer(1, 0.2 * inch))
+            except Exception:
+                pass
+
+    # Watch details table
+    watch_data = []
+
+    if watch.get("reference_number"):
+        watch_data.append(["Reference:", watch["reference_number"]])
+    if watch.get("purchase_price"):
+        watch_data.append(
+            [
+                "Purchase Price:",
+                format_currency(
+                    watch["purchase_price"], watch.get("purchase_currency", "USD")
+                ),
+            ]
+        )
+    if watch.get("current_market_value"):
+        watch_data.append(
+            [
+                "Current Value:",
+                format_currency(
+                    watch["current_market_value"],
+                    watch.get("current_market_currency", "USD"),
+                ),
+            ]
+        )
+    if watch.get("purchase_date"):
+        watch_data.append(["Purchase Date:", format_date(watch["purchase_date"])])
+
+    if watch_data:
+        details_table = Table(watch_data, colWidths=[2 * inch, 3.5 * inch])
+        details_table.setStyle(
+            TableStyle(
                 [
-                    "Current Value:",
-                    format_currency(
-                        watch["current_market_value"],
-                        watch.get("current_market_currency", "USD"),
-                    ),
+                    ("FONT", (0, 0), (0, -1), "Helvetica-Bold"),
+                    ("FONT", (1, 0), (-1, -1), "Helvetica"),
+                    ("FONTSIZE", (0, 0), (-1, -1), 10),
+                    ("TEXTCOLOR", (0, 0), (0, -1), colors.HexColor("#6b7280")),
+                    ("TEXTCOLOR", (1, 0), (-1, -1), colors.HexColor("#374151")),
+                    ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                    ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+                    ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
                 ]
             )
-        if watch.get("purchase_date"):
-            watch_data.append(["Purchase Date:", format_date(watch["purchase_date"])])
-
-        if watch_data:
-            details_table = Table(watch_data, colWidths=[2 * inch, 3.5 * inch])
-            details_table.setStyle(
-                TableStyle(
-                    [
-                        ("FONT", (0, 0), (0, -1), "Helvetica-Bold"),
-                        ("FONT", (1, 0), (-1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 10),
-                        ("TEXTCOLOR", (0, 0), (0, -1), colors.HexColor("#6b7280")),
-                        ("TEXTCOLOR", (1, 0), (-1, -1), colors.HexColor("#374151")),
-                        ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-                    ]
-                )
-            )
-            elements.append(details_table)
+        )
+        elements.append(details_table)
 
-    # Footer
-    elements.append(Spacer(1, 0.3 * inch))
+    return elements
+
+
+def _collection_footer_flowables(styles) -> list:
+    """Build the footer flowables for a collection PDF."""
     footer_style = ParagraphStyle(
         "Footer",
         parent=styles["Normal"],
@@ -525,9 +525,342 @@ def generate_collection_pdf(
         f"Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')} by Watch Collection Tracker",
         footer_style,
     )
-    elements.append(footer)
+    return [Spacer(1, 0.3 * inch), footer]
+
+
+def generate_collection_pdf(
+    watches: List[dict],
+    collection_name: str = "My Collection",
+    storage_path: str = "/app/storage",
+) -> BytesIO:
+    """
+    Generate a PDF document for a collection of watches.
+
+    Args:
+        watches: List of watch data dictionaries
+        collection_name: Name of the collection
+        storage_path: Base path for uploaded images
+
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, pagesize=letter, topMargin=0.5 * inch, bottomMargin=0.5 * inch
+    )
+
+    styles = getSampleStyleSheet()
+
+    # Calculate total value
+    total_purchase = sum(_to_float(w.get("purchase_price", 0)) for w in watches)
+    total_current = sum(_to_float(w.get("current_market_value", 0)) for w in watches)
+
+    elements = _collection_header_flowables(
+        collection_name, len(watches), total_purchase, total_current, styles
+    )
+
+    # Watch list
+    for i, watch in enumerate(watches):
+        if i > 0:
+            elements.append(PageBreak())
+        elements.extend(_collection_watch_flowables(watch, styles, storage_path))
+
+    elements.extend(_collection_footer_flowables(styles))
 
     # Build PDF
     doc.build(elements)
     buffer.seek(0)
     return buffer
+
+
+class _LazyFlowables(list):
+    """
+    Flowable list that is refilled from an iterator as reportlab consumes it.
+
+    ``BaseDocTemplate.build`` checks ``len(flowables)`` before handling each
+    flowable and deletes it from the front once drawn, so only a small window
+    of flowables (and the watch data behind them) is alive at any time.
+    """
+
+    def __init__(self, chunks: Iterator[list], lookahead: int = 16):
+        super().__init__()
+        self._chunks = chunks
+        self._lookahead = lookahead
+
+    def __len__(self) -> int:
+        while list.__len__(self) < self._lookahead:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self.extend(chunk)
+        return list.__len__(self)
+
+
+def generate_collection_pdf_stream(
+    watches: Iterable[dict],
+    collection_name: str,
+    total_watches: int,
+    total_purchase: float,
+    total_current: float,
+    storage_path: str = "/app/storage",
+    spool_max_size: int = 8 * 1024 * 1024,
+) -> BinaryIO:
+    """
+    Generate a collection PDF from an iterator of watches with bounded memory.
+
+    Watches are consumed lazily while the document is laid out, and the output
+    is written to a temporary file that spills to disk once it exceeds
+    ``spool_max_size`` bytes. Collection totals are passed in (typically from a
+    SQL aggregate) because the watches are only seen once.
+
+    Args:
+        watches: Iterable of watch data dictionaries, consumed once
+        collection_name: Name of the collection
+        total_watches: Number of watches in the collection
+        total_purchase: Sum of purchase prices
+        total_current: Sum of current market values
+        storage_path: Base path for uploaded images
+        spool_max_size: Bytes kept in memory before spooling to disk
+
+    Returns:
+        File object positioned at the start of the PDF
+    """
+    output = tempfile.SpooledTemporaryFile(max_size=spool_max_size)
+    doc = SimpleDocTemplate(
+        output, pagesize=letter, topMargin=0.5 * inch, bottomMargin=0.5 * inch
+    )
+
+    styles = getSampleStyleSheet()
+
+    def chunks() -> Iterator[list]:
+        yield _collection_header_flowables(
+            collection_name, total_watches, total_purchase, total_current, styles
+        )
+        for i, watch in enumerate(watches):
+            section = [PageBreak()] if i > 0 else []
+            section.extend(_collection_watch_flowables(watch, styles, storage_path))
+            yield section
+        yield _collection_footer_flowables(styles)
+
+    try:
+        doc.build(_LazyFlowables(chunks()))
+    except Exception:
+        output.close()
+        raise
+
+    output.seek(0)
+    return output
+
+
+def iter_file_chunks(file: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Yield a file's contents in chunks and close it when exhausted.
+
+    Args:
+        file: Open binary file object
+        chunk_size: Number of bytes per chunk
+
+    Returns:
+        Iterator of byte chunks suitable for a StreamingResponse
+    """
+    try:
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file.close()
+
+
+def render_collection_chunk(
+    watches: List[dict],
+    collection_name: str,
+    totals: Optional[tuple] = None,
+    include_footer: bool = False,
+    storage_path: str = "/app/storage",
+) -> bytes:
+    """
+    Render a contiguous run of watch sections as a standalone PDF.
+
+    Chunks are rendered independently (e.g. in worker processes) and then
+    concatenated, so the first chunk carries the collection header and the
+    last one the footer.
+
+    Args:
+        watches: Watch data dictionaries for this chunk
+        collection_name: Name of the collection
+        totals: (total_watches, total_purchase, total_current) for the header
+            chunk, or None for chunks without a header
+        include_footer: Whether this is the final chunk
+        storage_path: Base path for uploaded images
+
+    Returns:
+        PDF bytes
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, pagesize=letter, topMargin=0.5 * inch, bottomMargin=0.5 * inch
+    )
+
+    styles = getSampleStyleSheet()
+    elements = []
+
+    if totals is not None:
+        elements.extend(_collection_header_flowables(collection_name, *totals, styles))
+
+    for i, watch in enumerate(watches):
+        if i > 0:
+            elements.append(PageBreak())
+        elements.extend(_collection_watch_flowables(watch, styles, storage_path))
+
+    if include_footer:
+        elements.extend(_collection_footer_flowables(styles))
+
+    doc.build(elements)
+    return buffer.getvalue()
+
+
+def render_watch_pdf_bytes(
+    watch_data: dict, storage_path: str = "/app/storage"
+) -> bytes:
+    """
+    Render a single watch PDF and return its bytes.
+
+    Args:
+        watch_data: Watch data dictionary from database
+        storage_path: Base path for uploaded images
+
+    Returns:
+        PDF bytes
+    """
+    return generate_watch_pdf(watch_data, storage_path).getvalue()
+
+
+# Label sheet layout: 3 x 4 labels per letter page
+LABEL_COLUMNS = 3
+LABEL_WIDTH = 2.5 * inch
+LABEL_HEIGHT = 2.4 * inch
+LABEL_QR_SIZE = 1.6 * inch
+
+
+def qr_drawing(data: str, size: float) -> Drawing:
+    """
+    Build a vector QR code for embedding in a PDF.
+
+    Dark modules are drawn as filled rectangles (adjacent modules in a row are
+    merged), so the code stays sharp at any print resolution.
+
+    Args:
+        data: The data to encode in the QR code
+        size: Width and height of the drawing in points
+
+    Returns:
+        Drawing containing the QR code
+    """
+    matrix = qr_matrix(data)
+    module = size / len(matrix)
+    drawing = Drawing(size, size)
+
+    for row_index, row in enumerate(matrix):
+        # PDF coordinates grow upwards, the matrix grows downwards
+        y = size - (row_index + 1) * module
+        start = None
+        for col_index, dark in enumerate(row + (False,)):
+            if dark and start is None:
+                start = col_index
+            elif not dark and start is not None:
+                drawing.add(
+                    Rect(
+                        start * module,
+                        y,
+                        (col_index - start) * module,
+                        module,
+                        fillColor=colors.black,
+                        strokeColor=None,
+                    )
+                )
+                start = None
+
+    return drawing
+
+
+def generate_qr_label_sheet(labels: List[dict], title: Optional[str] = None) -> BytesIO:
+    """
+    Generate a printable sheet of QR code labels.
+
+    Args:
+        labels: Label dictionaries with "qr_data" (the encoded URL), "title"
+            and an optional "subtitle"
+        title: Optional heading printed above the labels
+
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        topMargin=0.5 * inch,
+        bottomMargin=0.5 * inch,
+        leftMargin=0.5 * inch,
+        rightMargin=0.5 * inch,
+    )
+
+    styles = getSampleStyleSheet()
+    label_title_style = ParagraphStyle(
+        "LabelTitle",
+        parent=styles["Normal"],
+        fontSize=9,
+        leading=11,
+        fontName="Helvetica-Bold",
+        alignment=TA_CENTER,
+    )
+    label_subtitle_style = ParagraphStyle(
+        "LabelSubtitle",
+        parent=styles["Normal"],
+        fontSize=8,
+        leading=10,
+        textColor=colors.HexColor("#6b7280"),
+        alignment=TA_CENTER,
+    )
+
+    elements = []
+    if title:
+        elements.append(Paragraph(title, styles["Heading2"]))
+        elements.append(Spacer(1, 0.1 * inch))
+
+    cells = []
+    for label in labels:
+        cell = [
+            qr_drawing(label["qr_data"], LABEL_QR_SIZE),
+            Paragraph(escape(label["title"]), label_title_style),
+        ]
+        if label.get("subtitle"):
+            cell.append(Paragraph(escape(label["subtitle"]), label_subtitle_style))
+        cells.append(cell)
+
+    rows = [cells[i : i + LABEL_COLUMNS] for i in range(0, len(cells), LABEL_COLUMNS)]
+    if rows:
+        rows[-1] += [""] * (LABEL_COLUMNS - len(rows[-1]))
+
+        table = Table(
+            rows,
+            colWidths=[LABEL_WIDTH] * LABEL_COLUMNS,
+            rowHeights=[LABEL_HEIGHT] * len(rows),
+        )
+        table.setStyle(
+            TableStyle(
+                [
+                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+                    # Light cut lines between labels
+                    ("GRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#d1d5db")),
+                ]
+            )
+        )
+        elements.append(table)
+
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,151 @@
+"""
+Multi-process PDF rendering for large exports
+"""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from io import BytesIO
+from typing import BinaryIO, Iterable, List, Optional, Tuple
+
+from pypdf import PdfReader, PdfWriter
+
+from app.config import settings
+from app.utils.pdf_export import (
+    _to_float,
+    render_collection_chunk,
+    render_watch_pdf_bytes,
+)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_render_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared PDF render pool, creating it on first use.
+
+    Workers are spawned rather than forked so they never inherit the API
+    process's database connections or event loop.
+
+    Returns:
+        Process pool sized by PDF_RENDER_WORKERS (0 = one per CPU core)
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=settings.PDF_RENDER_WORKERS or os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def shutdown_render_pool() -> None:
+    """Shut down the shared render pool if it was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def generate_collection_pdf_parallel(
+    watches: List[dict],
+    collection_name: str = "My Collection",
+    storage_path: str = "/app/storage",
+    chunk_size: int = 25,
+    executor: Optional[Executor] = None,
+) -> BinaryIO:
+    """
+    Generate a collection PDF by rendering chunks of watches in parallel.
+
+    Each chunk of ``chunk_size`` watches is rendered to its own PDF in a
+    worker process, then the chunks are merged in order.
+
+    Args:
+        watches: List of watch data dictionaries
+        collection_name: Name of the collection
+        storage_path: Base path for uploaded images
+        chunk_size: Number of watches per worker task
+        executor: Executor to render with (defaults to the shared pool)
+
+    Returns:
+        File object positioned at the start of the merged PDF
+    """
+    executor = executor or get_render_pool()
+
+    totals = (
+        len(watches),
+        sum(_to_float(w.get("purchase_price", 0)) for w in watches),
+        sum(_to_float(w.get("current_market_value", 0)) for w in watches),
+    )
+    chunks = [
+        watches[i : i + chunk_size] for i in range(0, len(watches), chunk_size)
+    ] or [[]]
+
+    futures = [
+        executor.submit(
+            render_collection_chunk,
+            chunk,
+            collection_name,
+            totals if i == 0 else None,
+            i == len(chunks) - 1,
+            storage_path,
+        )
+        for i, chunk in enumerate(chunks)
+    ]
+
+    writer = PdfWriter()
+    for future in futures:
+        writer.append(PdfReader(BytesIO(future.result())))
+
+    output = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    writer.write(output)
+    output.seek(0)
+    return output
+
+
+def generate_watch_pdfs_zip(
+    watches: Iterable[Tuple[str, dict]],
+    storage_path: str = "/app/storage",
+    executor: Optional[Executor] = None,
+) -> BinaryIO:
+    """
+    Render one PDF per watch in parallel and bundle them into a ZIP archive.
+
+    Args:
+        watches: Iterable of (filename, watch data dictionary) pairs
+        storage_path: Base path for uploaded images
+        executor: Executor to render with (defaults to the shared pool)
+
+    Returns:
+        File object positioned at the start of the ZIP archive
+    """
+    executor = executor or get_render_pool()
+
+    futures = [
+        (filename, executor.submit(render_watch_pdf_bytes, watch_data, storage_path))
+        for filename, watch_data in watches
+    ]
+
+    output = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    used_names = set()
+    # PDF streams are already compressed, so store entries as-is
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_STORED) as archive:
+        for filename, future in futures:
+            name = filename
+            counter = 1
+            while name in used_names:
+                stem, ext = os.path.splitext(filename)
+                name = f"{stem}_{counter}{ext}"
+                counter += 1
+            used_names.add(name)
+            archive.writestr(name, future.result())
+
+    output.seek(0)
+    return output
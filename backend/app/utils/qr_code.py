@@ -1,19 +1,23 @@
+from functools import lru_cache
 from io import BytesIO
+from typing import Tuple
 
 import qrcode
+from qrcode.image.svg import SvgPathImage
 
+from app.config import settings
+from app.utils.export_cache import ExportCache, make_etag
 
-def generate_qr_code(data: str, size: int = 10) -> BytesIO:
-    """
-    Generate a QR code image from the given data.
+# Bump when QR rendering changes so cached images are regenerated
+QR_RENDER_VERSION = 1
 
-    Args:
-        data: The data to encode in the QR code
-        size: The size of each box in the QR code (default: 10)
+QR_FORMATS = {"png": "image/png", "svg": "image/svg+xml"}
 
-    Returns:
-        BytesIO: A buffer containing the QR code image in PNG format
-    """
+qr_disk_cache = ExportCache(settings.QR_CACHE_DIR, settings.QR_CACHE_MAX_BYTES)
+
+
+def _make_qr(data: str, size: int = 10) -> qrcode.QRCode:
+    """Build the QR code for the given data"""
     # Create QR code instance
     qr = qrcode.QRCode(
         version=1,  # Controls the size (1 is smallest, 40 is largest)
@@ -25,16 +29,129 @@ def generate_qr_code(data: str, size: int = 10) -> BytesIO:
     # Add data and generate the QR code
     qr.add_data(data)
     qr.make(fit=True)
+    return qr
+
 
-    # Create an image from the QR code
-    img = qr.make_image(fill_color="black", back_color="white")
+def render_qr_png(data: str, size: int = 10) -> bytes:
+    """
+    Render a QR code to PNG bytes.
+
+    Args:
+        data: The data to encode in the QR code
+        size: The size of each box in the QR code (default: 10)
+
+    Returns:
+        PNG image bytes
+    """
+    img = _make_qr(data, size).make_image(fill_color="black", back_color="white")
 
-    # Save to BytesIO buffer
     buffer = BytesIO()
     img.save(buffer, format="PNG")
-    buffer.seek(0)
+    return buffer.getvalue()
+
+
+def render_qr_svg(data: str, size: int = 10) -> bytes:
+    """
+    Render a QR code to SVG bytes without going through Pillow.
+
+    Args:
+        data: The data to encode in the QR code
+        size: The size of each box in the QR code, in tenths of a millimetre
+
+    Returns:
+        SVG document bytes
+    """
+    img = _make_qr(data, size).make_image(image_factory=SvgPathImage)
+
+    buffer = BytesIO()
+    img.save(buffer)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=settings.QR_MEMORY_CACHE_SIZE)
+def qr_matrix(data: str) -> Tuple[Tuple[bool, ...], ...]:
+    """
+    Get the module matrix of a QR code, including its quiet zone.
+
+    Used to draw QR codes as vector graphics (e.g. in PDF exports).
+
+    Args:
+        data: The data to encode in the QR code
+
+    Returns:
+        Rows of booleans, True for dark modules
+    """
+    return tuple(tuple(row) for row in _make_qr(data, 1).get_matrix())
+
+
+def generate_qr_code(data: str, size: int = 10) -> BytesIO:
+    """
+    Generate a QR code image from the given data.
+
+    Args:
+        data: The data to encode in the QR code
+        size: The size of each box in the QR code (default: 10)
+
+    Returns:
+        BytesIO: A buffer containing the QR code image in PNG format
+    """
+    return BytesIO(render_qr_png(data, size))
+
+
+def watch_qr_url(watch_id: str, base_url: str = "http://localhost:8080") -> str:
+    """Get the detail page URL a watch QR code points to"""
+    return f"{base_url}/watches/{watch_id}"
+
+
+def watch_qr_etag(
+    watch_id: str, base_url: str, size: int = 10, fmt: str = "png"
+) -> str:
+    """
+    Get the ETag of a watch QR code.
+
+    The image depends only on its inputs, so the ETag can be computed (and a
+    conditional request answered) without rendering anything.
+    """
+    return make_etag(f"qr-{fmt}", QR_RENDER_VERSION, watch_id, base_url, size)
+
+
+@lru_cache(maxsize=settings.QR_MEMORY_CACHE_SIZE)
+def get_watch_qr_image(
+    watch_id: str,
+    base_url: str = "http://localhost:8080",
+    size: int = 10,
+    fmt: str = "png",
+) -> bytes:
+    """
+    Get the QR code image for a watch, memoized in memory and on disk.
+
+    Args:
+        watch_id: The UUID of the watch
+        base_url: The base URL of the application
+        size: The size of each box in the QR code
+        fmt: Image format, "png" or "svg"
+
+    Returns:
+        Image bytes
+    """
+    etag = watch_qr_etag(watch_id, base_url, size, fmt)
+
+    cached = qr_disk_cache.get(etag)
+    if cached:
+        try:
+            return cached.read_bytes()
+        except OSError:
+            pass
+
+    render = render_qr_svg if fmt == "svg" else render_qr_png
+    image = render(watch_qr_url(watch_id, base_url), size)
+
+    try:
+        qr_disk_cache.put(etag, BytesIO(image))
+    except OSError as e:
+        print(f"Failed to cache QR code for watch {watch_id}: {e}")
 
-    return buffer
+    return image
 
 
 def generate_watch_qr_code(
@@ -50,5 +167,4 @@ def generate_watch_qr_code(
     Returns:
         BytesIO: A buffer containing the QR code image in PNG format
     """
-    watch_url = f"{base_url}/watches/{watch_id}"
-    return generate_qr_code(watch_url)
+    return BytesIO(get_watch_qr_image(watch_id, base_url))
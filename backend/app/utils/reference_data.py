@@ -0,0 +1,157 @@
+"""
+Immutable in-process snapshot of reference data (brands, movement types,
+complications)
+"""
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.reference import Brand, Complication, MovementType
+from app.schemas.reference import (
+    BrandResponse,
+    ComplicationResponse,
+    MovementTypeResponse,
+)
+from app.utils.export_cache import make_etag
+
+# Endpoint name -> (model, response schema)
+REFERENCE_TABLES = {
+    "brands": (Brand, BrandResponse),
+    "movement-types": (MovementType, MovementTypeResponse),
+    "complications": (Complication, ComplicationResponse),
+}
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    """Reference lists serialized once, with their ids for validation"""
+
+    payloads: Dict[str, bytes]
+    etags: Dict[str, str]
+    ids: Dict[str, FrozenSet[UUID]]
+
+    def counts(self) -> Dict[str, int]:
+        return {name: len(ids) for name, ids in self.ids.items()}
+
+    def etag(self, *names: str) -> str:
+        """
+        Build a validator covering the given reference lists (default all),
+        for responses that embed reference names.
+        """
+        names = names or tuple(REFERENCE_TABLES)
+        return make_etag("reference", *(self.etags[name] for name in names))
+
+
+_snapshot: Optional[ReferenceSnapshot] = None
+_lock = threading.RLock()
+
+
+def load_reference_snapshot(db: Session) -> ReferenceSnapshot:
+    """
+    Read and serialize all reference tables.
+
+    Args:
+        db: Database session
+
+    Returns:
+        New snapshot
+    """
+    payloads, etags, ids = {}, {}, {}
+    for name, (model, schema) in REFERENCE_TABLES.items():
+        rows = db.query(model).order_by(model.sort_order, model.name).all()
+        payload = TypeAdapter(List[schema]).dump_json(rows, by_alias=True)
+        payloads[name] = payload
+        etags[name] = make_etag("reference", name, hashlib.sha256(payload).hexdigest())
+        ids[name] = frozenset(row.id for row in rows)
+
+    return ReferenceSnapshot(payloads=payloads, etags=etags, ids=ids)
+
+
+def reload_reference_snapshot(db: Session) -> ReferenceSnapshot:
+    """
+    Replace the snapshot with a fresh one from the database.
+
+    Only affects the current worker process.
+
+    Args:
+        db: Database session
+
+    Returns:
+        New snapshot
+    """
+    global _snapshot
+    with _lock:
+        _snapshot = load_reference_snapshot(db)
+        return _snapshot
+
+
+def get_reference_snapshot(db: Session) -> ReferenceSnapshot:
+    """
+    Get the current snapshot, loading it on first use.
+
+    Args:
+        db: Database session used if the snapshot has not been loaded yet
+
+    Returns:
+        Current snapshot
+    """
+    snapshot = _snapshot
+    if snapshot is not None:
+        return snapshot
+
+    with _lock:
+        if _snapshot is None:
+            return reload_reference_snapshot(db)
+        return _snapshot
+
+
+def clear_reference_snapshot() -> None:
+    """Drop the snapshot so the next request loads it again"""
+    global _snapshot
+    with _lock:
+        _snapshot = None
+
+
+def warm_reference_snapshot() -> None:
+    """Load the snapshot at startup; failures are retried on first use"""
+    db = SessionLocal()
+    try:
+        reload_reference_snapshot(db)
+    except SQLAlchemyError as e:
+        print(f"Error loading reference data: {e}")
+    finally:
+        db.close()
+
+
+def reference_exists(db: Session, name: str, item_id: UUID) -> bool:
+    """
+    Check that a reference row exists without querying in the common case.
+
+    Ids missing from the snapshot are looked up in the database; if the row
+    exists (e.g. added by a migration since startup) the snapshot is reloaded.
+
+    Args:
+        db: Database session
+        name: Reference table name as in REFERENCE_TABLES
+        item_id: Id to check
+
+    Returns:
+        True if the row exists
+    """
+    if item_id in get_reference_snapshot(db).ids[name]:
+        return True
+
+    model, _ = REFERENCE_TABLES[name]
+    if db.get(model, item_id) is None:
+        return False
+
+    reload_reference_snapshot(db)
+    return True
@@ -0,0 +1,192 @@
+"""
+Execution of saved searches with compiled filters and cached results
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Tuple
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.models.saved_search import SavedSearch
+from app.models.watch import Watch
+from app.utils.cache import (
+    cache_get,
+    cache_invalidate_tags,
+    cache_set,
+    entity_tag,
+    user_tag,
+)
+from app.utils.data_version import DataVersions
+from app.utils.watch_filters import compile_watch_filters, watch_order_by
+
+# Compiled searches kept per worker process
+COMPILED_SEARCH_CACHE_SIZE = 256
+
+# Matched ids are cached per data version, so this only bounds stale entries
+SAVED_SEARCH_CACHE_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class CompiledSearch:
+    """Saved search filters compiled into reusable SQLAlchemy clauses"""
+
+    fingerprint: str
+    criteria: tuple
+    order_by: tuple
+
+
+_compiled: "OrderedDict[Tuple[UUID, str], CompiledSearch]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def filters_fingerprint(filters: dict) -> str:
+    """Short stable hash of a filters dict"""
+    canonical = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def compile_saved_search(search: SavedSearch) -> CompiledSearch:
+    """
+    Get the compiled form of a saved search, compiling it on first use.
+
+    Compiled searches are keyed by the hash of their filters, so editing a
+    search's filters compiles it again.
+
+    Args:
+        search: Saved search
+
+    Returns:
+        Compiled search
+
+    Raises:
+        ValueError: If the stored filters are invalid
+    """
+    fingerprint = filters_fingerprint(search.filters)
+    key = (search.id, fingerprint)
+    with _lock:
+        compiled = _compiled.get(key)
+        if compiled is not None:
+            _compiled.move_to_end(key)
+            return compiled
+
+    compiled = CompiledSearch(
+        fingerprint=fingerprint,
+        criteria=tuple(compile_watch_filters(search.filters)),
+        order_by=tuple(
+            watch_order_by(
+                search.filters.get("sort_by"), search.filters.get("sort_order")
+            )
+        ),
+    )
+    with _lock:
+        _compiled[key] = compiled
+        while len(_compiled) > COMPILED_SEARCH_CACHE_SIZE:
+            _compiled.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_searches() -> None:
+    """Drop all compiled searches"""
+    with _lock:
+        _compiled.clear()
+
+
+def invalidate_saved_search(search_id: UUID) -> int:
+    """
+    Drop all cached results of a saved search.
+
+    Args:
+        search_id: Saved search that was edited or deleted
+
+    Returns:
+        Number of cache entries removed
+    """
+    return cache_invalidate_tags(entity_tag("saved-search", search_id))
+
+
+def run_saved_search(
+    db: Session, search: SavedSearch, versions: DataVersions
+) -> Tuple[List[UUID], str]:
+    """
+    Get the ids of all watches matching a saved search, in result order.
+
+    The ids are cached per (search, filters, watches data version); any
+    write to the user's watches bumps the version, so cached results never
+    go stale.
+
+    Args:
+        db: Database session
+        search: Saved search to run
+        versions: The search owner's data versions
+
+    Returns:
+        Tuple of (matching watch ids, data version)
+
+    Raises:
+        ValueError: If the stored filters are invalid
+    """
+    compiled = compile_saved_search(search)
+    version = versions.token("watches")
+    key = f"saved-search:{search.id}:{compiled.fingerprint}:{version}"
+
+    cached = cache_get(key)
+    if cached is not None:
+        return [UUID(watch_id) for watch_id in cached], version
+
+    watch_ids = db.scalars(
+        select(Watch.id)
+        .where(Watch.user_id == search.user_id, *compiled.criteria)
+        .order_by(*compiled.order_by)
+    ).all()
+    cache_set(
+        key,
+        [str(watch_id) for watch_id in watch_ids],
+        SAVED_SEARCH_CACHE_SECONDS,
+        tags=(user_tag(search.user_id), entity_tag("saved-search", search.id)),
+    )
+    return list(watch_ids), version
+
+
+def record_seen_matches(
+    db: Session, search: SavedSearch, watch_ids: List[UUID]
+) -> List[UUID]:
+    """
+    Work out which matches are new since the search was last run and
+    remember the current matches.
+
+    The first run of a search reports no new matches. The search is only
+    written when its matches changed, and without touching updated_at.
+    The caller commits.
+
+    Args:
+        db: Database session
+        search: Saved search that was run
+        watch_ids: Current matches
+
+    Returns:
+        Ids matching now that did not match on the previous run
+    """
+    current = [str(watch_id) for watch_id in watch_ids]
+    seen = None if search.seen_match_ids is None else set(search.seen_match_ids)
+    if seen is not None and seen == set(current):
+        return []
+
+    new_ids = [] if seen is None else [w for w in watch_ids if str(w) not in seen]
+    db.execute(
+        update(SavedSearch)
+        .where(SavedSearch.id == search.id)
+        .values(
+            seen_match_ids=current,
+            seen_at=datetime.utcnow(),
+            updated_at=SavedSearch.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return new_ids
@@ -0,0 +1,89 @@
+"""
+Maintenance of the per-watch service rollup table
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg, insert
+from sqlalchemy.orm import Session
+
+from app.models.service_history import ServiceHistory, WatchServiceRollup
+from app.models.watch import Watch
+
+
+def refresh_service_rollups(db: Session, watch_ids) -> int:
+    """
+    Recompute the service rollups of the given watches.
+
+    Runs as a single INSERT ... SELECT ... ON CONFLICT DO UPDATE statement
+    regardless of how many watches are affected. Call it after creating,
+    updating or deleting service records, before committing.
+
+    Args:
+        db: Database session
+        watch_ids: Watch ids (list or subquery) whose rollups to refresh
+
+    Returns:
+        Number of rollup rows written
+    """
+    currency = func.coalesce(ServiceHistory.cost_currency, "USD")
+    cost_totals = (
+        select(
+            ServiceHistory.watch_id,
+            currency.label("currency"),
+            func.sum(ServiceHistory.cost).label("total"),
+        )
+        .where(ServiceHistory.watch_id.in_(watch_ids), ServiceHistory.cost.isnot(None))
+        .group_by(ServiceHistory.watch_id, currency)
+        .subquery()
+    )
+    total_costs = (
+        select(func.jsonb_object_agg(cost_totals.c.currency, cost_totals.c.total))
+        .where(cost_totals.c.watch_id == Watch.id)
+        .scalar_subquery()
+    )
+
+    # next_service_due as set on the most recent service
+    next_service_due = array_agg(
+        aggregate_order_by(
+            ServiceHistory.next_service_due, ServiceHistory.service_date.desc()
+        )
+    )[1]
+
+    rollups = (
+        select(
+            Watch.id,
+            Watch.user_id,
+            func.count(ServiceHistory.id),
+            func.coalesce(total_costs, func.jsonb_build_object()),
+            func.max(ServiceHistory.service_date),
+            next_service_due,
+            literal(datetime.utcnow()),
+        )
+        .outerjoin(ServiceHistory, ServiceHistory.watch_id == Watch.id)
+        .where(Watch.id.in_(watch_ids))
+        .group_by(Watch.id)
+    )
+
+    columns = [
+        "watch_id",
+        "user_id",
+        "service_count",
+        "total_costs",
+        "last_service_date",
+        "next_service_due",
+        "updated_at",
+    ]
+    statement = insert(WatchServiceRollup).from_select(columns, rollups)
+    result = db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[WatchServiceRollup.watch_id],
+            set_={
+                column: statement.excluded[column]
+                for column in columns
+                if column != "watch_id"
+            },
+        )
+    )
+    return result.rowcount
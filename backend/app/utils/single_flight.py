@@ -0,0 +1,233 @@
+"""
+Single-flight execution of expensive, repeatable requests
+
+Identical requests arriving together (several tabs, refetch on focus) share
+one computation instead of each doing the full work.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.config import settings
+from app.utils.cache import (
+    cache_get,
+    cache_lock_acquire,
+    cache_lock_held,
+    cache_lock_release,
+    cache_set,
+)
+from app.utils.metrics import Counter, Gauge, registry
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+# Interval between checks of another worker's lock
+REMOTE_POLL_SECONDS = 0.05
+
+COUNTERS = ("calls", "hits", "coalesced", "remote_waits", "executions", "failures")
+
+
+class _Call:
+    """A computation in progress and the threads waiting for it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time.
+
+    Within a worker, callers arriving while a key is in flight wait for the
+    leader's result (or exception). Across workers, the leader takes a Redis
+    lock; a worker finding the lock held waits for it to be released and then
+    looks the result up instead of recomputing. The shared result must be
+    stored by the computation itself (Redis, export cache) and found by
+    ``lookup``; without Redis each worker computes on its own.
+    """
+
+    def __init__(self, use_redis_lock: bool, timeout: float):
+        self.use_redis_lock = use_redis_lock
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, endpoint: str, counter: str) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(endpoint, dict.fromkeys(COUNTERS, 0))
+            counters[counter] += 1
+
+    def run(
+        self,
+        endpoint: str,
+        key: str,
+        compute: Callable[[], T],
+        lookup: Optional[Callable[[], Optional[T]]] = None,
+    ) -> T:
+        """
+        Get the result for key, computing it at most once at a time.
+
+        Args:
+            endpoint: Name the counters are reported under
+            key: Identifies the result; must cover the user, parameters and
+                data version of everything the result depends on
+            compute: Produces the result (and stores it for lookup)
+            lookup: Returns an already stored result, or None
+
+        Returns:
+            The result, shared with concurrent callers for the same key
+        """
+        self._count(endpoint, "calls")
+        if lookup is not None:
+            result = lookup()
+            if result is not None:
+                self._count(endpoint, "hits")
+                return result
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self._count(endpoint, "coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._lead(endpoint, key, compute, lookup)
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            self._count(endpoint, "failures")
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def _lead(
+        self,
+        endpoint: str,
+        key: str,
+        compute: Callable[[], T],
+        lookup: Optional[Callable[[], Optional[T]]],
+    ) -> T:
+        token = None
+        if self.use_redis_lock:
+            token = cache_lock_acquire(f"single-flight:{key}", self.timeout)
+            if token is None and self._wait_for_remote(key):
+                self._count(endpoint, "remote_waits")
+                result = lookup() if lookup is not None else None
+                if result is not None:
+                    self._count(endpoint, "hits")
+                    return result
+
+        try:
+            self._count(endpoint, "executions")
+            return compute()
+        finally:
+            if token is not None:
+                cache_lock_release(f"single-flight:{key}", token)
+
+    def _wait_for_remote(self, key: str) -> bool:
+        """Wait while another worker holds the key; True if it did"""
+        deadline = time.monotonic() + self.timeout
+        waited = False
+        while cache_lock_held(f"single-flight:{key}"):
+            waited = True
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(REMOTE_POLL_SECONDS)
+        return waited
+
+    def stats(self) -> dict:
+        """Get a snapshot of in-flight keys and per-endpoint counters"""
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "endpoints": {
+                    endpoint: dict(counters)
+                    for endpoint, counters in self._counters.items()
+                },
+            }
+
+
+single_flight = SingleFlight(
+    settings.SINGLE_FLIGHT_REDIS_LOCK, settings.SINGLE_FLIGHT_TIMEOUT_SECONDS
+)
+
+
+def _single_flight_events() -> dict:
+    return {
+        (endpoint, event): value
+        for endpoint, counters in single_flight.stats()["endpoints"].items()
+        for event, value in counters.items()
+    }
+
+
+registry.register(
+    Counter(
+        "single_flight_events_total",
+        "Single-flight calls, hits, coalesced waits and executions by endpoint",
+        ["endpoint", "event"],
+        collect=_single_flight_events,
+    )
+)
+registry.register(
+    Gauge(
+        "single_flight_in_flight",
+        "Keys currently being computed",
+        collect=lambda: {(): single_flight.stats()["in_flight"]},
+    )
+)
+
+
+def shared_response(
+    endpoint: str,
+    key: str,
+    model: Type[M],
+    compute: Callable[[], M],
+    tags: Iterable[str] = (),
+) -> M:
+    """
+    Single-flight a response model, sharing it across workers through Redis.
+
+    The result is kept for SINGLE_FLIGHT_RESULT_SECONDS, long enough for
+    requests that were waiting on another worker to pick it up.
+
+    Args:
+        endpoint: Name the counters are reported under
+        key: Cache key covering the user, parameters and data version
+        model: Response model the cached JSON is validated into
+        compute: Builds the response
+        tags: Cache tags for the stored result
+
+    Returns:
+        The response model
+    """
+
+    def lookup() -> Optional[M]:
+        cached = cache_get(key)
+        return model.model_validate(cached) if cached is not None else None
+
+    def compute_and_store() -> M:
+        result = compute()
+        cache_set(
+            key,
+            result.model_dump(mode="json"),
+            settings.SINGLE_FLIGHT_RESULT_SECONDS,
+            tags=tags,
+        )
+        return result
+
+    return single_flight.run(endpoint, key, compute_and_store, lookup)
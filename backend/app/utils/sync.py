@@ -0,0 +1,172 @@
+"""
+Incremental change feed behind GET /sync
+"""
+
+import re
+import uuid
+from typing import Iterable, Tuple
+
+from sqlalchemy import insert, select, text, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.market_value import MarketValue
+from app.models.movement_accuracy import MovementAccuracyReading
+from app.models.service_history import ServiceHistory
+from app.models.sync import SyncTombstone
+from app.models.watch import Watch
+from app.models.watch_image import WatchImage
+from app.utils.data_export import model_to_dict
+
+# Synced tables (see app.models.sync.SYNC_TABLES) and their models
+SYNC_MODELS = {
+    "watches": Watch,
+    "watch_images": WatchImage,
+    "service_history": ServiceHistory,
+    "market_values": MarketValue,
+    "movement_accuracy_readings": MovementAccuracyReading,
+}
+
+DEFAULT_SYNC_LIMIT = 500
+MAX_SYNC_LIMIT = 5000
+
+# Tokens are "<change_xid>:<change_seq>" of the last change returned. Plain
+# integers were issued before tokens carried the transaction id; they restart
+# from a full sync.
+SYNC_TOKEN_PATTERN = r"^\d+(:\d+)?$"
+
+# Oldest transaction still running: every transaction below it has finished,
+# so no change from one of them can still appear
+SNAPSHOT_XMIN_SQL = text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+
+SyncPosition = Tuple[int, int]
+
+
+def parse_token(token: str) -> SyncPosition:
+    """
+    Parse a sync token into a (change_xid, change_seq) position.
+
+    Args:
+        token: Token from a previous sync, "0" for a full sync
+
+    Returns:
+        The position to continue after; (0, 0) for a full sync or a token in
+        the old integer format
+    """
+    if not re.match(SYNC_TOKEN_PATTERN, token):
+        raise ValueError(f"Invalid sync token: {token}")
+    if ":" not in token:
+        return (0, 0)
+    xid, seq = token.split(":")
+    return (int(xid), int(seq))
+
+
+def format_token(position: SyncPosition) -> str:
+    """Format a (change_xid, change_seq) position as a sync token"""
+    return f"{position[0]}:{position[1]}"
+
+
+def _user_filter(model, user_id: uuid.UUID):
+    """Build the WHERE clause selecting a user's rows of a synced table"""
+    if hasattr(model, "user_id"):
+        return model.user_id == user_id
+    return model.watch_id.in_(select(Watch.id).where(Watch.user_id == user_id))
+
+
+def record_tombstones(
+    db: Session, user_id: uuid.UUID, entity: str, entity_ids: Iterable[uuid.UUID]
+) -> None:
+    """
+    Record deletions made outside the ORM (bulk DELETE statements).
+
+    ORM deletes are picked up automatically by the before_flush listener.
+
+    Args:
+        db: Database session
+        user_id: Owner of the deleted rows
+        entity: Synced table name
+        entity_ids: Primary keys of the deleted rows
+    """
+    rows = [
+        {"user_id": user_id, "entity": entity, "entity_id": entity_id}
+        for entity_id in entity_ids
+    ]
+    if rows:
+        db.execute(insert(SyncTombstone), rows)
+
+
+def collect_changes(
+    db: Session, user_id: uuid.UUID, since: str, limit: int = DEFAULT_SYNC_LIMIT
+) -> dict:
+    """
+    Gather a user's rows created, updated or deleted after a change token.
+
+    Changes are ordered by writing transaction, then change_seq. Only changes
+    from transactions older than the snapshot's xmin are returned: a
+    transaction still running may commit rows stamped before ones already
+    visible, and a token past them would skip those rows for good.
+
+    Each table (and the tombstones) returns at most ``limit`` rows. When any
+    of them is cut short the token is lowered to the last change every table
+    is complete up to, and rows past it are dropped, so the next call picks up
+    exactly where this one stopped.
+
+    Args:
+        db: Database session
+        user_id: Owner of the data
+        since: Token from the previous call ("0" for a full sync)
+        limit: Maximum rows per table
+
+    Returns:
+        Dict with a list of serialized rows per table, ``deleted`` tombstones,
+        the next ``token`` and ``has_more``
+    """
+    position = parse_token(since)
+    horizon = db.execute(SNAPSHOT_XMIN_SQL).scalar_one()
+
+    def changed(model):
+        key = tuple_(model.change_xid, model.change_seq)
+        return (
+            select(model)
+            .where(key > position, model.change_xid < horizon)
+            .order_by(model.change_xid, model.change_seq)
+            .limit(limit + 1)
+        )
+
+    changes = {}
+    for table, model in SYNC_MODELS.items():
+        changes[table] = db.scalars(
+            changed(model).where(_user_filter(model, user_id))
+        ).all()
+    changes["deleted"] = db.scalars(
+        changed(SyncTombstone).where(SyncTombstone.user_id == user_id)
+    ).all()
+
+    def row_position(row) -> SyncPosition:
+        return (row.change_xid, row.change_seq)
+
+    truncated = [
+        row_position(rows[limit - 1]) for rows in changes.values() if len(rows) > limit
+    ]
+    if truncated:
+        token = min(truncated)
+    else:
+        # Everything below the horizon has been returned; changes of
+        # transactions still running come after it
+        token = max(position, (horizon, 0))
+
+    result = {"token": format_token(token), "has_more": bool(truncated)}
+    for key, rows in changes.items():
+        rows = [row for row in rows if row_position(row) <= token]
+        if key == "deleted":
+            result[key] = [
+                {
+                    "entity": row.entity,
+                    "id": row.entity_id,
+                    "deleted_at": row.deleted_at,
+                }
+                for row in rows
+            ]
+        else:
+            result[key] = [model_to_dict(row) for row in rows]
+
+    return result
@@ -0,0 +1,151 @@
+"""
+Compilation of watch list filters into SQLAlchemy criteria
+
+Shared by the watch list endpoint and saved search execution, so a saved
+search matches exactly what the list page shows for the same parameters.
+"""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import asc, desc, func, or_
+
+from app.models.reference import Brand
+from app.models.watch import ConditionEnum, Watch
+
+WATCH_SORT_COLUMNS = ("created_at", "purchase_date", "purchase_price", "model")
+
+
+def _uuid(value: Any) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _date(value: Any) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+# Filter name -> parser for its value
+WATCH_FILTERS: Dict[str, Callable[[Any], Any]] = {
+    "collection_id": _uuid,
+    "brand_id": _uuid,
+    "movement_type_id": _uuid,
+    "condition": ConditionEnum,
+    "search": str,
+    "min_price": float,
+    "max_price": float,
+    "min_value": float,
+    "max_value": float,
+    "purchase_date_from": _date,
+    "purchase_date_to": _date,
+}
+
+
+def parse_watch_filters(filters: dict) -> dict:
+    """
+    Validate and convert filter values, dropping empty and unknown ones.
+
+    Args:
+        filters: Filter values as query parameters or stored JSON
+
+    Returns:
+        Parsed filter values
+
+    Raises:
+        ValueError: If a value cannot be parsed
+    """
+    parsed = {}
+    for name, parse in WATCH_FILTERS.items():
+        value = filters.get(name)
+        if value is None or value == "":
+            continue
+        try:
+            parsed[name] = parse(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value for filter '{name}'")
+    return parsed
+
+
+def compile_watch_filters(filters: dict) -> list:
+    """
+    Build the WHERE criteria for a set of watch filters.
+
+    The criteria do not restrict the owner; callers add Watch.user_id.
+
+    Args:
+        filters: Filter values as query parameters or stored JSON
+
+    Returns:
+        List of SQLAlchemy criteria to pass to filter()
+
+    Raises:
+        ValueError: If a value cannot be parsed
+    """
+    parsed = parse_watch_filters(filters)
+    criteria = []
+
+    for name in ("collection_id", "brand_id", "movement_type_id", "condition"):
+        if name in parsed:
+            criteria.append(getattr(Watch, name) == parsed[name])
+
+    # Price and market value ranges
+    if "min_price" in parsed:
+        criteria.append(Watch.purchase_price >= parsed["min_price"])
+    if "max_price" in parsed:
+        criteria.append(Watch.purchase_price <= parsed["max_price"])
+    if "min_value" in parsed:
+        criteria.append(Watch.current_market_value >= parsed["min_value"])
+    if "max_value" in parsed:
+        criteria.append(Watch.current_market_value <= parsed["max_value"])
+
+    # Date range
+    if "purchase_date_from" in parsed:
+        criteria.append(Watch.purchase_date >= parsed["purchase_date_from"])
+    if "purchase_date_to" in parsed:
+        criteria.append(Watch.purchase_date <= parsed["purchase_date_to"])
+
+    # Full-text search on the indexed model and brand name,
+    # ILIKE for the less common fields
+    if "search" in parsed:
+        search = parsed["search"]
+        query = func.plainto_tsquery("english", search)
+        criteria.append(
+            or_(
+                func.to_tsvector("english", Watch.model).op("@@")(query),
+                Watch.brand.has(
+                    func.to_tsvector("english", Brand.name).op("@@")(query)
+                ),
+                Watch.reference_number.ilike(f"%{search}%"),
+                Watch.serial_number.ilike(f"%{search}%"),
+                Watch.notes.ilike(f"%{search}%"),
+            )
+        )
+
+    return criteria
+
+
+def watch_order_by(
+    sort_by: Optional[str] = None, sort_order: Optional[str] = None
+) -> List:
+    """
+    Build the ORDER BY clauses for a watch list.
+
+    Args:
+        sort_by: One of WATCH_SORT_COLUMNS (default created_at)
+        sort_order: "asc" or "desc" (default desc)
+
+    Returns:
+        ORDER BY clauses, ending with the id as a stable tie-breaker
+
+    Raises:
+        ValueError: If the sort column or order is not supported
+    """
+    sort_by = sort_by or "created_at"
+    sort_order = sort_order or "desc"
+    if sort_by not in WATCH_SORT_COLUMNS:
+        raise ValueError(f"Invalid sort column '{sort_by}'")
+    if sort_order not in ("asc", "desc"):
+        raise ValueError(f"Invalid sort order '{sort_order}'")
+
+    direction = desc if sort_order == "desc" else asc
+    return [direction(getattr(Watch, sort_by)), Watch.id]
@@ -0,0 +1,177 @@
+"""
+Parsing and reference resolution for bulk watch imports
+"""
+
+import csv
+import io
+import json
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple, Union
+from uuid import UUID
+
+from pydantic import ValidationError
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Separators accepted between complication names in a CSV cell
+COMPLICATION_SEPARATORS = (";", "|")
+
+# Columns that may name a reference instead of giving its id
+REFERENCE_COLUMNS = (
+    ("brand", "brand_id", "Brand"),
+    ("movement_type", "movement_type_id", "Movement type"),
+    ("collection", "collection_id", "Collection"),
+)
+
+
+def detect_import_format(content_type: Optional[str]) -> Optional[str]:
+    """
+    Work out the import format from a request's Content-Type.
+
+    Args:
+        content_type: Content-Type header value
+
+    Returns:
+        "csv", "ndjson", or None if the type is not recognised
+    """
+    if not content_type:
+        return None
+
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in ("text/csv", "application/csv"):
+        return "csv"
+    if media_type in (
+        "application/x-ndjson",
+        "application/ndjson",
+        "application/jsonl",
+        "application/json-lines",
+    ):
+        return "ndjson"
+    return None
+
+
+def _clean_csv_row(row: dict) -> dict:
+    """Strip cells, drop empty ones and split complication lists"""
+    cleaned = {}
+    for key, value in row.items():
+        if key is None or value is None:
+            continue
+        key = key.strip()
+        value = value.strip()
+        if not key or value == "":
+            continue
+        cleaned[key] = value
+
+    complications = cleaned.get("complications")
+    if complications is not None:
+        for separator in COMPLICATION_SEPARATORS:
+            if separator in complications:
+                break
+        cleaned["complications"] = [
+            name.strip() for name in complications.split(separator) if name.strip()
+        ]
+
+    return cleaned
+
+
+def iter_import_rows(
+    file: BinaryIO, fmt: str
+) -> Iterator[Tuple[int, Union[dict, ValueError]]]:
+    """
+    Iterate over the rows of an import file without loading it into memory.
+
+    Args:
+        file: Binary file object containing the import body
+        fmt: "csv" (with a header row) or "ndjson" (one JSON object per line)
+
+    Yields:
+        (row number, row dict) pairs, or (row number, ValueError) for rows
+        that could not be parsed. CSV rows are numbered from 2 so numbers
+        match spreadsheet line numbers.
+
+    Raises:
+        ValueError: If the file is not UTF-8 or is not parseable as CSV
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(text)
+            try:
+                for row in reader:
+                    yield reader.line_num, _clean_csv_row(row)
+            except csv.Error as e:
+                # The reader cannot resynchronize, e.g. after an oversized field
+                raise ValueError(f"Malformed CSV: {e}")
+            return
+
+        for line_number, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ValueError(f"Invalid JSON: {e.msg}")
+                continue
+            if not isinstance(row, dict):
+                yield line_number, ValueError("Each line must be a JSON object")
+                continue
+            yield line_number, row
+    except UnicodeDecodeError:
+        raise ValueError("Import file must be UTF-8 encoded")
+    finally:
+        # Leave the underlying file open for the caller
+        text.detach()
+
+
+def resolve_import_references(
+    row: dict,
+    lookups: Dict[str, Dict[str, UUID]],
+    known_ids: Dict[str, Set[UUID]],
+) -> List[str]:
+    """
+    Replace brand, movement type and collection names with their ids in place.
+
+    Ids given directly are checked too, so a bad reference is reported for
+    its row instead of failing the whole batch on a foreign key violation.
+
+    Args:
+        row: Parsed import row
+        lookups: Case-insensitive name -> id maps keyed by reference column
+        known_ids: Valid ids keyed by reference column (collections are
+            limited to the importing user's)
+
+    Returns:
+        Error messages for references that could not be resolved
+    """
+    errors = []
+
+    for name_column, id_column, label in REFERENCE_COLUMNS:
+        name = row.pop(name_column, None)
+        reference_id = row.get(id_column)
+
+        if reference_id is None and name is not None:
+            reference_id = lookups[name_column].get(str(name).strip().casefold())
+            if reference_id is None:
+                errors.append(f"{name_column}: {label} '{name}' not found")
+                continue
+            row[id_column] = reference_id
+
+        if reference_id is None:
+            continue
+
+        try:
+            if UUID(str(reference_id)) not in known_ids[name_column]:
+                errors.append(f"{id_column}: {label} not found")
+        except ValueError:
+            # Malformed ids are reported by schema validation
+            pass
+
+    return errors
+
+
+def format_validation_errors(error: ValidationError) -> List[str]:
+    """Flatten a pydantic validation error into readable messages"""
+    messages = []
+    for detail in error.errors():
+        location = ".".join(str(part) for part in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return messages
@@ -0,0 +1,114 @@
+"""
+Benchmark per-request overhead of the cache headers middleware.
+
+Drives a trivial ASGI endpoint directly (no server, no sockets) through:
+
+* none      - the bare endpoint, as a baseline
+* base-http - the previous BaseHTTPMiddleware implementation
+* asgi      - the current pure-ASGI CacheMiddleware
+
+and reports the mean time per request and the overhead over the baseline.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.cache_middleware_benchmark --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Callable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+from app.middleware.cache import CacheMiddleware
+
+PATHS = ["/api/v1/watches/", "/api/v1/reference/brands", "/uploads/a/b.jpg"]
+
+
+class BaseHTTPCacheMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware implementation CacheMiddleware replaced"""
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        response = await call_next(request)
+
+        if request.method == "GET":
+            if "/reference/" in str(request.url.path):
+                response.headers["Cache-Control"] = "public, max-age=3600"
+            elif "/uploads/" in str(request.url.path):
+                response.headers["Cache-Control"] = (
+                    "public, max-age=31536000, immutable"
+                )
+            elif (
+                "/api/" in str(request.url.path)
+                and "cache-control" not in response.headers
+            ):
+                response.headers["Cache-Control"] = (
+                    "no-cache, no-store, must-revalidate"
+                )
+
+        return response
+
+
+async def endpoint(scope, receive, send) -> None:
+    await PlainTextResponse("ok")(scope, receive, send)
+
+
+async def run(app, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    scopes = [
+        {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"testserver")],
+            "client": ("127.0.0.1", 1234),
+            "server": ("testserver", 80),
+        }
+        for path in PATHS
+    ]
+
+    start = time.perf_counter()
+    for i in range(requests):
+        await app(dict(scopes[i % len(scopes)]), receive, send)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    apps = [
+        ("none", endpoint),
+        ("base-http", BaseHTTPCacheMiddleware(endpoint)),
+        ("asgi", CacheMiddleware(endpoint)),
+    ]
+
+    results = []
+    for name, app in apps:
+        asyncio.run(run(app, 1000))  # warm up
+        elapsed = asyncio.run(run(app, args.requests))
+        results.append((name, elapsed / args.requests * 1e6))
+
+    baseline = results[0][1]
+    print(f"{'middleware':<10} {'us/req':>8} {'overhead':>9}")
+    for name, per_request in results:
+        print(f"{name:<10} {per_request:>8.1f} {per_request - baseline:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark collection PDF export with and without the print image cache.
+
+Builds a synthetic 200-watch collection with one full-resolution photo per
+watch, then renders the collection PDF three ways:
+
+* originals   - embed the uploaded files directly (previous behaviour)
+* cold cache  - first export, print renditions are generated
+* warm cache  - repeat export, print renditions are reused
+* parallel    - warm cache, chunks rendered across the process pool
+
+Usage (from the backend directory):
+
+    python -m benchmarks.pdf_export_benchmark --watches 200 --size 3000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image as PILImage
+from PIL import ImageDraw
+
+from app.utils import pdf_export
+from app.utils.image_cache import get_print_image
+from app.utils.pdf_parallel import (
+    generate_collection_pdf_parallel,
+    shutdown_render_pool,
+)
+
+
+def build_collection(storage_path: Path, watches: int, size: int) -> list:
+    """Create one distinct photo per watch and return watch dicts"""
+    upload_dir = storage_path / "uploads"
+    data = []
+    for i in range(watches):
+        watch_dir = upload_dir / f"watch-{i}"
+        watch_dir.mkdir(parents=True, exist_ok=True)
+
+        # Unique content per file so reportlab cannot dedupe the images
+        img = PILImage.linear_gradient("L").resize((size, size)).convert("RGB")
+        ImageDraw.Draw(img).text((size // 2, size // 2), str(i), fill=(255, 0, 0))
+        img.save(watch_dir / "photo.jpg", quality=95)
+
+        data.append(
+            {
+                "model": f"Model {i}",
+                "brand": {"name": "Brand"},
+                "reference_number": f"REF-{i}",
+                "purchase_price": 1000 + i,
+                "purchase_currency": "USD",
+                "primary_image": {
+                    "file_path": f"watch-{i}/photo.jpg",
+                    "is_primary": True,
+                },
+            }
+        )
+    return data
+
+
+def timed_export(watches: list, storage_path: Path) -> tuple:
+    start = time.perf_counter()
+    pdf = pdf_export.generate_collection_pdf(
+        watches, "Benchmark", storage_path=str(storage_path)
+    )
+    elapsed = time.perf_counter() - start
+    return elapsed, len(pdf.getvalue())
+
+
+def timed_parallel_export(watches: list, storage_path: Path) -> tuple:
+    start = time.perf_counter()
+    with generate_collection_pdf_parallel(
+        watches, "Benchmark", storage_path=str(storage_path)
+    ) as pdf:
+        elapsed = time.perf_counter() - start
+        size = len(pdf.read())
+    return elapsed, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--watches", type=int, default=200)
+    parser.add_argument("--size", type=int, default=3000, help="Photo edge in px")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        storage_path = Path(tmp)
+        print(f"Generating {args.watches} photos at {args.size}x{args.size}...")
+        watches = build_collection(storage_path, args.watches, args.size)
+
+        # Previous behaviour: embed the original upload
+        pdf_export.get_print_image = lambda file_path, upload: os.path.join(
+            upload, file_path
+        )
+        results = [("originals", *timed_export(watches, storage_path))]
+
+        pdf_export.get_print_image = get_print_image
+        results.append(("cold cache", *timed_export(watches, storage_path)))
+        results.append(("warm cache", *timed_export(watches, storage_path)))
+        results.append(("parallel", *timed_parallel_export(watches, storage_path)))
+        shutdown_render_pool()
+
+    print(f"{'mode':<12} {'seconds':>8} {'pdf MB':>8}")
+    for name, seconds, size in results:
+        print(f"{name:<12} {seconds:>8.2f} {size / 1024 / 1024:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
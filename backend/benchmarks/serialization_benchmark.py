@@ -0,0 +1,312 @@
+"""
+Benchmark response serialization cost for 100-item pages of the main list
+endpoints.
+
+Builds detached ORM objects in memory (no database) and runs each page
+through the same steps FastAPI applies to a response model (validate with
+from_attributes, then serialize) for:
+
+* before  - the endpoint output before the single-pass change: response
+            models built per item (list_watches validated, dumped and
+            rebuilt each item), then validated and serialized by FastAPI
+* orjson  - the current endpoint output, serialized to Python objects and
+            rendered with orjson (default_response_class=ORJSONResponse)
+* current - the current endpoint output, validated and dumped straight to
+            JSON bytes by the response model in one pass
+
+and reports the mean time per page.
+
+Usage (from the backend directory):
+
+    python -m benchmarks.serialization_benchmark --pages 500
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, List
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.models import (
+    Brand,
+    Collection,
+    MarketValue,
+    ServiceDocument,
+    ServiceHistory,
+    Watch,
+    WatchImage,
+)
+from app.schemas.collection import CollectionResponse
+from app.schemas.market_value import MarketValueResponse
+from app.schemas.service_history import ServiceHistoryListItem
+from app.schemas.watch import PaginatedWatchResponse, WatchListResponse
+
+PAGE_SIZE = 100
+NOW = datetime(2024, 1, 15, 10, 30)
+
+
+def make_watches(count: int) -> List[Watch]:
+    brand = Brand(id=uuid.uuid4(), name="Rolex")
+    collection = Collection(id=uuid.uuid4(), name="Divers", color="#3B82F6")
+    watches = []
+    for i in range(count):
+        watch = Watch(
+            id=uuid.uuid4(),
+            brand_id=brand.id,
+            brand=brand,
+            model=f"Submariner {i}",
+            reference_number="126610LN",
+            collection_id=collection.id,
+            collection=collection,
+            purchase_date=NOW - timedelta(days=i),
+            purchase_price=Decimal("9500.00"),
+            purchase_currency="USD",
+            created_at=NOW,
+        )
+        watch.images = [
+            WatchImage(
+                id=uuid.uuid4(),
+                watch_id=watch.id,
+                file_path=f"{watch.id}/{n}.jpg",
+                file_name=f"{n}.jpg",
+                file_size=204800,
+                mime_type="image/jpeg",
+                width=1600,
+                height=1200,
+                is_primary=n == 0,
+                sort_order=n,
+                source="user_upload",
+                created_at=NOW,
+            )
+            for n in range(3)
+        ]
+        watches.append(watch)
+    return watches
+
+
+def make_collections(count: int) -> list:
+    return [
+        (
+            Collection(
+                id=uuid.uuid4(),
+                user_id=uuid.uuid4(),
+                name=f"Collection {i}",
+                description="Everyday watches",
+                color="#3B82F6",
+                is_default=i == 0,
+                created_at=NOW,
+                updated_at=NOW,
+            ),
+            i,
+        )
+        for i in range(count)
+    ]
+
+
+def make_market_values(count: int) -> List[MarketValue]:
+    watch_id = uuid.uuid4()
+    return [
+        MarketValue(
+            id=uuid.uuid4(),
+            watch_id=watch_id,
+            value=Decimal("12000.00") + i,
+            currency="USD",
+            source="manual",
+            notes=None,
+            recorded_at=NOW - timedelta(days=i),
+        )
+        for i in range(count)
+    ]
+
+
+def make_services(count: int) -> list:
+    watch_id = uuid.uuid4()
+    rows = []
+    for i in range(count):
+        service = ServiceHistory(
+            id=uuid.uuid4(),
+            watch_id=watch_id,
+            service_date=NOW - timedelta(days=30 * i),
+            provider="Rolex Service Center",
+            service_type="Full service",
+            cost=Decimal("850.00"),
+            cost_currency="USD",
+            created_at=NOW,
+            updated_at=NOW,
+        )
+        service.documents = [
+            ServiceDocument(
+                id=uuid.uuid4(),
+                service_history_id=service.id,
+                file_path=f"{service.id}/receipt.pdf",
+                file_name="receipt.pdf",
+                file_size=10240,
+                mime_type="application/pdf",
+                created_at=NOW,
+            )
+        ]
+        rows.append((service, 1))
+    return rows
+
+
+def watches_before(watches: List[Watch]):
+    items = []
+    for watch in watches:
+        watch_dict = WatchListResponse.model_validate(watch).model_dump()
+        primary_image = next((img for img in watch.images if img.is_primary), None)
+        watch_dict["primary_image"] = primary_image
+        items.append(WatchListResponse(**watch_dict))
+    return PaginatedWatchResponse(items=items, total=1000, limit=100, offset=0)
+
+
+def watches_current(watches: List[Watch]):
+    return {"items": watches, "total": 1000, "limit": 100, "offset": 0}
+
+
+def collections_before(rows: list):
+    return [
+        CollectionResponse(
+            id=collection.id,
+            user_id=collection.user_id,
+            name=collection.name,
+            description=collection.description,
+            color=collection.color,
+            is_default=collection.is_default,
+            created_at=collection.created_at,
+            updated_at=collection.updated_at,
+            watch_count=watch_count,
+        )
+        for collection, watch_count in rows
+    ]
+
+
+def collections_current(rows: list):
+    return [
+        {
+            "id": collection.id,
+            "user_id": collection.user_id,
+            "name": collection.name,
+            "description": collection.description,
+            "color": collection.color,
+            "is_default": collection.is_default,
+            "created_at": collection.created_at,
+            "updated_at": collection.updated_at,
+            "watch_count": watch_count,
+        }
+        for collection, watch_count in rows
+    ]
+
+
+SERVICE_COLUMNS = ServiceHistory.__table__.columns.keys()
+
+
+def services_before(rows: list):
+    return [
+        ServiceHistoryListItem(
+            **{column: getattr(service, column) for column in SERVICE_COLUMNS},
+            document_count=count,
+            documents=service.documents,
+        )
+        for service, count in rows
+    ]
+
+
+def services_current(rows: list):
+    return [
+        {
+            **{column: getattr(service, column) for column in SERVICE_COLUMNS},
+            "document_count": count,
+            "documents": service.documents,
+        }
+        for service, count in rows
+    ]
+
+
+def unchanged(rows):
+    return rows
+
+
+ENDPOINTS = [
+    # name, response model, page factory, before, current
+    (
+        "watches",
+        PaginatedWatchResponse,
+        make_watches,
+        watches_before,
+        watches_current,
+    ),
+    (
+        "collections",
+        List[CollectionResponse],
+        make_collections,
+        collections_before,
+        collections_current,
+    ),
+    (
+        "market-values",
+        List[MarketValueResponse],
+        make_market_values,
+        unchanged,
+        unchanged,
+    ),
+    (
+        "service-history",
+        List[ServiceHistoryListItem],
+        make_services,
+        services_before,
+        services_current,
+    ),
+]
+
+
+def response_json(adapter: TypeAdapter, content) -> bytes:
+    """Default response class: validate, then dump to JSON bytes"""
+    value = adapter.validate_python(content, from_attributes=True)
+    return adapter.dump_json(value, by_alias=True)
+
+
+def response_orjson(adapter: TypeAdapter, content) -> bytes:
+    """ORJSONResponse: validate, dump to Python objects, render with orjson"""
+    value = adapter.validate_python(content, from_attributes=True)
+    return orjson.dumps(
+        adapter.dump_python(value, mode="json", by_alias=True),
+        option=orjson.OPT_NON_STR_KEYS,
+    )
+
+
+def time_per_page(fn: Callable[[], bytes], pages: int) -> float:
+    for _ in range(max(pages // 10, 1)):  # warm up
+        fn()
+    start = time.perf_counter()
+    for _ in range(pages):
+        fn()
+    return (time.perf_counter() - start) / pages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'endpoint':<16} {'before':>9} {'orjson':>9} {'current':>9}  (ms/page)")
+    for name, response_model, factory, before, current in ENDPOINTS:
+        adapter = TypeAdapter(response_model)
+        rows = factory(PAGE_SIZE)
+        assert orjson.loads(response_json(adapter, before(rows))) == orjson.loads(
+            response_json(adapter, current(rows))
+        )
+
+        results = [
+            time_per_page(lambda: response_json(adapter, before(rows)), args.pages),
+            time_per_page(lambda: response_orjson(adapter, current(rows)), args.pages),
+            time_per_page(lambda: response_json(adapter, current(rows)), args.pages),
+        ]
+        print(f"{name:<16} " + " ".join(f"{r * 1000:>9.3f}" for r in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,12 @@ Test configuration and fixtures for pytest
 """
 Test configuration and fixtures for pytest
 """
+import asyncio
 import os
 import pytest
 from typing import Generator
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.main import app
@@ -72,6 +73,26 @@ def client(test_db: Session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def event_loop_queries() -> Generator[list, None, None]:
+    """
+    Collect statements executed on the event loop thread (blocking it)
+    rather than in the threadpool.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
 @pytest.fixture(scope="function")
 def test_user(test_db: Session) -> User:
     """
@@ -217,3 +238,59 @@ def mock_upload_dir(tmp_path, monkeypatch):
     monkeypatch.setattr(config.settings, "UPLOAD_DIR", str(upload_dir))
 
     return upload_dir
+
+
+@pytest.fixture(scope="function")
+def mock_export_cache(tmp_path, monkeypatch):
+    """
+    Point the rendered export cache at a temporary directory.
+    """
+    from app.utils.export_cache import export_cache
+
+    cache_dir = tmp_path / "exports"
+    monkeypatch.setattr(export_cache, "directory", str(cache_dir))
+
+    return cache_dir
+
+
+@pytest.fixture(scope="function", autouse=True)
+def mock_qr_cache(tmp_path, monkeypatch):
+    """
+    Point the QR code disk cache at a temporary directory and start each
+    test with an empty in-memory cache.
+    """
+    from app.utils.qr_code import get_watch_qr_image, qr_disk_cache, qr_matrix
+
+    cache_dir = tmp_path / "qr"
+    monkeypatch.setattr(qr_disk_cache, "directory", str(cache_dir))
+    get_watch_qr_image.cache_clear()
+    qr_matrix.cache_clear()
+
+    return cache_dir
+
+
+@pytest.fixture(scope="function")
+def mock_backup_dir(tmp_path, monkeypatch):
+    """
+    Create a temporary backup directory and mock the backup path.
+    """
+    backup_dir = tmp_path / "backups"
+    backup_dir.mkdir()
+
+    from app import config
+    monkeypatch.setattr(config.settings, "BACKUP_DIR", str(backup_dir))
+
+    return backup_dir
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_reference_snapshot():
+    """
+    Drop the in-process reference data snapshot after each test, since the
+    reference tables are recreated per test.
+    """
+    from app.utils.reference_data import clear_reference_snapshot
+
+    clear_reference_snapshot()
+    yield
+    clear_reference_snapshot()
@@ -0,0 +1,300 @@
+"""
+Tests for account backup and restore
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from app.models.market_value import MarketValue
+from app.models.user import User, UserRole
+from app.models.watch import Watch
+from app.models.watch_image import WatchImage
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def test_image(test_db: Session, test_watch: Watch, mock_upload_dir) -> WatchImage:
+    """Create a watch image record with a file on disk"""
+    file_path = f"{test_watch.id}/photo.jpg"
+    (mock_upload_dir / str(test_watch.id)).mkdir()
+    (mock_upload_dir / file_path).write_bytes(b"original image bytes")
+
+    image = WatchImage(
+        watch_id=test_watch.id,
+        file_path=file_path,
+        file_name="photo.jpg",
+        file_size=20,
+        mime_type="image/jpeg",
+        is_primary=True,
+    )
+    test_db.add(image)
+    test_db.commit()
+    return image
+
+
+def create_backup(client: TestClient, headers: dict, **params) -> dict:
+    response = client.post("/api/v1/backups/", headers=headers, params=params)
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.usefixtures("mock_backup_dir")
+class TestCreateBackup:
+    """Test backup creation"""
+
+    def test_full_backup(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_image: WatchImage,
+        mock_backup_dir,
+    ):
+        """Test that the first backup is a full backup with files"""
+        backup = create_backup(client, auth_headers)
+
+        assert backup["kind"] == "full"
+        assert backup["parent_id"] is None
+        assert backup["row_counts"]["watches"] == 1
+        assert backup["row_counts"]["collections"] == 1
+        assert backup["row_counts"]["watch_images"] == 1
+        assert backup["file_count"] == 1
+        assert backup["blob_count"] == 1
+        assert backup["size_bytes"] > 0
+
+        user_dir = mock_backup_dir / backup["user_id"]
+        assert (user_dir / f"{backup['id']}.tar.gz").exists()
+        assert (user_dir / f"{backup['id']}.json").exists()
+
+    def test_incremental_backup_only_copies_changes(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_image: WatchImage,
+        test_db: Session,
+    ):
+        """Test that unchanged rows and files are not stored again"""
+        full = create_backup(client, auth_headers)
+
+        other = Watch(
+            user_id=test_watch.user_id, brand_id=test_watch.brand_id, model="Explorer"
+        )
+        test_db.add(other)
+        test_db.commit()
+
+        incremental = create_backup(client, auth_headers)
+
+        assert incremental["kind"] == "incremental"
+        assert incremental["parent_id"] == full["id"]
+        assert incremental["row_counts"]["watches"] == 1
+        # Tables without change tokens are written in full
+        assert incremental["row_counts"]["collections"] == 1
+        assert incremental["file_count"] == 1
+        assert incremental["blob_count"] == 0
+
+    def test_non_incremental_backup(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test forcing a full backup"""
+        create_backup(client, auth_headers)
+        backup = create_backup(client, auth_headers, incremental=False)
+
+        assert backup["kind"] == "full"
+
+    def test_list_backups(self, client: TestClient, auth_headers: dict, test_watch: Watch):
+        """Test listing backups newest first"""
+        first = create_backup(client, auth_headers)
+        second = create_backup(client, auth_headers)
+
+        response = client.get("/api/v1/backups/", headers=auth_headers)
+        assert response.status_code == 200
+        assert [b["id"] for b in response.json()] == [second["id"], first["id"]]
+
+    def test_backup_other_user_requires_admin(
+        self, client: TestClient, auth_headers: dict, test_user2: User
+    ):
+        """Test that regular users cannot back up other accounts"""
+        response = client.post(
+            "/api/v1/backups/",
+            headers=auth_headers,
+            params={"user_id": str(test_user2.id)},
+        )
+        assert response.status_code == 403
+
+    def test_admin_backs_up_other_user(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user: User,
+        test_user2: User,
+        test_db: Session,
+    ):
+        """Test that admins can back up any account"""
+        test_user.role = UserRole.admin
+        test_db.commit()
+
+        backup = create_backup(client, auth_headers, user_id=str(test_user2.id))
+        assert backup["user_id"] == str(test_user2.id)
+
+
+@pytest.mark.usefixtures("mock_backup_dir")
+class TestRestoreBackup:
+    """Test restoring backups"""
+
+    def test_restore_reverts_changes(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_image: WatchImage,
+        test_db: Session,
+        mock_upload_dir,
+    ):
+        """Test that edits, deletions, additions and files are reverted"""
+        test_db.add(MarketValue(watch_id=test_watch.id, value=1000, currency="USD"))
+        test_db.commit()
+        backup = create_backup(client, auth_headers)
+
+        watch_id = test_watch.id
+        original_model = test_watch.model
+        client.put(
+            f"/api/v1/watches/{watch_id}", headers=auth_headers, json={"model": "Edited"}
+        )
+        test_db.query(MarketValue).delete()
+        test_db.add(
+            Watch(user_id=test_watch.user_id, brand_id=test_watch.brand_id, model="New")
+        )
+        test_db.commit()
+        (mock_upload_dir / test_image.file_path).unlink()
+
+        response = client.post(
+            f"/api/v1/backups/{backup['id']}/restore", headers=auth_headers
+        )
+        assert response.status_code == 200
+        result = response.json()
+        assert result["rows_deleted"]["watches"] == 1
+        assert result["files_restored"] == 1
+
+        test_db.expire_all()
+        watches = test_db.query(Watch).all()
+        assert [(w.id, w.model) for w in watches] == [(watch_id, original_model)]
+        assert test_db.query(MarketValue).count() == 1
+        assert (
+            mock_upload_dir / test_image.file_path
+        ).read_bytes() == b"original image bytes"
+
+    def test_restore_incremental_chain(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_image: WatchImage,
+        test_db: Session,
+    ):
+        """Test restoring an incremental backup applies its whole chain"""
+        create_backup(client, auth_headers)
+        client.put(
+            f"/api/v1/watches/{test_watch.id}",
+            headers=auth_headers,
+            json={"model": "Second"},
+        )
+        incremental = create_backup(client, auth_headers)
+        client.delete(f"/api/v1/watches/{test_watch.id}", headers=auth_headers)
+
+        response = client.post(
+            f"/api/v1/backups/{incremental['id']}/restore", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        test_db.expire_all()
+        watch = test_db.query(Watch).one()
+        assert watch.model == "Second"
+        assert test_db.query(WatchImage).count() == 1
+
+    def test_row_committed_after_backup(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session,
+    ):
+        """Test that a row written before a backup but committed after it is kept"""
+        session_a = TestingSessionLocal()
+        try:
+            # Core insert: no flush, so A does not hold the user's data
+            # version row that the update below bumps
+            late_id = session_a.execute(
+                insert(Watch)
+                .values(
+                    user_id=test_watch.user_id,
+                    brand_id=test_watch.brand_id,
+                    model="Committed late",
+                )
+                .returning(Watch.id)
+            ).scalar_one()
+
+            test_watch.notes = "Written after A, committed before it"
+            test_db.commit()
+            create_backup(client, auth_headers)
+
+            session_a.commit()
+        finally:
+            session_a.close()
+
+        incremental = create_backup(client, auth_headers)
+        test_db.execute(delete(Watch).where(Watch.id == late_id))
+        test_db.commit()
+
+        response = client.post(
+            f"/api/v1/backups/{incremental['id']}/restore", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        test_db.expire_all()
+        assert test_db.get(Watch, late_id).model == "Committed late"
+
+    def test_restore_unknown_backup(self, client: TestClient, auth_headers: dict):
+        """Test restoring a backup that does not exist"""
+        response = client.post(
+            "/api/v1/backups/20240101T000000000000Z-full/restore", headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    def test_restore_missing_archive(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        mock_backup_dir,
+    ):
+        """Test that a manifest without its archive is reported as not found"""
+        backup = create_backup(client, auth_headers)
+        (mock_backup_dir / backup["user_id"] / f"{backup['id']}.tar.gz").unlink()
+
+        response = client.post(
+            f"/api/v1/backups/{backup['id']}/restore", headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    def test_restore_rejects_malformed_id(self, client: TestClient, auth_headers: dict):
+        """Test that backup ids cannot escape the backup directory"""
+        response = client.post(
+            "/api/v1/backups/..%2F..%2Fetc/restore", headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    def test_restore_other_users_backup(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        auth_headers2: dict,
+        test_watch: Watch,
+    ):
+        """Test that backups are scoped to their owner"""
+        backup = create_backup(client, auth_headers)
+
+        response = client.post(
+            f"/api/v1/backups/{backup['id']}/restore", headers=auth_headers2
+        )
+        assert response.status_code == 404
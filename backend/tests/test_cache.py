@@ -0,0 +1,391 @@
+"""
+Tests for the Redis cache helpers
+"""
+
+import fnmatch
+
+import orjson
+import pytest
+import redis
+
+from app.utils import cache
+
+
+class FakeRedis:
+    """Dict-backed subset of the redis-py client used by app.utils.cache"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.commands = []
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def get(self, key):
+        self.commands.append("GET")
+        value = self.data.get(key)
+        return value if isinstance(value, bytes) else None
+
+    def pttl(self, key):
+        self.commands.append("PTTL")
+        return self.ttls[key] * 1000 if key in self.data else -2
+
+    def set(self, key, value, nx=False, px=None):
+        self.commands.append("SET")
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def eval(self, script, numkeys, key, token):
+        # Only the lock release script is used
+        if self.data.get(key) == token:
+            return self.unlink(key)
+        return 0
+
+    def setex(self, key, expire, value):
+        self.commands.append("SETEX")
+        self.data[key] = value
+        self.ttls[key] = expire
+
+    def sadd(self, key, *members):
+        self.commands.append("SADD")
+        self.data.setdefault(key, set()).update(members)
+
+    def expire(self, key, seconds, nx=False, gt=False):
+        self.commands.append("EXPIRE")
+        current = self.ttls.get(key)
+        if (nx and current is not None) or (gt and (current is None or seconds <= current)):
+            return False
+        self.ttls[key] = seconds
+        return True
+
+    def spop(self, key, count):
+        self.commands.append("SPOP")
+        members = self.data.get(key, set())
+        popped = [members.pop() for _ in range(min(count, len(members)))]
+        if not members:
+            self.data.pop(key, None)
+        return popped
+
+    def exists(self, *keys):
+        self.commands.append("EXISTS")
+        return sum(key in self.data for key in keys)
+
+    def unlink(self, *keys):
+        self.commands.append("UNLINK")
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    delete = unlink
+
+    def scan_iter(self, match="*", count=None):
+        self.commands.append("SCAN")
+        return iter([key for key in list(self.data) if fnmatch.fnmatch(key, match)])
+
+    def publish(self, channel, message):
+        self.published.append((channel, orjson.loads(message)))
+        return 1
+
+    def keys(self, pattern):
+        raise AssertionError("KEYS must not be used")
+
+
+class AsyncFakeRedis:
+    """Awaitable view of a FakeRedis, standing in for redis.asyncio.Redis"""
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+
+    def pipeline(self, transaction=True):
+        return AsyncFakePipeline(self.client)
+
+    async def spop(self, key, count):
+        return self.client.spop(key, count)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        return [getattr(self.client, name)(*a, **kw) for name, a, kw in self.calls]
+
+
+class AsyncFakePipeline(FakePipeline):
+    async def execute(self):
+        return super().execute()
+
+
+class FailingRedis:
+    """Client whose every command fails as if Redis were down"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def pipeline(self, transaction=True):
+        self.calls += 1
+        raise redis.ConnectionError("down")
+
+
+@pytest.fixture(autouse=True)
+def reset_cache_state(monkeypatch):
+    monkeypatch.setattr(cache, "_retry_at", 0.0)
+    cache.local_cache.clear()
+    yield
+    cache.local_cache.enabled = False
+    cache.local_cache.clear()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "redis_client", client)
+    return client
+
+
+@pytest.fixture
+def local_layer() -> cache.LocalCache:
+    """Enable the in-process layer as if the invalidation listener ran"""
+    cache.local_cache.enabled = True
+    return cache.local_cache
+
+
+class TestTagInvalidation:
+    """Test tag-based cache invalidation"""
+
+    def test_set_registers_tags(self, fake_redis: FakeRedis):
+        """Test that entries are added to their tag sets"""
+        assert cache.cache_set("a", {"x": 1}, 60, tags=[cache.user_tag("u1")])
+        assert cache.cache_get("a") == {"x": 1}
+        assert fake_redis.data["tag:user:u1"] == {"a"}
+        assert fake_redis.ttls["tag:user:u1"] == 60
+
+    def test_tag_set_outlives_entries(self, fake_redis: FakeRedis):
+        """Test that a tag set's TTL only grows"""
+        cache.cache_set("a", 1, 600, tags=["t"])
+        cache.cache_set("b", 2, 60, tags=["t"])
+        assert fake_redis.ttls["tag:t"] == 600
+
+    def test_invalidate_by_tag(self, fake_redis: FakeRedis, monkeypatch):
+        """Test that only entries under the tag are deleted, in batches"""
+        monkeypatch.setattr(cache, "INVALIDATE_BATCH_SIZE", 2)
+        for i in range(5):
+            cache.cache_set(f"watch-{i}", i, tags=[cache.user_tag("u1")])
+        cache.cache_set("other", 0, tags=[cache.user_tag("u2")])
+
+        assert cache.cache_invalidate_tags(cache.user_tag("u1")) == 5
+        assert fake_redis.commands.count("SPOP") == 4
+        assert cache.cache_get("watch-0") is None
+        assert cache.cache_get("other") == 0
+        assert "tag:user:u1" not in fake_redis.data
+
+    def test_invalidate_several_tags(self, fake_redis: FakeRedis):
+        """Test entity and user tags together"""
+        cache.cache_set("a", 1, tags=[cache.entity_tag("watch", "w1")])
+        cache.cache_set("b", 2, tags=[cache.user_tag("u1")])
+        assert cache.cache_invalidate_tags(
+            cache.entity_tag("watch", "w1"), cache.user_tag("u1")
+        ) == 2
+
+    def test_fallback_to_scan(self, fake_redis: FakeRedis):
+        """Test clearing untagged entries by pattern"""
+        cache.cache_set("analytics:u1:a", 1)
+        cache.cache_set("analytics:u1:b", 2)
+        cache.cache_set("analytics:u2:a", 3)
+
+        deleted = cache.cache_invalidate_tags(
+            cache.user_tag("u1"), fallback_pattern="analytics:u1:*"
+        )
+
+        assert deleted == 2
+        assert "SCAN" in fake_redis.commands
+        assert cache.cache_get("analytics:u2:a") == 3
+
+    def test_no_fallback_when_tagged(self, fake_redis: FakeRedis):
+        """Test that existing tag sets are used instead of scanning"""
+        cache.cache_set("analytics:u1:a", 1, tags=[cache.user_tag("u1")])
+        cache.cache_invalidate_tags(cache.user_tag("u1"), fallback_pattern="analytics:*")
+        assert "SCAN" not in fake_redis.commands
+
+    def test_clear_pattern_uses_scan(self, fake_redis: FakeRedis):
+        """Test that pattern clearing never issues KEYS"""
+        cache.cache_set("x:1", 1)
+        cache.cache_set("y:1", 1)
+        assert cache.cache_clear_pattern("x:*") == 1
+
+    def test_redis_unavailable(self, monkeypatch):
+        """Test that helpers degrade to no-ops without Redis"""
+        monkeypatch.setattr(cache, "redis_client", None)
+        assert cache.cache_set("a", 1, tags=["t"]) is False
+        assert cache.cache_invalidate_tags("t") == 0
+        assert cache.cache_clear_pattern("*") == 0
+
+
+class TestLocalCache:
+    """Test the in-process LRU layer"""
+
+    def test_disabled_until_listening(self):
+        """Test that nothing is kept without the invalidation listener"""
+        local = cache.LocalCache(max_entries=2, ttl=10)
+        local.set("a", b"1")
+        assert local.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the entry bound"""
+        local = cache.LocalCache(max_entries=2, ttl=10)
+        local.enabled = True
+        local.set("a", b"1")
+        local.set("b", b"2")
+        local.get("a")
+        local.set("c", b"3")
+        assert local.get("a") == b"1"
+        assert local.get("b") is None
+        assert len(local) == 2
+
+    def test_expiry(self, monkeypatch):
+        """Test that entries live at most the local TTL or the given TTL"""
+        now = [100.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        local = cache.LocalCache(max_entries=10, ttl=10)
+        local.enabled = True
+        local.set("a", b"1")
+        local.set("b", b"2", ttl=2)
+        now[0] += 5
+        assert local.get("a") == b"1"
+        assert local.get("b") is None
+        now[0] += 6
+        assert local.get("a") is None
+
+    def test_delete_matching(self):
+        """Test pattern deletion"""
+        local = cache.LocalCache(max_entries=10, ttl=10)
+        local.enabled = True
+        local.set("x:1", b"1")
+        local.set("y:1", b"1")
+        local.delete_matching("x:*")
+        assert local.get("x:1") is None
+        assert local.get("y:1") == b"1"
+
+
+class TestTwoTierCache:
+    """Test the local layer in front of Redis"""
+
+    def test_hits_served_locally(self, fake_redis: FakeRedis, local_layer):
+        """Test that repeated reads skip Redis"""
+        fake_redis.setex("a", 60, orjson.dumps({"x": 1}))
+        assert cache.cache_get("a") == {"x": 1}
+        assert cache.cache_get("a") == {"x": 1}
+        assert fake_redis.commands.count("GET") == 1
+
+    def test_writes_publish_invalidations(self, fake_redis: FakeRedis, local_layer):
+        """Test that other workers are told about set, delete and clear"""
+        cache.cache_set("a", 1, tags=["t"])
+        cache.cache_delete("a")
+        cache.cache_set("b", 2, tags=["t"])
+        cache.cache_invalidate_tags("t")
+        cache.cache_clear_pattern("c:*")
+
+        messages = [message for _, message in fake_redis.published]
+        assert [sorted(m["keys"]) for m in messages] == [
+            ["a"], ["a"], ["b"], ["a", "b"], []
+        ]
+        assert messages[-1]["pattern"] == "c:*"
+        assert {m["origin"] for m in messages} == {cache.WORKER_ID}
+        assert cache.cache_get("b") is None
+
+    def test_handle_invalidation(self, local_layer):
+        """Test that messages from other workers drop local entries"""
+        local_layer.set("a", b"1")
+        local_layer.set("p:1", b"1")
+
+        cache.handle_invalidation(orjson.dumps({"origin": cache.WORKER_ID, "keys": ["a"]}))
+        assert local_layer.get("a") == b"1"
+
+        cache.handle_invalidation(
+            orjson.dumps({"origin": "other", "keys": ["a"], "pattern": "p:*"})
+        )
+        assert local_layer.get("a") is None
+        assert local_layer.get("p:1") is None
+
+        cache.handle_invalidation(b"not json")
+
+    def test_reconnects_after_outage(self, monkeypatch):
+        """Test that Redis is skipped for a while after failing, then retried"""
+        now = [100.0]
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+        failing = FailingRedis()
+        monkeypatch.setattr(cache, "redis_client", failing)
+
+        assert cache.cache_get("a") is None
+        assert cache.cache_set("a", 1) is False
+        assert failing.calls == 1
+
+        now[0] += cache.settings.CACHE_RECONNECT_SECONDS
+        working = FakeRedis()
+        monkeypatch.setattr(cache, "redis_client", working)
+        assert cache.cache_set("a", 1) is True
+        assert cache.cache_get("a") == 1
+
+
+class TestAsyncCache:
+    """Test the redis.asyncio variant"""
+
+    @pytest.fixture
+    def async_cache(self, fake_redis: FakeRedis, monkeypatch) -> cache.AsyncCache:
+        monkeypatch.setattr(
+            cache.aioredis, "Redis", lambda **kwargs: AsyncFakeRedis(fake_redis)
+        )
+        return cache.AsyncCache()
+
+    async def test_round_trip(self, async_cache: cache.AsyncCache, local_layer):
+        """Test set, get, delete and tag invalidation"""
+        assert await async_cache.set("a", [1, 2], tags=["t"])
+        local_layer.clear()
+        assert await async_cache.get("a") == [1, 2]
+        assert await async_cache.invalidate_tags("t") == 1
+        assert await async_cache.get("a") is None
+
+        await async_cache.set("b", 1)
+        assert await async_cache.delete("b")
+        assert await async_cache.get("b") is None
+
+    async def test_shares_local_layer(
+        self, async_cache: cache.AsyncCache, fake_redis: FakeRedis, local_layer
+    ):
+        """Test that sync writes are visible to async reads and vice versa"""
+        cache.cache_set("a", "sync")
+        assert await async_cache.get("a") == "sync"
+        await async_cache.set("b", "async")
+        assert cache.cache_get("b") == "async"
+        assert "GET" not in fake_redis.commands
+
+
+class TestLocks:
+    """Test locks shared across workers"""
+
+    def test_acquire_and_release(self, fake_redis: FakeRedis):
+        """Test that a lock has one holder and only it can release"""
+        token = cache.cache_lock_acquire("job", 30)
+        assert token
+        assert cache.cache_lock_acquire("job", 30) is None
+        assert cache.cache_lock_held("job")
+
+        cache.cache_lock_release("job", "someone-else")
+        assert cache.cache_lock_held("job")
+        cache.cache_lock_release("job", token)
+        assert not cache.cache_lock_held("job")
+
+    def test_without_redis(self, monkeypatch):
+        """Test that no lock is ever held without Redis"""
+        monkeypatch.setattr(cache, "redis_client", None)
+        assert cache.cache_lock_acquire("job", 30) is None
+        assert not cache.cache_lock_held("job")
@@ -0,0 +1,76 @@
+"""
+Tests for the cache headers middleware
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.middleware.cache import CacheMiddleware
+
+
+def plain(request):
+    return PlainTextResponse("ok")
+
+
+def private(request):
+    return PlainTextResponse("ok", headers={"Cache-Control": "private, no-cache"})
+
+
+def stream(request):
+    return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+
+@pytest.fixture
+def middleware_client() -> TestClient:
+    app = Starlette(
+        routes=[
+            Route("/api/v1/reference/brands", private),
+            Route("/uploads/photo.jpg", plain),
+            Route("/api/v1/watches/", plain, methods=["GET", "POST"]),
+            Route("/api/v1/watches/export", private),
+            Route("/api/v1/watches/stream", stream),
+            Route("/", plain),
+        ]
+    )
+    app.add_middleware(CacheMiddleware)
+    return TestClient(app)
+
+
+class TestCacheMiddleware:
+    """Test Cache-Control headers added per path prefix"""
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/api/v1/reference/brands", "public, max-age=3600"),
+            ("/uploads/photo.jpg", "public, max-age=31536000, immutable"),
+            ("/api/v1/watches/", "no-cache, no-store, must-revalidate"),
+            ("/api/v1/watches/export", "private, no-cache"),
+        ],
+    )
+    def test_cache_control(self, middleware_client: TestClient, path, expected):
+        """Test the header chosen for each kind of path"""
+        response = middleware_client.get(path)
+        assert response.status_code == 200
+        assert response.headers.get_list("cache-control") == [expected]
+
+    def test_unmatched_path(self, middleware_client: TestClient):
+        """Test that paths outside the table are left alone"""
+        response = middleware_client.get("/")
+        assert "cache-control" not in response.headers
+
+    def test_only_get_requests(self, middleware_client: TestClient):
+        """Test that non-GET responses are left alone"""
+        response = middleware_client.post("/api/v1/watches/")
+        assert "cache-control" not in response.headers
+
+    def test_streaming_response(self, middleware_client: TestClient):
+        """Test that streamed bodies pass through intact"""
+        response = middleware_client.get("/api/v1/watches/stream")
+        assert response.content == b"abc"
+        assert response.headers["cache-control"] == (
+            "no-cache, no-store, must-revalidate"
+        )
@@ -88,6 +88,49 @@ class TestListCollections:
         assert all(item["name"] != "User 2 Collection" for item in data)
 
 
+    def test_list_collections_not_modified(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_collection: Collection
+    ):
+        """Test that an unchanged list is answered with 304"""
+        etag = client.get(
+            "/api/v1/collections/", headers=auth_headers
+        ).headers["etag"]
+
+        response = client.get(
+            "/api/v1/collections/",
+            headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+    def test_list_collections_etag_changes_with_watch_count(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_collection: Collection,
+        test_watch
+    ):
+        """Test that moving a watch out of a collection invalidates the ETag"""
+        etag = client.get(
+            "/api/v1/collections/", headers=auth_headers
+        ).headers["etag"]
+
+        client.put(
+            f"/api/v1/watches/{test_watch.id}",
+            headers=auth_headers,
+            json={"collection_id": None}
+        )
+
+        response = client.get(
+            "/api/v1/collections/",
+            headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.json()[0]["watch_count"] == 0
+
+
 class TestGetCollection:
     """Test getting collection detail"""
 
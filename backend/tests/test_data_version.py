@@ -0,0 +1,133 @@
+"""
+Tests for per-user data version counters
+"""
+
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.collection import Collection
+from app.models.service_history import ServiceDocument, ServiceHistory
+from app.models.user import User
+from app.models.watch import Watch
+from app.utils.data_version import DataVersions, load_data_versions
+
+
+def versions(db: Session, user: User) -> DataVersions:
+    db.expire_all()
+    return load_data_versions(db, user.id)
+
+
+class TestDataVersions:
+    """Test that writes bump the owner's counters"""
+
+    def test_new_user_all_zero(self, test_db: Session, test_user: User):
+        """Test that a user without data has zero versions"""
+        current = versions(test_db, test_user)
+        assert current == DataVersions(user_id=test_user.id)
+        assert current.token() == (
+            "watches0.images0.values0.readings0.services0.collections0"
+        )
+
+    def test_orm_writes_bump_their_family(
+        self, test_db: Session, test_user: User, test_watch: Watch
+    ):
+        """Test inserts, updates and deletes of each family"""
+        after_create = versions(test_db, test_user)
+        assert after_create.watches == 1
+        assert after_create.services == 0
+
+        service = ServiceHistory(
+            watch_id=test_watch.id, service_date=datetime.utcnow(), provider="AD"
+        )
+        test_db.add(service)
+        test_db.commit()
+        test_db.add(ServiceDocument(
+            service_history_id=service.id,
+            file_path="a/b/receipt.pdf",
+            file_name="receipt.pdf",
+            file_size=10,
+            mime_type="application/pdf",
+        ))
+        test_db.commit()
+        current = versions(test_db, test_user)
+        assert current.services == 2
+        assert current.watches == 1
+
+        test_watch.model = "Sea-Dweller"
+        test_db.commit()
+        assert versions(test_db, test_user).watches == 2
+
+        # Loading without changing anything does not bump
+        test_db.query(Watch).all()
+        test_db.commit()
+        assert versions(test_db, test_user).watches == 2
+
+        test_db.delete(service)
+        test_db.commit()
+        assert versions(test_db, test_user).services == 3
+
+    def test_versions_are_per_user(
+        self,
+        test_db: Session,
+        test_user: User,
+        test_user2: User,
+        test_watch: Watch
+    ):
+        """Test that one user's writes do not touch another's versions"""
+        assert versions(test_db, test_user).watches == 1
+        assert versions(test_db, test_user2).watches == 0
+
+    def test_rolled_back_writes_do_not_bump(
+        self, test_db: Session, test_user: User, test_watch: Watch
+    ):
+        """Test that the bump is part of the writing transaction"""
+        test_watch.model = "Explorer"
+        test_db.flush()
+        test_db.rollback()
+        assert versions(test_db, test_user).watches == 1
+
+    def test_bulk_paths_bump(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_db: Session,
+        test_user: User,
+        test_watch: Watch
+    ):
+        """Test endpoints that write with Core statements"""
+        response = client.post(
+            "/api/v1/watches/market-values/bulk",
+            headers=auth_headers,
+            json={"values": [
+                {"watch_id": str(test_watch.id), "value": "12000", "currency": "USD"}
+            ]}
+        )
+        assert response.status_code == 201
+        current = versions(test_db, test_user)
+        assert current.values == 1
+        assert current.watches == 2
+
+        response = client.delete(
+            f"/api/v1/collections/{test_watch.collection_id}", headers=auth_headers
+        )
+        assert response.status_code == 204
+        assert versions(test_db, test_user).watches == 3
+
+    def test_deleting_user_with_data(
+        self, test_db: Session, test_user: User, test_watch: Watch
+    ):
+        """Test that deleting an account does not try to bump its versions"""
+        test_db.delete(test_user)
+        test_db.commit()
+        assert test_db.query(Collection).count() == 0
+
+    def test_dependency_helpers(self, test_user: User):
+        """Test cache key and ETag helpers"""
+        current = DataVersions(user_id=test_user.id, watches=4, images=2)
+        assert current.token("watches", "images") == "watches4.images2"
+        assert current.cache_key("list", "watches") == (
+            f"list:{test_user.id}:watches4"
+        )
+        assert current.etag("list", "watches") != current.etag("list", "images")
@@ -0,0 +1,215 @@
+"""
+Tests for read-replica session routing
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.database import (
+    ReplicaLagMonitor,
+    RoutingSession,
+    StickyPrimaryRegistry,
+    route_session_for_user,
+)
+from app.utils import cache
+from tests.test_cache import FakeRedis
+
+
+class FakeLagMonitor:
+    """Lag monitor stub with a fixed freshness per engine"""
+
+    def __init__(self, fresh):
+        self.fresh = fresh
+
+    def is_fresh(self, replica):
+        return self.fresh.get(replica, False)
+
+
+@pytest.fixture
+def engines():
+    primary = create_engine("sqlite://")
+    replica_a = create_engine("sqlite://")
+    replica_b = create_engine("sqlite://")
+    return primary, replica_a, replica_b
+
+
+def make_session(primary, replicas, fresh):
+    session_cls = type(
+        "TestRoutingSession",
+        (RoutingSession,),
+        {"replicas": replicas, "lag_monitor": FakeLagMonitor(fresh)},
+    )
+    return session_cls(bind=primary)
+
+
+class TestRoutingSession:
+    """Test engine selection for reads and writes"""
+
+    def test_writes_use_primary(self, engines):
+        """Sessions not marked read-only always use the primary"""
+        primary, replica_a, _ = engines
+        session = make_session(primary, [replica_a], {replica_a: True})
+
+        assert session.get_bind() is primary
+
+    def test_read_only_uses_fresh_replica(self, engines):
+        """Read-only sessions are routed to a fresh replica"""
+        primary, replica_a, _ = engines
+        session = make_session(primary, [replica_a], {replica_a: True})
+        session.info["read_only"] = True
+
+        assert session.get_bind() is replica_a
+
+    def test_stale_replicas_fall_back_to_primary(self, engines):
+        """Replicas beyond the staleness tolerance are skipped"""
+        primary, replica_a, replica_b = engines
+        session = make_session(primary, [replica_a, replica_b], {})
+        session.info["read_only"] = True
+
+        assert session.get_bind() is primary
+
+    def test_skips_stale_replica(self, engines):
+        """A fresh replica is chosen over a stale one"""
+        primary, replica_a, replica_b = engines
+        session = make_session(
+            primary, [replica_a, replica_b], {replica_a: False, replica_b: True}
+        )
+        session.info["read_only"] = True
+
+        assert session.get_bind() is replica_b
+
+    def test_replica_pinned_per_session(self, engines):
+        """A session keeps using the same replica for all its reads"""
+        primary, replica_a, replica_b = engines
+        session = make_session(
+            primary, [replica_a, replica_b], {replica_a: True, replica_b: True}
+        )
+        session.info["read_only"] = True
+
+        first = session.get_bind()
+        assert all(session.get_bind() is first for _ in range(5))
+
+    def test_no_replicas_configured(self, engines):
+        """Without replicas every session uses the primary"""
+        primary, _, _ = engines
+        session = make_session(primary, [], {})
+        session.info["read_only"] = True
+
+        assert session.get_bind() is primary
+
+
+class TestReplicaLagMonitor:
+    """Test replica lag measurement"""
+
+    def test_hanging_replica_does_not_block_routing(self):
+        """Other threads are not held up while one replica is measured"""
+        release = threading.Event()
+        connecting = threading.Event()
+
+        class HangingReplica:
+            def connect(self):
+                connecting.set()
+                release.wait(5)
+                raise OSError("unreachable")
+
+        class FailingReplica:
+            def connect(self):
+                raise OSError("unreachable")
+
+        monitor = ReplicaLagMonitor(max_lag_seconds=5, check_interval=60)
+        hanging = HangingReplica()
+        measuring = threading.Thread(target=monitor.is_fresh, args=(hanging,))
+        measuring.start()
+        try:
+            assert connecting.wait(5)
+            assert monitor.is_fresh(hanging) is False
+            assert monitor.is_fresh(FailingReplica()) is False
+        finally:
+            release.set()
+            measuring.join()
+
+
+class TestStickyPrimary:
+    """Test read-your-writes routing"""
+
+    @pytest.fixture
+    def session_factory(self, engines):
+        primary, replica_a, _ = engines
+
+        def factory(method):
+            session = make_session(primary, [replica_a], {replica_a: True})
+            session.info.update(
+                request_method=method, read_only=method in ("GET", "HEAD")
+            )
+            return session
+
+        return factory
+
+    @pytest.fixture
+    def redis_client(self, monkeypatch):
+        client = FakeRedis()
+        monkeypatch.setattr(cache, "redis_client", client)
+        monkeypatch.setattr(cache, "_retry_at", 0.0)
+        return client
+
+    def test_mutation_marks_user_sticky(self, monkeypatch, session_factory):
+        """A write request keeps the user's next reads on the primary"""
+        registry = StickyPrimaryRegistry(window_seconds=10)
+        monkeypatch.setattr("app.database.sticky_primary", registry)
+
+        route_session_for_user(session_factory("POST"), "user-1")
+        read_session = session_factory("GET")
+        route_session_for_user(read_session, "user-1")
+
+        assert registry.is_sticky("user-1")
+        assert read_session.info["read_only"] is False
+
+    def test_mark_shared_between_workers(self, redis_client):
+        """A read on another worker sees the writer's mark"""
+        writer = StickyPrimaryRegistry(window_seconds=10)
+        reader = StickyPrimaryRegistry(window_seconds=10)
+
+        writer.mark("user-1")
+
+        assert reader.is_sticky("user-1")
+        assert not reader.is_sticky("user-2")
+
+    def test_local_mark_without_redis(self, monkeypatch):
+        """The writing worker keeps the mark when Redis is unavailable"""
+        monkeypatch.setattr(cache, "redis_client", None)
+        registry = StickyPrimaryRegistry(window_seconds=10)
+        registry.mark("user-1")
+
+        assert registry.is_sticky("user-1")
+
+    def test_other_users_still_use_replicas(self, monkeypatch, session_factory):
+        """Stickiness is tracked per user"""
+        registry = StickyPrimaryRegistry(window_seconds=10)
+        registry.mark("user-1")
+        monkeypatch.setattr("app.database.sticky_primary", registry)
+
+        read_session = session_factory("GET")
+        route_session_for_user(read_session, "user-2")
+
+        assert read_session.info["read_only"] is True
+
+    def test_no_tracking_without_replicas(self, monkeypatch, redis_client):
+        """Nothing is written to Redis when every read uses the primary"""
+        registry = StickyPrimaryRegistry(window_seconds=10)
+        monkeypatch.setattr("app.database.sticky_primary", registry)
+
+        write_session = make_session(create_engine("sqlite://"), [], {})
+        write_session.info.update(request_method="POST", read_only=False)
+        route_session_for_user(write_session, "user-1")
+
+        assert redis_client.commands == []
+
+    def test_sticky_window_expires(self, monkeypatch):
+        """Users are released from the primary after the window"""
+        monkeypatch.setattr(cache, "redis_client", None)
+        registry = StickyPrimaryRegistry(window_seconds=0)
+        registry.mark("user-1")
+
+        assert not registry.is_sticky("user-1")
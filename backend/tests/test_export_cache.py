@@ -0,0 +1,136 @@
+"""
+Tests for the rendered export cache
+"""
+import os
+from io import BytesIO
+
+import pytest
+
+from app.utils import export_cache as export_cache_module
+from app.utils.export_cache import ExportCache, etag_matches, make_etag
+
+
+class TestMakeEtag:
+    """Test ETag construction"""
+
+    def test_etag_is_quoted_and_stable(self):
+        """Test that equal parts produce equal quoted ETags"""
+        etag = make_etag("watch-pdf", 1, "abc")
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == make_etag("watch-pdf", 1, "abc")
+
+    def test_etag_changes_with_parts(self):
+        """Test that any differing part changes the ETag"""
+        assert make_etag("watch-pdf", 1, "abc") != make_etag("watch-pdf", 1, "abd")
+
+
+class TestEtagMatches:
+    """Test If-None-Match parsing"""
+
+    def test_no_header(self):
+        assert etag_matches(None, '"a"') is False
+
+    def test_exact_match(self):
+        assert etag_matches('"a"', '"a"') is True
+
+    def test_list_and_weak_match(self):
+        assert etag_matches('"x", W/"a"', '"a"') is True
+
+    def test_wildcard(self):
+        assert etag_matches("*", '"a"') is True
+
+    def test_mismatch(self):
+        assert etag_matches('"b"', '"a"') is False
+
+
+class TestExportCache:
+    """Test the size-bounded disk cache"""
+
+    def test_put_and_get(self, tmp_path):
+        """Test storing and retrieving an entry"""
+        cache = ExportCache(str(tmp_path), max_bytes=1024)
+        path = cache.put('"abc123"', BytesIO(b"%PDF-data"))
+
+        assert cache.get('"abc123"') == path
+        assert path.read_bytes() == b"%PDF-data"
+
+    def test_miss(self, tmp_path):
+        """Test that unknown ETags miss"""
+        cache = ExportCache(str(tmp_path), max_bytes=1024)
+        assert cache.get('"missing"') is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the oldest entries are evicted past the size limit"""
+        cache = ExportCache(str(tmp_path), max_bytes=250)
+        old = cache.put('"aa1"', BytesIO(b"x" * 100))
+        recent = cache.put('"bb2"', BytesIO(b"x" * 100))
+        os.utime(old, (1, 1))
+        os.utime(recent, (2, 2))
+
+        # Reading marks the older entry as recently used
+        cache.get('"aa1"')
+        cache.put('"cc3"', BytesIO(b"x" * 100))
+
+        assert cache.get('"aa1"') is not None
+        assert cache.get('"bb2"') is None
+        assert cache.get('"cc3"') is not None
+
+    def count_scans(self, cache, monkeypatch) -> list:
+        scans = []
+        evict = cache.evict
+
+        def counting_evict():
+            scans.append(1)
+            return evict()
+
+        monkeypatch.setattr(cache, "evict", counting_evict)
+        return scans
+
+    def test_scans_only_past_limit(self, tmp_path, monkeypatch):
+        """Test that puts under the limit do not rescan the directory"""
+        cache = ExportCache(str(tmp_path), max_bytes=1000)
+        scans = self.count_scans(cache, monkeypatch)
+
+        for i in range(9):
+            cache.put(f'"e{i}"', BytesIO(b"x" * 100))
+        assert len(scans) == 1  # First put learns the size from disk
+
+        cache.put('"e9"', BytesIO(b"x" * 200))
+        assert len(scans) == 2
+
+    def test_evicts_below_limit(self, tmp_path):
+        """Test that eviction leaves headroom for the next puts"""
+        cache = ExportCache(str(tmp_path), max_bytes=1000)
+        for i in range(11):
+            path = cache.put(f'"e{i:02}"', BytesIO(b"x" * 100))
+            os.utime(path, (i, i))
+        cache.evict()
+
+        stored = list(tmp_path.glob("*/*"))
+        assert sum(p.stat().st_size for p in stored) <= 900
+
+    def test_replacing_entry_tracks_size(self, tmp_path, monkeypatch):
+        """Test that rewriting an entry counts only the size difference"""
+        cache = ExportCache(str(tmp_path), max_bytes=1000)
+        scans = self.count_scans(cache, monkeypatch)
+
+        for _ in range(20):
+            cache.put('"same"', BytesIO(b"x" * 100))
+
+        assert len(scans) == 1
+        assert cache._size == 100
+
+    def test_rescans_periodically(self, tmp_path, monkeypatch):
+        """Test that the tracked size is resynced with the directory"""
+        cache = ExportCache(str(tmp_path), max_bytes=1000)
+        scans = self.count_scans(cache, monkeypatch)
+        cache.put('"a1"', BytesIO(b"x" * 100))
+
+        # Another worker adds an entry
+        other = ExportCache(str(tmp_path), max_bytes=1000)
+        other.put('"b1"', BytesIO(b"x" * 100))
+
+        monkeypatch.setattr(export_cache_module, "RESCAN_SECONDS", -1)
+        cache.put('"c1"', BytesIO(b"x" * 100))
+        assert len(scans) == 2
+        assert cache._size == 300
@@ -0,0 +1,129 @@
+"""
+Tests for the print-resolution image cache
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+import pytest
+from PIL import Image as PILImage
+
+from app.utils.image_cache import (
+    PRINT_MAX_PIXELS,
+    delete_print_image,
+    get_print_image,
+    print_image_cache_path,
+    render_print_image,
+)
+from app.utils.pdf_export import generate_collection_pdf
+
+
+@pytest.fixture
+def upload_dir(tmp_path):
+    """Create an upload directory with one large PNG image"""
+    uploads = tmp_path / "uploads"
+    (uploads / "watch-1").mkdir(parents=True)
+    PILImage.new("RGBA", (3000, 2000), (10, 20, 30, 255)).save(
+        uploads / "watch-1" / "photo.png"
+    )
+    return uploads
+
+
+class TestGetPrintImage:
+    """Test print rendition generation"""
+
+    def test_creates_downscaled_jpeg(self, upload_dir):
+        """Test that a JPEG rendition within print bounds is created"""
+        path = get_print_image("watch-1/photo.png", str(upload_dir))
+
+        assert path == str(print_image_cache_path("watch-1/photo.png", str(upload_dir)))
+        with PILImage.open(path) as img:
+            assert img.format == "JPEG"
+            assert img.mode == "RGB"
+            assert max(img.size) == PRINT_MAX_PIXELS
+            assert img.size == (1200, 800)
+
+    def test_cache_dir_next_to_uploads(self, upload_dir):
+        """Test that renditions live under storage/cache/print"""
+        path = get_print_image("watch-1/photo.png", str(upload_dir))
+
+        assert path.startswith(str(upload_dir.parent / "cache" / "print"))
+
+    def test_reuses_existing_rendition(self, upload_dir):
+        """Test that a fresh rendition is not regenerated"""
+        first = get_print_image("watch-1/photo.png", str(upload_dir))
+        mtime = os.stat(first).st_mtime_ns
+
+        second = get_print_image("watch-1/photo.png", str(upload_dir))
+
+        assert second == first
+        assert os.stat(second).st_mtime_ns == mtime
+
+    def test_regenerates_when_original_changes(self, upload_dir):
+        """Test that a newer original invalidates the rendition"""
+        cached = get_print_image("watch-1/photo.png", str(upload_dir))
+        os.utime(cached, (1, 1))
+
+        PILImage.new("RGB", (400, 300)).save(upload_dir / "watch-1" / "photo.png")
+        path = get_print_image("watch-1/photo.png", str(upload_dir))
+
+        with PILImage.open(path) as img:
+            assert img.size == (400, 300)
+
+    def test_concurrent_renders_in_one_process(self, upload_dir):
+        """Test that threads rendering the same image do not collide"""
+        source = upload_dir / "watch-1" / "photo.png"
+        destination = print_image_cache_path("watch-1/photo.png", str(upload_dir))
+        barrier = Barrier(8)
+
+        def render(_):
+            barrier.wait()
+            render_print_image(source, destination)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(render, range(8)))
+
+        with PILImage.open(destination) as img:
+            assert img.size == (1200, 800)
+        assert os.listdir(destination.parent) == [destination.name]
+
+    def test_missing_original(self, upload_dir):
+        """Test that a missing original returns None"""
+        assert get_print_image("watch-1/missing.png", str(upload_dir)) is None
+
+    def test_unreadable_original_falls_back(self, upload_dir):
+        """Test that a corrupt original is embedded as-is"""
+        bad = upload_dir / "watch-1" / "bad.jpg"
+        bad.write_bytes(b"not an image")
+
+        assert get_print_image("watch-1/bad.jpg", str(upload_dir)) == str(bad)
+
+    def test_delete_print_image(self, upload_dir):
+        """Test deleting a rendition"""
+        path = get_print_image("watch-1/photo.png", str(upload_dir))
+
+        assert delete_print_image("watch-1/photo.png", str(upload_dir)) is True
+        assert not os.path.exists(path)
+        assert delete_print_image("watch-1/photo.png", str(upload_dir)) is False
+
+
+class TestPDFUsesPrintImages:
+    """Test that PDF exports embed print renditions"""
+
+    def test_collection_pdf_embeds_rendition(self, upload_dir):
+        """Test that exporting creates and embeds the cached rendition"""
+        watches = [
+            {
+                "model": "Submariner",
+                "brand": {"name": "Rolex"},
+                "primary_image": {"file_path": "watch-1/photo.png", "is_primary": True},
+            }
+        ]
+
+        pdf = generate_collection_pdf(
+            watches, "Collection", storage_path=str(upload_dir.parent)
+        ).read()
+
+        assert print_image_cache_path("watch-1/photo.png", str(upload_dir)).exists()
+        assert b"/DCTDecode" in pdf
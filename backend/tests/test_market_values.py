@@ -158,6 +158,118 @@ class TestCreateMarketValue:
         assert response.status_code == 404
 
 
+class TestBulkCreateMarketValues:
+    """Test bulk market value ingestion"""
+
+    def test_bulk_create_updates_current_values(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session
+    ):
+        """Test that each affected watch gets its latest value"""
+        other_watch = Watch(
+            user_id=test_watch.user_id,
+            brand_id=test_watch.brand_id,
+            model="Explorer"
+        )
+        test_db.add(other_watch)
+        test_db.commit()
+
+        base = datetime(2024, 1, 1)
+        values = [
+            {
+                "watch_id": str(test_watch.id),
+                "value": str(10000 + i),
+                "recorded_at": (base + timedelta(days=i)).isoformat()
+            }
+            for i in range(5)
+        ] + [
+            {
+                "watch_id": str(other_watch.id),
+                "value": "7000.00",
+                "currency": "EUR",
+                "recorded_at": base.isoformat()
+            }
+        ]
+
+        response = client.post(
+            "/api/v1/watches/market-values/bulk",
+            headers=auth_headers,
+            json={"values": values}
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {"created": 6, "watches_updated": 2}
+        assert test_db.query(MarketValue).count() == 6
+
+        test_db.refresh(test_watch)
+        test_db.refresh(other_watch)
+        assert test_watch.current_market_value == Decimal("10004.00")
+        assert test_watch.last_value_update == base + timedelta(days=4)
+        assert other_watch.current_market_value == Decimal("7000.00")
+        assert other_watch.current_market_currency == "EUR"
+
+    def test_bulk_create_older_values_keep_latest(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session
+    ):
+        """Test that backfilling history does not replace a newer value"""
+        client.post(
+            f"/api/v1/watches/{test_watch.id}/market-values",
+            headers=auth_headers,
+            json={"value": "20000.00", "recorded_at": datetime.utcnow().isoformat()}
+        )
+
+        response = client.post(
+            "/api/v1/watches/market-values/bulk",
+            headers=auth_headers,
+            json={"values": [
+                {
+                    "watch_id": str(test_watch.id),
+                    "value": "9000.00",
+                    "recorded_at": "2020-01-01T00:00:00"
+                }
+            ]}
+        )
+
+        assert response.status_code == 201
+        test_db.refresh(test_watch)
+        assert test_watch.current_market_value == Decimal("20000.00")
+
+    def test_bulk_create_wrong_owner(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        auth_headers2: dict,
+        test_watch: Watch,
+        test_db: Session
+    ):
+        """Test that values for another user's watch are rejected"""
+        response = client.post(
+            "/api/v1/watches/market-values/bulk",
+            headers=auth_headers2,
+            json={"values": [{"watch_id": str(test_watch.id), "value": "1.00"}]}
+        )
+
+        assert response.status_code == 404
+        assert test_db.query(MarketValue).count() == 0
+
+    def test_bulk_create_empty(self, client: TestClient, auth_headers: dict):
+        """Test that an empty upload is rejected"""
+        response = client.post(
+            "/api/v1/watches/market-values/bulk",
+            headers=auth_headers,
+            json={"values": []}
+        )
+
+        assert response.status_code == 422
+
+
 class TestListMarketValues:
     """Test market value listing"""
 
@@ -277,6 +389,30 @@ class TestListMarketValues:
         assert response.json() == []
 
 
+    def test_list_market_values_not_modified(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch
+    ):
+        """Test that an unchanged list is answered with 304 until a value is added"""
+        url = f"/api/v1/watches/{test_watch.id}/market-values"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        client.post(
+            url,
+            headers=auth_headers,
+            json={"value": "15000.00", "currency": "USD", "source": "manual"}
+        )
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+
+
 class TestGetMarketValue:
     """Test getting individual market value"""
 
@@ -0,0 +1,257 @@
+"""
+Tests for the Prometheus metrics
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app import database
+from app.database import TimedQueuePool, instrument_engine
+from app.middleware.metrics import UNMATCHED_ROUTE, MetricsMiddleware
+from app.utils import cache
+from app.utils.metrics import (
+    CACHE_LOOKUPS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_QUERIES,
+    HTTP_REQUEST_DB_QUERIES,
+    HTTP_REQUEST_DURATION,
+    OUTBOUND_HTTP_DURATION,
+    AsyncInstrumentedTransport,
+    Counter,
+    Gauge,
+    Histogram,
+    InstrumentedTransport,
+    Registry,
+)
+from tests.conftest import TEST_DATABASE_URL
+from tests.test_cache import FakeRedis
+
+
+@pytest.fixture
+def metrics_engine(monkeypatch):
+    """A throwaway engine instrumented as the "metrics-test" engine"""
+    monkeypatch.setattr(database, "instrumented_engines", {})
+    engine = create_engine(
+        TEST_DATABASE_URL,
+        poolclass=TimedQueuePool,
+        pool_logging_name="metrics-test",
+        pool_size=1,
+        max_overflow=1,
+    )
+    instrument_engine(engine, "metrics-test", 2)
+    yield engine
+    engine.dispose()
+
+
+class TestRegistry:
+    """Test the text exposition format"""
+
+    def test_render_counter_and_gauge(self):
+        """Test HELP/TYPE lines and labelled samples"""
+        registry = Registry()
+        counter = registry.register(Counter("jobs_total", "Jobs", ["result"]))
+        registry.register(Gauge("queue_depth", "Queued", collect=lambda: {(): 3}))
+        counter.inc("ok")
+        counter.inc("ok", amount=2)
+
+        lines = registry.render().splitlines()
+        assert "# HELP jobs_total Jobs" in lines
+        assert "# TYPE jobs_total counter" in lines
+        assert 'jobs_total{result="ok"} 3' in lines
+        assert "# TYPE queue_depth gauge" in lines
+        assert "queue_depth 3" in lines
+
+    def test_render_histogram(self):
+        """Test cumulative buckets, count and sum"""
+        registry = Registry()
+        histogram = registry.register(
+            Histogram("latency_seconds", "Latency", ["route"], buckets=(0.1, 1))
+        )
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.5, "/a")
+        histogram.observe(5, "/a")
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{route="/a",le="1"} 2' in lines
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+        assert 'latency_seconds_count{route="/a"} 3' in lines
+        assert 'latency_seconds_sum{route="/a"} 5.55' in lines
+
+    def test_label_values_escaped(self):
+        """Test that quotes in label values do not break the format"""
+        registry = Registry()
+        counter = registry.register(Counter("c_total", "C", ["path"]))
+        counter.inc('say "hi"')
+        assert 'c_total{path="say \\"hi\\""} 1' in registry.render()
+
+    def test_label_count_checked(self):
+        """Test that a missing label value is rejected"""
+        with pytest.raises(ValueError):
+            Counter("c_total", "C", ["a", "b"]).inc("x")
+
+    def test_duplicate_name_rejected(self):
+        """Test that a metric name is registered once"""
+        registry = Registry()
+        registry.register(Counter("c_total", "C"))
+        with pytest.raises(ValueError):
+            registry.register(Counter("c_total", "C"))
+
+
+class TestMetricsEndpoint:
+    """Test the /metrics endpoint"""
+
+    def test_exposes_route_templates(self, client: TestClient, auth_headers: dict):
+        """Test that requests are labelled by route template, not raw path"""
+        client.get(
+            "/api/v1/watches/00000000-0000-0000-0000-000000000000",
+            headers=auth_headers,
+        )
+        client.get("/no-such-page")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = response.text
+        assert (
+            'http_request_duration_seconds_count{method="GET",'
+            'route="/api/v1/watches/{watch_id}",status="404"}'
+        ) in body
+        assert f'route="{UNMATCHED_ROUTE}",status="404"' in body
+        assert "00000000-0000-0000-0000-000000000000" not in body
+        assert "# TYPE db_pool_saturation gauge" in body
+        assert "# TYPE http_requests_in_flight gauge" in body
+
+    def test_not_in_openapi_schema(self, client: TestClient):
+        """Test that the scrape endpoint is not part of the API docs"""
+        assert "/metrics" not in client.get("/openapi.json").json()["paths"]
+
+
+class TestRequestAttribution:
+    """Test per-request database metrics"""
+
+    def test_queries_attributed_to_route(self, metrics_engine):
+        """Test that queries made in a sync handler count for its route"""
+        router = APIRouter()
+
+        @router.get("/items/{item_id}")
+        def read_item(item_id: int):
+            with metrics_engine.connect() as connection:
+                for _ in range(3):
+                    connection.execute(text("SELECT 1"))
+            return {"id": item_id}
+
+        app = FastAPI()
+        app.include_router(router, prefix="/metrics-test")
+        app.add_middleware(MetricsMiddleware)
+        route = "/metrics-test/items/{item_id}"
+        before = HTTP_REQUEST_DB_QUERIES.sum("GET", route)
+        requests_before = HTTP_REQUEST_DURATION.count("GET", route, "200")
+
+        with TestClient(app) as client:
+            assert client.get("/metrics-test/items/1").status_code == 200
+            assert client.get("/metrics-test/items/2").status_code == 200
+
+        assert HTTP_REQUEST_DB_QUERIES.sum("GET", route) - before == 6
+        assert HTTP_REQUEST_DURATION.count("GET", route, "200") - requests_before == 2
+
+    def test_queries_outside_requests(self, metrics_engine):
+        """Test that queries without a request still count for the engine"""
+        before = DB_QUERIES.value("metrics-test")
+        with metrics_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert DB_QUERIES.value("metrics-test") - before == 1
+
+
+class TestPoolMetrics:
+    """Test connection pool metrics"""
+
+    def test_checkout_wait_recorded(self, metrics_engine):
+        """Test that each pool checkout is timed"""
+        before = DB_POOL_CHECKOUT_WAIT.count("metrics-test")
+        with metrics_engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        assert DB_POOL_CHECKOUT_WAIT.count("metrics-test") - before == 1
+
+    def test_saturation(self, metrics_engine):
+        """Test checked out connections relative to pool capacity"""
+        with metrics_engine.connect():
+            assert database._pool_saturation() == {("metrics-test",): 0.5}
+            assert database._pool_connections()[("metrics-test", "checked_out")] == 1
+        assert database._pool_saturation() == {("metrics-test",): 0.0}
+        assert database._pool_connections()[("metrics-test", "idle")] == 1
+
+
+class TestCacheMetrics:
+    """Test cache lookup counters"""
+
+    def test_lookup_results(self, monkeypatch):
+        """Test Redis hits, local hits and misses"""
+        client = FakeRedis()
+        monkeypatch.setattr(cache, "redis_client", client)
+        monkeypatch.setattr(cache, "_retry_at", 0.0)
+        monkeypatch.setattr(cache.local_cache, "enabled", True)
+        cache.local_cache.clear()
+        before = {
+            result: CACHE_LOOKUPS.value(result)
+            for result in ("local_hit", "redis_hit", "miss")
+        }
+
+        cache.cache_set("k", {"a": 1})
+        cache.local_cache.clear()
+        assert cache.cache_get("k") == {"a": 1}
+        assert cache.cache_get("k") == {"a": 1}
+        assert cache.cache_get("missing") is None
+        cache.local_cache.clear()
+
+        assert CACHE_LOOKUPS.value("redis_hit") - before["redis_hit"] == 1
+        assert CACHE_LOOKUPS.value("local_hit") - before["local_hit"] == 1
+        assert CACHE_LOOKUPS.value("miss") - before["miss"] == 1
+
+
+class TestOutboundHTTP:
+    """Test outbound request latency"""
+
+    def test_records_status(self):
+        """Test that responses are recorded by service and status"""
+        transport = InstrumentedTransport(
+            "metrics-test", httpx.MockTransport(lambda request: httpx.Response(204))
+        )
+        before = OUTBOUND_HTTP_DURATION.count("metrics-test", "GET", "204")
+        with httpx.Client(transport=transport) as client:
+            assert client.get("https://example.com/").status_code == 204
+        assert OUTBOUND_HTTP_DURATION.count("metrics-test", "GET", "204") - before == 1
+
+    def test_records_errors(self):
+        """Test that connection failures are recorded as errors"""
+
+        def fail(request):
+            raise httpx.ConnectError("unreachable", request=request)
+
+        transport = InstrumentedTransport("metrics-test", httpx.MockTransport(fail))
+        before = OUTBOUND_HTTP_DURATION.count("metrics-test", "POST", "error")
+        with httpx.Client(transport=transport) as client:
+            with pytest.raises(httpx.ConnectError):
+                client.post("https://example.com/")
+        assert (
+            OUTBOUND_HTTP_DURATION.count("metrics-test", "POST", "error") - before == 1
+        )
+
+    def test_async_transport(self):
+        """Test the async transport used by the atomic time client"""
+        transport = AsyncInstrumentedTransport(
+            "metrics-test", httpx.MockTransport(lambda request: httpx.Response(200))
+        )
+        before = OUTBOUND_HTTP_DURATION.count("metrics-test", "GET", "200")
+
+        async def fetch():
+            async with httpx.AsyncClient(transport=transport) as client:
+                return await client.get("https://example.com/")
+
+        assert asyncio.run(fetch()).status_code == 200
+        assert OUTBOUND_HTTP_DURATION.count("metrics-test", "GET", "200") - before == 1
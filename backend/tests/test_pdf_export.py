@@ -9,7 +9,11 @@ from app.utils.pdf_export import (
     format_currency,
     format_date,
     generate_watch_pdf,
-    generate_collection_pdf
+    generate_collection_pdf,
+    generate_collection_pdf_stream,
+    generate_qr_label_sheet,
+    iter_file_chunks,
+    qr_drawing,
 )
 
 
@@ -336,3 +340,84 @@ class TestGenerateCollectionPDF:
         pdf_buffer.seek(0)
         pdf_content = pdf_buffer.read(4)
         assert pdf_content == b'%PDF', "PDF should start with %PDF header"
+
+
+class TestGenerateCollectionPDFStream:
+    """Test streaming collection PDF generation"""
+
+    def test_stream_consumes_iterator_lazily(self):
+        """Test that watches are pulled from the iterator while rendering"""
+        consumed = []
+
+        def watches():
+            for i in range(50):
+                consumed.append(i)
+                yield {"model": f"Watch {i}", "brand": {"name": "Brand"}}
+
+        pdf_file = generate_collection_pdf_stream(
+            watches(), "Large Collection", 50, 0, 0
+        )
+        content = b"".join(iter_file_chunks(pdf_file))
+
+        assert consumed == list(range(50))
+        assert content.startswith(b"%PDF")
+        assert pdf_file.closed
+
+    def test_stream_spools_to_disk(self):
+        """Test that large output spills out of memory"""
+        watches = (
+            {"model": f"Watch {i}", "brand": {"name": "Brand"}, "notes": "x"}
+            for i in range(20)
+        )
+
+        pdf_file = generate_collection_pdf_stream(
+            watches, "Collection", 20, 1000.0, 1200.0, spool_max_size=1024
+        )
+
+        assert pdf_file._rolled
+        assert pdf_file.read(4) == b"%PDF"
+        pdf_file.close()
+
+    def test_stream_matches_page_count(self):
+        """Test that streaming output has one page per watch"""
+        watches = [{"model": f"Watch {i}", "brand": {"name": "B"}} for i in range(3)]
+
+        streamed = b"".join(
+            iter_file_chunks(
+                generate_collection_pdf_stream(iter(watches), "C", 3, 0, 0)
+            )
+        )
+        buffered = generate_collection_pdf(watches, "C").read()
+
+        assert streamed.count(b"/Type /Page\n") == buffered.count(b"/Type /Page\n")
+
+
+class TestGenerateQRLabelSheet:
+    """Test QR label sheet generation"""
+
+    def test_label_sheet_paginates(self):
+        """Test that labels flow onto additional pages"""
+        from pypdf import PdfReader
+
+        labels = [
+            {"qr_data": f"label-{i}", "title": f"Rolex & Co {i}"}
+            for i in range(14)
+        ]
+
+        pdf = generate_qr_label_sheet(labels, title="Labels")
+
+        assert isinstance(pdf, BytesIO)
+        assert len(PdfReader(pdf).pages) == 2
+
+    def test_label_qr_codes_are_vector(self):
+        """Test that label QR codes are drawn rather than embedded as images"""
+        pdf = generate_qr_label_sheet([{"qr_data": "label", "title": "Label"}])
+
+        assert b"/Subtype /Image" not in pdf.getvalue()
+
+    def test_qr_drawing_size(self):
+        """Test that the QR drawing fills the requested size"""
+        drawing = qr_drawing("https://example.com", 100)
+
+        assert (drawing.width, drawing.height) == (100, 100)
+        assert drawing.contents
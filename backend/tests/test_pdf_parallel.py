@@ -0,0 +1,109 @@
+"""
+Tests for parallel PDF rendering
+"""
+
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pypdf import PdfReader
+
+from app.utils.pdf_export import generate_collection_pdf
+from app.utils.pdf_parallel import (
+    generate_collection_pdf_parallel,
+    generate_watch_pdfs_zip,
+    get_render_pool,
+    shutdown_render_pool,
+)
+
+
+def make_watches(count):
+    return [
+        {
+            "model": f"Model {i}",
+            "brand": {"name": "Rolex"},
+            "reference_number": f"REF-{i}",
+            "purchase_price": 1000,
+            "purchase_currency": "USD",
+            "current_market_value": 1500,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def executor():
+    """Thread pool standing in for the process pool"""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+class TestGenerateCollectionPDFParallel:
+    """Test chunked collection PDF rendering"""
+
+    def test_matches_serial_page_count(self, executor):
+        """Test that merged chunks have the same pages as a serial render"""
+        watches = make_watches(7)
+
+        serial = PdfReader(generate_collection_pdf(watches, "Collection"))
+        with generate_collection_pdf_parallel(
+            watches, "Collection", chunk_size=3, executor=executor
+        ) as pdf_file:
+            merged = PdfReader(pdf_file)
+
+            assert len(merged.pages) == len(serial.pages)
+
+    def test_header_and_footer_once(self, executor):
+        """Test that only the first chunk has the header and the last the footer"""
+        with generate_collection_pdf_parallel(
+            make_watches(5), "Chunked", chunk_size=2, executor=executor
+        ) as pdf_file:
+            text = "".join(page.extract_text() for page in PdfReader(pdf_file).pages)
+
+        assert text.count("Total Watches") == 1
+        assert text.count("by Watch Collection Tracker") == 1
+        assert text.index("Model 0") < text.index("Model 4")
+
+    def test_empty_collection(self, executor):
+        """Test that an empty collection still produces a PDF"""
+        with generate_collection_pdf_parallel(
+            [], "Empty", executor=executor
+        ) as pdf_file:
+            assert pdf_file.read(4) == b"%PDF"
+
+    def test_process_pool(self):
+        """Test rendering in real worker processes"""
+        try:
+            with generate_collection_pdf_parallel(
+                make_watches(4), "Collection", chunk_size=2, executor=get_render_pool()
+            ) as pdf_file:
+                assert len(PdfReader(pdf_file).pages) >= 4
+        finally:
+            shutdown_render_pool()
+
+
+class TestGenerateWatchPDFsZip:
+    """Test zipped per-watch PDF exports"""
+
+    def test_one_pdf_per_watch(self, executor):
+        """Test that each watch becomes its own archive entry"""
+        items = [(f"Rolex_Model_{i}.pdf", w) for i, w in enumerate(make_watches(3))]
+
+        with generate_watch_pdfs_zip(items, executor=executor) as zip_file:
+            with zipfile.ZipFile(zip_file) as archive:
+                assert archive.namelist() == [name for name, _ in items]
+                for info in archive.infolist():
+                    assert info.compress_type == zipfile.ZIP_STORED
+                    assert archive.read(info).startswith(b"%PDF")
+
+    def test_duplicate_names_are_suffixed(self, executor):
+        """Test that watches with the same name do not overwrite each other"""
+        items = [("Rolex_Sub.pdf", w) for w in make_watches(3)]
+
+        with generate_watch_pdfs_zip(items, executor=executor) as zip_file:
+            with zipfile.ZipFile(zip_file) as archive:
+                assert archive.namelist() == [
+                    "Rolex_Sub.pdf",
+                    "Rolex_Sub_1.pdf",
+                    "Rolex_Sub_2.pdf",
+                ]
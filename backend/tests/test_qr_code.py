@@ -5,7 +5,17 @@ import pytest
 from io import BytesIO
 from PIL import Image as PILImage
 
-from app.utils.qr_code import generate_qr_code, generate_watch_qr_code
+from app.utils.qr_code import (
+    generate_qr_code,
+    generate_watch_qr_code,
+    get_watch_qr_image,
+    qr_disk_cache,
+    qr_matrix,
+    render_qr_png,
+    render_qr_svg,
+    watch_qr_etag,
+    watch_qr_url,
+)
 
 
 class TestGenerateQRCode:
@@ -134,3 +144,72 @@ class TestGenerateWatchQRCode:
         assert isinstance(qr_buffer, BytesIO)
         img = PILImage.open(qr_buffer)
         assert img.format == "PNG"
+
+
+class TestWatchQRCodeCache:
+    """Test memoized watch QR code rendering"""
+
+    def test_memoized_in_memory(self):
+        """Test that repeat lookups do not re-render"""
+        first = get_watch_qr_image("watch-1", "https://example.com")
+        second = get_watch_qr_image("watch-1", "https://example.com")
+
+        assert first is second
+        assert get_watch_qr_image.cache_info().hits == 1
+
+    def test_persisted_to_disk(self, mock_qr_cache):
+        """Test that rendered images survive a cleared memory cache"""
+        png = get_watch_qr_image("watch-1", "https://example.com")
+        etag = watch_qr_etag("watch-1", "https://example.com")
+
+        assert qr_disk_cache.get(etag).read_bytes() == png
+
+        get_watch_qr_image.cache_clear()
+        assert get_watch_qr_image("watch-1", "https://example.com") == png
+
+    def test_size_changes_output(self):
+        """Test that the module size is part of the cache key"""
+        small = PILImage.open(BytesIO(get_watch_qr_image("watch-1", size=5)))
+        large = PILImage.open(BytesIO(get_watch_qr_image("watch-1", size=10)))
+
+        assert large.size[0] == small.size[0] * 2
+        assert watch_qr_etag("watch-1", "x", 5) != watch_qr_etag("watch-1", "x", 10)
+
+    def test_matches_uncached_render(self):
+        """Test that cached output is identical to a fresh render"""
+        url = watch_qr_url("watch-1", "https://example.com")
+
+        assert get_watch_qr_image("watch-1", "https://example.com") == render_qr_png(url)
+
+
+class TestSVGQRCode:
+    """Test vector QR code output"""
+
+    def test_render_qr_svg(self):
+        """Test that SVG output is a standalone SVG document"""
+        svg = render_qr_svg("https://example.com/test")
+
+        assert b"<svg" in svg
+        assert b"<path" in svg
+
+    def test_svg_cached_separately_from_png(self):
+        """Test that the format is part of the cache key"""
+        png = get_watch_qr_image("watch-1", fmt="png")
+        svg = get_watch_qr_image("watch-1", fmt="svg")
+
+        assert png.startswith(b"\x89PNG")
+        assert b"<svg" in svg
+        assert watch_qr_etag("watch-1", "x", 10, "png") != watch_qr_etag(
+            "watch-1", "x", 10, "svg"
+        )
+
+    def test_qr_matrix_matches_png(self):
+        """Test that the vector matrix has the same modules as the PNG"""
+        data = "https://example.com/test"
+        matrix = qr_matrix(data)
+        img = PILImage.open(BytesIO(render_qr_png(data, size=1))).convert("L")
+
+        assert img.size == (len(matrix), len(matrix))
+        for y, row in enumerate(matrix):
+            for x, dark in enumerate(row):
+                assert (img.getpixel((x, y)) == 0) == dark
@@ -0,0 +1,143 @@
+"""
+Tests for reference data endpoints and the in-process snapshot
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.security import create_access_token, get_password_hash
+from app.models.reference import Brand, MovementType
+from app.models.user import User, UserRole
+
+
+@pytest.fixture(scope="function")
+def admin_headers(test_db: Session) -> dict:
+    """Create an admin user and generate a JWT token for it"""
+    admin = User(
+        email="admin@example.com",
+        hashed_password=get_password_hash("adminpass123"),
+        role=UserRole.admin
+    )
+    test_db.add(admin)
+    test_db.commit()
+    access_token = create_access_token(data={"sub": str(admin.id)})
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+class TestListReferenceData:
+    """Test serving reference lists from the snapshot"""
+
+    def test_list_brands(self, test_brand: Brand, client: TestClient):
+        """Test that brands are listed with a strong ETag"""
+        response = client.get("/api/v1/reference/brands")
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id": str(test_brand.id), "name": "Rolex", "sort_order": 0}
+        ]
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "public, max-age=3600"
+
+    def test_list_movement_types_and_complications(
+        self,
+        test_movement_type: MovementType,
+        test_complication,
+        client: TestClient
+    ):
+        """Test the other reference lists"""
+        movement_types = client.get("/api/v1/reference/movement-types").json()
+        complications = client.get("/api/v1/reference/complications").json()
+        assert [m["name"] for m in movement_types] == ["Automatic"]
+        assert [c["name"] for c in complications] == ["Date"]
+
+    def test_not_modified(self, test_brand: Brand, client: TestClient):
+        """Test that a matching If-None-Match returns 304"""
+        etag = client.get("/api/v1/reference/brands").headers["etag"]
+
+        response = client.get(
+            "/api/v1/reference/brands", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    def test_served_without_querying(
+        self, test_brand: Brand, client: TestClient, test_db: Session
+    ):
+        """Test that rows added after loading are not seen until a reload"""
+        client.get("/api/v1/reference/brands")
+        test_db.add(Brand(name="Omega"))
+        test_db.commit()
+
+        response = client.get("/api/v1/reference/brands")
+        assert [b["name"] for b in response.json()] == ["Rolex"]
+
+
+class TestReloadReferenceData:
+    """Test the admin reload hook"""
+
+    def test_reload(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        test_brand: Brand,
+        test_db: Session
+    ):
+        """Test that reloading picks up new rows and changes the ETag"""
+        etag = client.get("/api/v1/reference/brands").headers["etag"]
+        test_db.add(Brand(name="Omega", sort_order=1))
+        test_db.commit()
+
+        response = client.post("/api/v1/reference/reload", headers=admin_headers)
+        assert response.status_code == 200
+        assert response.json() == {
+            "brands": 2, "movement_types": 0, "complications": 0
+        }
+
+        response = client.get(
+            "/api/v1/reference/brands", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert [b["name"] for b in response.json()] == ["Rolex", "Omega"]
+
+    def test_reload_requires_admin(self, client: TestClient, auth_headers: dict):
+        """Test that regular users cannot reload reference data"""
+        response = client.post("/api/v1/reference/reload", headers=auth_headers)
+        assert response.status_code == 403
+
+
+class TestWatchReferenceValidation:
+    """Test brand / movement type checks against the snapshot"""
+
+    def test_create_watch_with_brand_added_after_load(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_brand: Brand,
+        test_db: Session
+    ):
+        """Test that an id missing from the snapshot is checked and loaded"""
+        client.get("/api/v1/reference/brands")
+        brand = Brand(name="Omega")
+        test_db.add(brand)
+        test_db.commit()
+
+        response = client.post(
+            "/api/v1/watches/",
+            headers=auth_headers,
+            json={"brand_id": str(brand.id), "model": "Speedmaster"}
+        )
+        assert response.status_code == 201
+
+        names = [b["name"] for b in client.get("/api/v1/reference/brands").json()]
+        assert "Omega" in names
+
+    def test_update_watch_unknown_movement_type(
+        self, client: TestClient, auth_headers: dict, test_watch
+    ):
+        """Test that unknown movement types are rejected"""
+        response = client.put(
+            f"/api/v1/watches/{test_watch.id}",
+            headers=auth_headers,
+            json={"movement_type_id": "00000000-0000-0000-0000-000000000000"}
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Movement type not found"
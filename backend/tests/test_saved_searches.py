@@ -2,11 +2,18 @@
 Tests for saved searches endpoints
 """
 import pytest
+from fastapi import Request
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
 
+from app.database import READ_ONLY_METHODS, RoutingSession, get_db
+from app.main import app
 from app.models.saved_search import SavedSearch
 from app.models.user import User
+from app.models.watch import Watch
+from tests.conftest import TEST_DATABASE_URL, engine
+from tests.test_database_routing import FakeLagMonitor
 
 
 class TestListSavedSearches:
@@ -485,3 +492,230 @@ class TestDeleteSavedSearch:
         )
 
         assert response.status_code == 404
+
+
+class TestSavedSearchResults:
+    """Test running saved searches"""
+
+    @pytest.fixture
+    def result_cache(self, monkeypatch):
+        """In-memory stand-in for Redis"""
+        store = {}
+        monkeypatch.setattr(
+            "app.utils.saved_search.cache_get", lambda key: store.get(key)
+        )
+        monkeypatch.setattr(
+            "app.utils.saved_search.cache_set",
+            lambda key, value, expire=300, tags=(): store.__setitem__(key, value) or True
+        )
+        return store
+
+    @pytest.fixture
+    def replica_statements(self, client: TestClient):
+        """
+        Route read-only requests to a replica that, like a hot standby,
+        rejects writes, and collect the statements it runs
+        """
+        replica = create_engine(
+            TEST_DATABASE_URL,
+            connect_args={"options": "-c default_transaction_read_only=on"},
+        )
+        statements = []
+
+        @event.listens_for(replica, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        session_cls = type(
+            "ReplicaRoutingSession",
+            (RoutingSession,),
+            {"replicas": [replica], "lag_monitor": FakeLagMonitor({replica: True})},
+        )
+
+        def routing_get_db(request: Request):
+            db = session_cls(bind=engine)
+            db.info["request_method"] = request.method
+            db.info["read_only"] = request.method in READ_ONLY_METHODS
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = routing_get_db
+        yield statements
+        replica.dispose()
+
+    def _add_watch(self, test_db, user, brand, model, price):
+        watch = Watch(
+            user_id=user.id, brand_id=brand.id, model=model, purchase_price=price
+        )
+        test_db.add(watch)
+        test_db.commit()
+        return watch
+
+    def test_results_apply_filters(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user: User,
+        test_user2: User,
+        test_brand,
+        test_db: Session
+    ):
+        """Test that stored filters and sort order are applied"""
+        self._add_watch(test_db, test_user, test_brand, "Submariner", 9000)
+        self._add_watch(test_db, test_user, test_brand, "Daytona", 30000)
+        self._add_watch(test_db, test_user, test_brand, "Datejust", 6000)
+        self._add_watch(test_db, test_user2, test_brand, "GMT", 12000)
+        search = SavedSearch(
+            user_id=test_user.id,
+            name="Over 5k",
+            filters={"min_price": 5000, "sort_by": "purchase_price", "sort_order": "asc"}
+        )
+        test_db.add(search)
+        test_db.commit()
+
+        response = client.get(
+            f"/api/v1/saved-searches/{search.id}/results?limit=2",
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 3
+        assert [w["model"] for w in data["items"]] == ["Datejust", "Submariner"]
+        assert data["items"][0]["brand"]["name"] == "Rolex"
+        assert data["new_match_ids"] == []
+        assert data["seen_at"] is None
+
+        response = client.get(
+            f"/api/v1/saved-searches/{search.id}/results?limit=2&offset=2",
+            headers=auth_headers
+        )
+        assert [w["model"] for w in response.json()["items"]] == ["Daytona"]
+
+    def test_results_report_new_matches(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user: User,
+        test_brand,
+        test_db: Session
+    ):
+        """Test that matches added since the last run are reported once"""
+        self._add_watch(test_db, test_user, test_brand, "Submariner", 9000)
+        search = SavedSearch(
+            user_id=test_user.id, name="Rolex", filters={"brand_id": str(test_brand.id)}
+        )
+        test_db.add(search)
+        test_db.commit()
+        url = f"/api/v1/saved-searches/{search.id}/results"
+
+        assert client.get(url, headers=auth_headers).json()["new_match_ids"] == []
+
+        new_watch = self._add_watch(test_db, test_user, test_brand, "Daytona", 30000)
+        data = client.get(url, headers=auth_headers).json()
+        assert data["new_match_ids"] == [str(new_watch.id)]
+        assert data["seen_at"] is not None
+
+        data = client.get(url, headers=auth_headers).json()
+        assert data["new_match_ids"] == []
+        assert data["total"] == 2
+
+    def test_seen_matches_written_on_primary(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user: User,
+        test_brand,
+        test_db: Session,
+        replica_statements: list
+    ):
+        """Test that the GET handler's write does not go to a replica"""
+        watch = self._add_watch(test_db, test_user, test_brand, "Submariner", 9000)
+        search = SavedSearch(user_id=test_user.id, name="All", filters={})
+        test_db.add(search)
+        test_db.commit()
+
+        response = client.get(
+            f"/api/v1/saved-searches/{search.id}/results", headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        # The user lookup still reads from the replica
+        assert any("FROM users" in statement for statement in replica_statements)
+        assert not any(
+            statement.lstrip().upper().startswith("UPDATE")
+            for statement in replica_statements
+        )
+        test_db.refresh(search)
+        assert search.seen_match_ids == [str(watch.id)]
+
+    def test_results_cached_per_data_version(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user: User,
+        test_brand,
+        test_db: Session,
+        result_cache: dict
+    ):
+        """Test that results are cached until the user's watches change"""
+        watch = self._add_watch(test_db, test_user, test_brand, "Submariner", 9000)
+        search = SavedSearch(user_id=test_user.id, name="All", filters={})
+        test_db.add(search)
+        test_db.commit()
+        url = f"/api/v1/saved-searches/{search.id}/results"
+
+        first = client.get(url, headers=auth_headers).json()
+        assert len(result_cache) == 1
+        second = client.get(url, headers=auth_headers).json()
+        assert len(result_cache) == 1
+        assert second["data_version"] == first["data_version"]
+        assert second["total"] == 1
+
+        watch.model = "Submariner Date"
+        test_db.commit()
+        third = client.get(url, headers=auth_headers).json()
+        assert len(result_cache) == 2
+        assert third["data_version"] != first["data_version"]
+        assert third["items"][0]["model"] == "Submariner Date"
+
+    def test_results_invalid_filters(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_user: User,
+        test_db: Session
+    ):
+        """Test that filters that cannot be compiled are rejected"""
+        search = SavedSearch(
+            user_id=test_user.id, name="Broken", filters={"brand_id": "some-uuid"}
+        )
+        test_db.add(search)
+        test_db.commit()
+
+        response = client.get(
+            f"/api/v1/saved-searches/{search.id}/results", headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        assert "brand_id" in response.json()["detail"]
+
+    def test_results_other_user(
+        self,
+        client: TestClient,
+        auth_headers2: dict,
+        test_user: User,
+        test_db: Session
+    ):
+        """Test running another user's search"""
+        search = SavedSearch(user_id=test_user.id, name="Mine", filters={})
+        test_db.add(search)
+        test_db.commit()
+
+        response = client.get(
+            f"/api/v1/saved-searches/{search.id}/results", headers=auth_headers2
+        )
+
+        assert response.status_code == 404
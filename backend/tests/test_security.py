@@ -189,3 +189,94 @@ class TestPasswordSecurity:
         assert test_user.hashed_password != "testpass123"
         # Hashed password should start with bcrypt prefix
         assert test_user.hashed_password.startswith("$2")
+
+
+class TestPasswordHashing:
+    """Test the bounded password hashing executor"""
+
+    def test_rehash_on_login_when_cost_changes(
+        self, client: TestClient, test_user, test_db, monkeypatch
+    ):
+        """Test that a login upgrades hashes made with another cost"""
+        from app import config
+
+        assert test_user.hashed_password.startswith("$2b$12$")
+        monkeypatch.setattr(config.settings, "BCRYPT_ROUNDS", 4)
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "testpass123"}
+        )
+        assert response.status_code == 200
+
+        test_db.refresh(test_user)
+        assert test_user.hashed_password.startswith("$2b$04$")
+
+        # The upgraded hash still verifies
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "testpass123"}
+        )
+        assert response.status_code == 200
+
+    def test_rehash_on_login_off_event_loop(
+        self, client: TestClient, test_user, event_loop_queries, monkeypatch
+    ):
+        """Test that no query runs on the event loop after the rehash commit"""
+        from app import config
+
+        monkeypatch.setattr(config.settings, "BCRYPT_ROUNDS", 4)
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "testpass123"}
+        )
+        assert response.status_code == 200
+        assert event_loop_queries == []
+
+    def test_queue_full_returns_503(self, client: TestClient, test_user, monkeypatch):
+        """Test that logins beyond the queue limit are rejected quickly"""
+        from app.core.password_hashing import password_hasher
+
+        monkeypatch.setattr(password_hasher, "max_queue", -password_hasher.workers)
+        rejected = password_hasher.stats()["rejected"]
+
+        response = client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "testpass123"}
+        )
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
+        assert password_hasher.stats()["rejected"] == rejected + 1
+
+    def test_hasher_bounds_outstanding_jobs(self):
+        """Test that jobs past workers + max_queue are rejected"""
+        import threading
+        import time
+
+        from app.core.password_hashing import PasswordHasher, PasswordHashingBusy
+
+        hasher = PasswordHasher(workers=1, max_queue=1)
+        release = threading.Event()
+        try:
+            running = hasher.submit(release.wait)
+            queued = hasher.submit(release.wait)
+            with pytest.raises(PasswordHashingBusy):
+                hasher.submit(release.wait)
+
+            deadline = time.monotonic() + 5
+            while hasher.stats()["running"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            stats = hasher.stats()
+            assert stats["running"] == 1
+            assert stats["queued"] == 1
+            assert stats["rejected"] == 1
+
+            release.set()
+            running.result(timeout=5)
+            queued.result(timeout=5)
+            assert hasher.stats()["completed"] == 2
+        finally:
+            release.set()
+            hasher.shutdown()
@@ -8,7 +8,7 @@ from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
 from app.models.watch import Watch
-from app.models.service_history import ServiceHistory, ServiceDocument
+from app.models.service_history import ServiceHistory, ServiceDocument, WatchServiceRollup
 
 
 def create_test_pdf():
@@ -261,6 +261,76 @@ class TestListServiceHistory:
 
         assert response.status_code == 200
         assert response.json() == []
+        assert response.headers["x-total-count"] == "0"
+
+    def test_list_service_history_paginated(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session
+    ):
+        """Test limit/offset paging with the total in a header"""
+        for i in range(5):
+            test_db.add(ServiceHistory(
+                watch_id=test_watch.id,
+                service_date=datetime.utcnow() - timedelta(days=i),
+                provider=f"Provider {i}"
+            ))
+        test_db.commit()
+
+        response = client.get(
+            f"/api/v1/watches/{test_watch.id}/service-history?limit=2&offset=2",
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert response.headers["x-total-count"] == "5"
+        assert [s["provider"] for s in response.json()] == [
+            "Provider 2", "Provider 3"
+        ]
+
+    def test_list_service_history_document_counts_only(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session
+    ):
+        """Test that include_documents=false returns counts without details"""
+        with_docs = ServiceHistory(
+            watch_id=test_watch.id,
+            service_date=datetime.utcnow(),
+            provider="With documents"
+        )
+        without_docs = ServiceHistory(
+            watch_id=test_watch.id,
+            service_date=datetime.utcnow() - timedelta(days=1),
+            provider="Without documents"
+        )
+        test_db.add_all([with_docs, without_docs])
+        test_db.commit()
+        for name in ("receipt.pdf", "certificate.pdf", "photo.jpg"):
+            test_db.add(ServiceDocument(
+                service_history_id=with_docs.id,
+                file_path=f"{test_watch.id}/{with_docs.id}/{name}",
+                file_name=name,
+                file_size=1024,
+                mime_type="application/pdf"
+            ))
+        test_db.commit()
+
+        url = f"/api/v1/watches/{test_watch.id}/service-history"
+        data = client.get(
+            f"{url}?include_documents=false", headers=auth_headers
+        ).json()
+        assert [s["document_count"] for s in data] == [3, 0]
+        assert all(s["documents"] is None for s in data)
+
+        data = client.get(url, headers=auth_headers).json()
+        assert [s["document_count"] for s in data] == [3, 0]
+        assert len(data[0]["documents"]) == 3
+        assert data[1]["documents"] == []
 
     def test_list_service_history_unauthorized(
         self,
@@ -794,3 +864,185 @@ class TestServiceDocuments:
         )
 
         assert response.status_code == 404
+
+
+class TestServiceRollups:
+    """Test per-watch service rollups and the cross-watch endpoints"""
+
+    def _create_service(self, client, headers, watch_id, **fields):
+        payload = {
+            "service_date": datetime.utcnow().isoformat(),
+            "provider": "Test Provider",
+            **fields,
+        }
+        response = client.post(
+            f"/api/v1/watches/{watch_id}/service-history",
+            headers=headers,
+            json=payload
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def test_rollup_maintained_on_create_update_delete(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session
+    ):
+        """Test that the rollup follows service record changes"""
+        now = datetime.utcnow()
+        older = self._create_service(
+            client, auth_headers, test_watch.id,
+            service_date=(now - timedelta(days=400)).isoformat(),
+            cost=300, cost_currency="CHF",
+            next_service_due=(now + timedelta(days=10)).isoformat()
+        )
+        newer = self._create_service(
+            client, auth_headers, test_watch.id,
+            service_date=(now - timedelta(days=5)).isoformat(),
+            cost=850.50,
+            next_service_due=(now + timedelta(days=1800)).isoformat()
+        )
+
+        rollup = test_db.get(WatchServiceRollup, test_watch.id)
+        assert rollup.service_count == 2
+        assert rollup.total_costs == {"CHF": 300, "USD": 850.5}
+        assert rollup.next_service_due.date() == (now + timedelta(days=1800)).date()
+        assert rollup.last_service_date.date() == (now - timedelta(days=5)).date()
+
+        client.put(
+            f"/api/v1/watches/{test_watch.id}/service-history/{older['id']}",
+            headers=auth_headers,
+            json={"cost": 100}
+        )
+        test_db.expire_all()
+        assert test_db.get(WatchServiceRollup, test_watch.id).total_costs == {
+            "CHF": 100, "USD": 850.5
+        }
+
+        client.delete(
+            f"/api/v1/watches/{test_watch.id}/service-history/{newer['id']}",
+            headers=auth_headers
+        )
+        test_db.expire_all()
+        rollup = test_db.get(WatchServiceRollup, test_watch.id)
+        assert rollup.service_count == 1
+        assert rollup.total_costs == {"CHF": 100}
+        assert rollup.next_service_due.date() == (now + timedelta(days=10)).date()
+
+        client.delete(
+            f"/api/v1/watches/{test_watch.id}/service-history/{older['id']}",
+            headers=auth_headers
+        )
+        test_db.expire_all()
+        rollup = test_db.get(WatchServiceRollup, test_watch.id)
+        assert rollup.service_count == 0
+        assert rollup.total_costs == {}
+        assert rollup.next_service_due is None
+
+    def test_upcoming_services(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        auth_headers2: dict,
+        test_watch: Watch,
+        test_brand,
+        test_user,
+        test_db: Session
+    ):
+        """Test listing due services across watches, soonest first"""
+        other_watch = Watch(
+            model="Daytona", brand_id=test_brand.id, user_id=test_user.id
+        )
+        far_watch = Watch(
+            model="Explorer", brand_id=test_brand.id, user_id=test_user.id
+        )
+        test_db.add_all([other_watch, far_watch])
+        test_db.commit()
+
+        now = datetime.utcnow()
+        self._create_service(
+            client, auth_headers, test_watch.id,
+            next_service_due=(now + timedelta(days=20)).isoformat()
+        )
+        self._create_service(
+            client, auth_headers, other_watch.id,
+            next_service_due=(now - timedelta(days=3)).isoformat()
+        )
+        self._create_service(
+            client, auth_headers, far_watch.id,
+            next_service_due=(now + timedelta(days=1000)).isoformat()
+        )
+
+        response = client.get(
+            "/api/v1/service-history/upcoming?days=30", headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["model"] for item in data] == ["Daytona", "Submariner Date"]
+        assert data[0]["overdue"] is True
+        assert data[0]["brand_name"] == "Rolex"
+        assert data[1]["overdue"] is False
+        assert data[1]["service_count"] == 1
+
+        response = client.get(
+            "/api/v1/service-history/upcoming?days=30&limit=1",
+            headers=auth_headers
+        )
+        assert len(response.json()) == 1
+
+        # Other users see nothing
+        response = client.get(
+            "/api/v1/service-history/upcoming", headers=auth_headers2
+        )
+        assert response.json() == []
+
+    def test_service_summary(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_brand,
+        test_user,
+        test_db: Session
+    ):
+        """Test spend totals across all watches"""
+        other_watch = Watch(
+            model="Daytona", brand_id=test_brand.id, user_id=test_user.id
+        )
+        test_db.add(other_watch)
+        test_db.commit()
+
+        due = datetime.utcnow() + timedelta(days=50)
+        self._create_service(client, auth_headers, test_watch.id, cost=100.10)
+        self._create_service(
+            client, auth_headers, other_watch.id,
+            cost=200.20, next_service_due=due.isoformat()
+        )
+        self._create_service(
+            client, auth_headers, other_watch.id, cost=400, cost_currency="EUR"
+        )
+
+        response = client.get("/api/v1/service-history/summary", headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["watches_serviced"] == 2
+        assert data["service_count"] == 3
+        assert data["total_costs"] == {"USD": "300.30", "EUR": "400.00"}
+
+    def test_rollups_removed_with_watch(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session
+    ):
+        """Test that deleting a watch drops its rollup"""
+        self._create_service(client, auth_headers, test_watch.id, cost=50)
+
+        response = client.delete(
+            f"/api/v1/watches/{test_watch.id}", headers=auth_headers
+        )
+        assert response.status_code == 204
+        assert test_db.query(WatchServiceRollup).count() == 0
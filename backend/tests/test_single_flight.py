@@ -0,0 +1,209 @@
+"""
+Tests for single-flight request coalescing
+"""
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.watch import Watch
+from app.utils import cache, single_flight as single_flight_module
+from app.utils.single_flight import SingleFlight, single_flight
+from tests.test_cache import FakeRedis
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    client = FakeRedis()
+    monkeypatch.setattr(cache, "redis_client", client)
+    monkeypatch.setattr(cache, "_retry_at", 0.0)
+    return client
+
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def counters(flight: SingleFlight, endpoint: str = "test") -> dict:
+    return flight.stats()["endpoints"].get(endpoint, {})
+
+
+class TestSingleFlight:
+    """Test coalescing within and across workers"""
+
+    def test_concurrent_calls_share_one_computation(self):
+        """Test that callers arriving while a key is in flight wait for it"""
+        flight = SingleFlight(use_redis_lock=False, timeout=5)
+        release = threading.Event()
+        computed = []
+
+        def compute():
+            computed.append(1)
+            release.wait(5)
+            return {"answer": 42}
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(flight.run("test", "k", compute))
+            )
+            for _ in range(4)
+        ]
+        threads[0].start()
+        wait_until(lambda: flight.stats()["in_flight"] == 1)
+        for thread in threads[1:]:
+            thread.start()
+        wait_until(lambda: counters(flight).get("coalesced") == 3)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(computed) == 1
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+        assert counters(flight)["executions"] == 1
+        assert flight.stats()["in_flight"] == 0
+
+    def test_errors_reach_waiting_callers(self):
+        """Test that a failed computation fails every waiting caller"""
+        flight = SingleFlight(use_redis_lock=False, timeout=5)
+        release = threading.Event()
+
+        def compute():
+            release.wait(5)
+            raise ValueError("boom")
+
+        errors = []
+
+        def call():
+            try:
+                flight.run("test", "k", compute)
+            except ValueError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        threads[0].start()
+        wait_until(lambda: flight.stats()["in_flight"] == 1)
+        for thread in threads[1:]:
+            thread.start()
+        wait_until(lambda: counters(flight).get("coalesced") == 2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(errors) == 3
+        assert counters(flight)["failures"] == 1
+
+    def test_lookup_hit_skips_computation(self):
+        """Test that stored results are returned without computing"""
+        flight = SingleFlight(use_redis_lock=False, timeout=5)
+        assert flight.run("test", "k", lambda: 1, lambda: 2) == 2
+        assert counters(flight)["hits"] == 1
+        assert counters(flight)["executions"] == 0
+
+    def test_finished_calls_are_not_memoized(self):
+        """Test that only in-flight computations are shared"""
+        flight = SingleFlight(use_redis_lock=False, timeout=5)
+        assert flight.run("test", "k", lambda: 1) == 1
+        assert flight.run("test", "k", lambda: 2) == 2
+        assert counters(flight)["executions"] == 2
+
+    def test_waits_for_other_worker(self, fake_redis: FakeRedis, monkeypatch):
+        """Test that a held Redis lock defers to the other worker's result"""
+        monkeypatch.setattr(single_flight_module, "REMOTE_POLL_SECONDS", 0.01)
+        flight = SingleFlight(use_redis_lock=True, timeout=5)
+        lock_key = cache.LOCK_PREFIX + "single-flight:k"
+        fake_redis.data[lock_key] = "other-worker"
+        stored = {}
+
+        def other_worker():
+            time.sleep(0.1)
+            stored["k"] = "remote"
+            fake_redis.unlink(lock_key)
+
+        thread = threading.Thread(target=other_worker)
+        thread.start()
+        result = flight.run("test", "k", lambda: "local", lambda: stored.get("k"))
+        thread.join(5)
+
+        assert result == "remote"
+        assert counters(flight)["remote_waits"] == 1
+        assert counters(flight)["executions"] == 0
+
+    def test_takes_and_releases_redis_lock(self, fake_redis: FakeRedis):
+        """Test that the leader holds the lock only while computing"""
+        flight = SingleFlight(use_redis_lock=True, timeout=5)
+        lock_key = cache.LOCK_PREFIX + "single-flight:k"
+
+        def compute():
+            assert lock_key in fake_redis.data
+            return 1
+
+        assert flight.run("test", "k", compute) == 1
+        assert lock_key not in fake_redis.data
+
+    def test_stuck_lock_times_out(self, fake_redis: FakeRedis, monkeypatch):
+        """Test that a lock that is never released only delays computing"""
+        monkeypatch.setattr(single_flight_module, "REMOTE_POLL_SECONDS", 0.01)
+        flight = SingleFlight(use_redis_lock=True, timeout=0.05)
+        fake_redis.data[cache.LOCK_PREFIX + "single-flight:k"] = "other-worker"
+
+        assert flight.run("test", "k", lambda: "local", lambda: None) == "local"
+        assert counters(flight)["executions"] == 1
+
+
+class TestSharedAnalytics:
+    """Test single-flight analytics and exports"""
+
+    def test_collection_analytics_shared_until_data_changes(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_db: Session,
+        test_watch: Watch,
+        fake_redis: FakeRedis
+    ):
+        """Test that results are keyed by data version"""
+        before = counters(single_flight, "collection_analytics")
+
+        first = client.get("/api/v1/collection-analytics", headers=auth_headers)
+        second = client.get("/api/v1/collection-analytics", headers=auth_headers)
+        assert first.status_code == 200
+        assert second.json() == first.json()
+
+        after = counters(single_flight, "collection_analytics")
+        assert after["executions"] - before.get("executions", 0) == 1
+        assert after["hits"] - before.get("hits", 0) == 1
+
+        test_watch.current_market_value = 9000
+        test_watch.current_market_currency = "USD"
+        test_db.commit()
+
+        third = client.get("/api/v1/collection-analytics", headers=auth_headers)
+        assert third.json()["total_current_value"] != first.json()["total_current_value"]
+        after = counters(single_flight, "collection_analytics")
+        assert after["executions"] - before.get("executions", 0) == 2
+
+    def test_watch_analytics_not_found_not_shared(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        auth_headers2: dict
+    ):
+        """Test that another user's request computes (and fails) separately"""
+        response = client.get(
+            f"/api/v1/watches/{test_watch.id}/analytics", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        response = client.get(
+            f"/api/v1/watches/{test_watch.id}/analytics", headers=auth_headers2
+        )
+        assert response.status_code == 404
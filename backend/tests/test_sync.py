@@ -0,0 +1,217 @@
+"""
+Tests for the incremental sync endpoint
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models.market_value import MarketValue
+from app.models.sync import SyncTombstone
+from app.models.watch import Watch
+from app.utils.sync import parse_token
+from tests.conftest import TestingSessionLocal
+
+
+def sync(client: TestClient, headers: dict, **params) -> dict:
+    response = client.get("/api/v1/sync", headers=headers, params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def add_market_value(
+    client: TestClient, headers: dict, watch: Watch, value: str
+) -> dict:
+    response = client.post(
+        f"/api/v1/watches/{watch.id}/market-values",
+        headers=headers,
+        json={"value": value, "currency": "USD", "source": "manual"},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestSync:
+    """Test GET /sync"""
+
+    def test_full_sync(self, client: TestClient, auth_headers: dict, test_watch: Watch):
+        """Test that since=0 returns all of the user's rows"""
+        add_market_value(client, auth_headers, test_watch, "15000.00")
+
+        data = sync(client, auth_headers)
+
+        assert [w["id"] for w in data["watches"]] == [str(test_watch.id)]
+        assert len(data["market_values"]) == 1
+        assert data["watch_images"] == []
+        assert data["deleted"] == []
+        assert data["has_more"] is False
+        value = data["market_values"][0]
+        assert parse_token(data["token"]) >= (value["change_xid"], value["change_seq"])
+
+    def test_no_changes_since_token(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that syncing with the latest token returns nothing"""
+        token = sync(client, auth_headers)["token"]
+
+        data = sync(client, auth_headers, since=token)
+
+        assert data["watches"] == []
+        assert data["deleted"] == []
+        assert data["token"] == token
+
+    def test_returns_only_changes(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that created and updated rows after the token are returned"""
+        token = sync(client, auth_headers)["token"]
+
+        value = add_market_value(client, auth_headers, test_watch, "15000.00")
+        data = sync(client, auth_headers, since=token)
+
+        # Adding a value also refreshes the watch's current market value
+        assert [v["id"] for v in data["market_values"]] == [value["id"]]
+        assert [w["id"] for w in data["watches"]] == [str(test_watch.id)]
+        assert parse_token(data["token"]) > parse_token(token)
+
+        response = client.put(
+            f"/api/v1/watches/{test_watch.id}",
+            headers=auth_headers,
+            json={"notes": "Serviced"},
+        )
+        assert response.status_code == 200
+
+        data = sync(client, auth_headers, since=data["token"])
+        assert data["watches"][0]["notes"] == "Serviced"
+        assert data["market_values"] == []
+
+    def test_deletes_leave_tombstones(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session,
+    ):
+        """Test that deleted rows are reported under deleted"""
+        value = add_market_value(client, auth_headers, test_watch, "15000.00")
+        token = sync(client, auth_headers)["token"]
+
+        response = client.delete(
+            f"/api/v1/watches/{test_watch.id}/market-values/{value['id']}",
+            headers=auth_headers,
+        )
+        assert response.status_code == 204
+
+        data = sync(client, auth_headers, since=token)
+        assert [(d["entity"], d["id"]) for d in data["deleted"]] == [
+            ("market_values", value["id"])
+        ]
+
+        response = client.delete(
+            f"/api/v1/watches/{test_watch.id}", headers=auth_headers
+        )
+        assert response.status_code == 204
+
+        data = sync(client, auth_headers, since=data["token"])
+        assert ("watches", str(test_watch.id)) in {
+            (d["entity"], d["id"]) for d in data["deleted"]
+        }
+
+    def test_paging_with_limit(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session,
+    ):
+        """Test that a truncated sync resumes without gaps"""
+        for value in range(5):
+            test_db.add(MarketValue(watch_id=test_watch.id, value=1000 + value))
+        test_db.commit()
+
+        seen = set()
+        token = "0"
+        for _ in range(10):
+            data = sync(client, auth_headers, since=token, limit=2)
+            assert len(data["market_values"]) <= 2
+            seen.update(v["id"] for v in data["market_values"])
+            token = data["token"]
+            if not data["has_more"]:
+                break
+
+        assert len(seen) == 5
+        assert data["has_more"] is False
+
+    def test_other_users_changes_hidden(
+        self,
+        client: TestClient,
+        auth_headers2: dict,
+        test_watch: Watch,
+        test_db: Session,
+    ):
+        """Test that another user's rows and tombstones are not returned"""
+        test_db.delete(test_watch)
+        test_db.commit()
+        assert test_db.query(SyncTombstone).count() == 1
+
+        data = sync(client, auth_headers2)
+
+        assert data["watches"] == []
+        assert data["deleted"] == []
+        assert parse_token(data["token"])[1] == 0
+
+    def test_legacy_token_restarts(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that an integer token from before transaction ids resyncs"""
+        data = sync(client, auth_headers, since=10**9)
+        assert [w["id"] for w in data["watches"]] == [str(test_watch.id)]
+
+    def test_change_committed_out_of_order(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session,
+    ):
+        """Test that a token never skips a change that commits late"""
+        token = sync(client, auth_headers)["token"]
+
+        # A takes the lower change_seq but commits after B
+        session_a = TestingSessionLocal()
+        try:
+            # Core insert: no flush, so A does not hold the user's data
+            # version row that B's flush bumps
+            early_id, early_seq = session_a.execute(
+                insert(MarketValue)
+                .values(watch_id=test_watch.id, value=1000)
+                .returning(MarketValue.id, MarketValue.change_seq)
+            ).one()
+
+            late = MarketValue(watch_id=test_watch.id, value=2000)
+            test_db.add(late)
+            test_db.commit()
+            assert early_seq < late.change_seq
+
+            # B is visible, but A may still commit below it
+            data = sync(client, auth_headers, since=token)
+            assert data["market_values"] == []
+            assert data["has_more"] is False
+            token = data["token"]
+
+            session_a.commit()
+        finally:
+            session_a.close()
+
+        data = sync(client, auth_headers, since=token)
+        assert {v["id"] for v in data["market_values"]} == {
+            str(early_id),
+            str(late.id),
+        }
+
+    @pytest.mark.parametrize("params", [{"since": -1}, {"since": "1:x"}, {"limit": 0}])
+    def test_invalid_params(self, client: TestClient, auth_headers: dict, params):
+        """Test parameter validation"""
+        response = client.get("/api/v1/sync", headers=auth_headers, params=params)
+        assert response.status_code == 422
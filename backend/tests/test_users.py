@@ -237,6 +237,23 @@ class TestResetUserPassword:
         test_db.refresh(test_user)
         assert test_user.hashed_password != old_hash
 
+    def test_reset_user_password_off_event_loop(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        test_user: User,
+        event_loop_queries: list
+    ):
+        """Test that no query runs on the event loop after the commit"""
+        response = client.post(
+            f"/api/v1/users/{test_user.id}/reset-password",
+            headers=admin_headers,
+            json={"new_password": "newpassword123"}
+        )
+
+        assert response.status_code == 204
+        assert event_loop_queries == []
+
     def test_reset_user_password_can_login_with_new(
         self,
         client: TestClient,
@@ -461,3 +478,63 @@ class TestAdminAccessControl:
         user = test_db.query(User).filter(User.email == "first@example.com").first()
         assert user is not None
         assert user.role == UserRole.admin
+
+
+class TestPasswordHashingStats:
+    """Test password hashing metrics endpoint"""
+
+    def test_stats_as_admin(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        test_user: User
+    ):
+        """Test that admins can read hashing queue counters"""
+        client.post(
+            "/api/v1/auth/login",
+            json={"email": test_user.email, "password": "testpass123"}
+        )
+
+        response = client.get("/api/v1/users/password-hashing", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["workers"] >= 1
+        assert data["completed"] >= 1
+        assert data["queued"] == 0
+
+    def test_stats_as_regular_user_forbidden(
+        self,
+        client: TestClient,
+        auth_headers: dict
+    ):
+        """Test that regular users cannot read hashing counters"""
+        response = client.get("/api/v1/users/password-hashing", headers=auth_headers)
+        assert response.status_code == 403
+
+
+class TestSingleFlightStats:
+    """Test single-flight metrics endpoint"""
+
+    def test_stats_as_admin(
+        self,
+        client: TestClient,
+        admin_headers: dict,
+        auth_headers: dict
+    ):
+        """Test that admins can read hit and coalesce counters"""
+        client.get("/api/v1/collection-analytics", headers=auth_headers)
+
+        response = client.get("/api/v1/users/single-flight", headers=admin_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["in_flight"] == 0
+        assert data["endpoints"]["collection_analytics"]["calls"] >= 1
+
+    def test_stats_as_regular_user_forbidden(
+        self,
+        client: TestClient,
+        auth_headers: dict
+    ):
+        """Test that regular users cannot read the counters"""
+        response = client.get("/api/v1/users/single-flight", headers=auth_headers)
+        assert response.status_code == 403
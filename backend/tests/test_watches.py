@@ -1,11 +1,19 @@
 """
 Tests for watch CRUD endpoints
 """
+import csv
+import io
+import json
+import zipfile
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from app.models import Brand, Collection, Watch
+from app.models import Brand, Collection, Watch, WatchImage
+from app.utils.export_cache import export_cache
+from app.utils.reference_data import reload_reference_snapshot
+from tests.conftest import TestingSessionLocal
 
 
 class TestCreateWatch:
@@ -90,6 +98,34 @@ class TestListWatches:
         assert len(data["items"]) > 0
         assert data["items"][0]["model"] == "Submariner Date"
 
+    def test_list_watches_primary_image(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session
+    ):
+        """Test that each item carries its primary image only"""
+        response = client.get("/api/v1/watches/", headers=auth_headers)
+        assert response.json()["items"][0]["primary_image"] is None
+
+        for name, is_primary in [("side.jpg", False), ("front.jpg", True)]:
+            test_db.add(WatchImage(
+                watch_id=test_watch.id,
+                file_path=f"{test_watch.id}/{name}",
+                file_name=name,
+                file_size=20,
+                mime_type="image/jpeg",
+                is_primary=is_primary,
+            ))
+        test_db.commit()
+
+        response = client.get("/api/v1/watches/", headers=auth_headers)
+        assert response.status_code == 200
+        primary_image = response.json()["items"][0]["primary_image"]
+        assert primary_image["file_name"] == "front.jpg"
+        assert primary_image["is_primary"] is True
+
     def test_list_watches_pagination(
         self,
         client: TestClient,
@@ -300,3 +336,677 @@ class TestDeleteWatch:
             headers=auth_headers2
         )
         assert response.status_code == 404
+
+
+@pytest.mark.usefixtures("mock_export_cache")
+class TestExportCollectionPDF:
+    """Test collection PDF export"""
+
+    def test_export_pdf(self, client: TestClient, auth_headers: dict, test_watch: Watch):
+        """Test exporting all watches as a PDF"""
+        response = client.get("/api/v1/watches/export/pdf", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF")
+
+    def test_export_pdf_streaming(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test exporting watches in streaming mode"""
+        response = client.get(
+            "/api/v1/watches/export/pdf",
+            headers=auth_headers,
+            params={"stream": True},
+        )
+        assert response.status_code == 200
+        assert response.content.startswith(b"%PDF")
+        assert response.content.rstrip().endswith(b"%%EOF")
+
+    def test_export_pdf_parallel(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test exporting watches rendered across worker processes"""
+        response = client.get(
+            "/api/v1/watches/export/pdf",
+            headers=auth_headers,
+            params={"parallel": True},
+        )
+        assert response.status_code == 200
+        assert response.content.startswith(b"%PDF")
+
+    def test_export_zip(self, client: TestClient, auth_headers: dict, test_watch: Watch):
+        """Test exporting one PDF per watch as a ZIP archive"""
+        response = client.get("/api/v1/watches/export/zip", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/zip"
+        assert response.headers["etag"].startswith('"')
+
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            names = archive.namelist()
+            assert len(names) == 1
+            assert names[0].endswith(".pdf")
+            assert archive.read(names[0]).startswith(b"%PDF")
+
+    def test_export_zip_no_watches(self, client: TestClient, auth_headers: dict):
+        """Test ZIP export with no watches"""
+        response = client.get("/api/v1/watches/export/zip", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_export_pdf_streaming_no_watches(
+        self, client: TestClient, auth_headers: dict
+    ):
+        """Test streaming export with no watches"""
+        response = client.get(
+            "/api/v1/watches/export/pdf",
+            headers=auth_headers,
+            params={"stream": True},
+        )
+        assert response.status_code == 404
+
+
+@pytest.mark.usefixtures("mock_export_cache")
+class TestExportPDFCaching:
+    """Test cached, ETag-addressable PDF exports"""
+
+    def test_watch_pdf_has_etag(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that watch exports carry a strong ETag"""
+        response = client.get(
+            f"/api/v1/watches/{test_watch.id}/export/pdf", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.content.startswith(b"%PDF")
+        assert response.headers["etag"].startswith('"')
+        assert response.headers["cache-control"] == "private, no-cache"
+
+    def test_watch_pdf_not_modified(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that a matching If-None-Match returns 304"""
+        url = f"/api/v1/watches/{test_watch.id}/export/pdf"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    def test_repeat_export_served_from_cache(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch, mock_export_cache
+    ):
+        """Test that an unchanged watch is rendered only once"""
+        url = f"/api/v1/watches/{test_watch.id}/export/pdf"
+        first = client.get(url, headers=auth_headers)
+        second = client.get(url, headers=auth_headers)
+
+        assert first.content == second.content
+        assert len([p for p in mock_export_cache.rglob("*") if p.is_file()]) == 1
+
+    def test_watch_pdf_etag_changes_on_update(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that editing the watch invalidates the ETag"""
+        url = f"/api/v1/watches/{test_watch.id}/export/pdf"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        client.put(
+            f"/api/v1/watches/{test_watch.id}",
+            headers=auth_headers,
+            json={"notes": "Serviced"},
+        )
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_collection_pdf_etag_changes_with_service_history(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that adding service history invalidates collection exports"""
+        url = "/api/v1/watches/export/pdf"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        client.post(
+            f"/api/v1/watches/{test_watch.id}/service-history",
+            headers=auth_headers,
+            json={"service_date": "2024-01-01T00:00:00", "provider": "Rolex"},
+        )
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+
+    def test_collection_pdf_etag_per_mode(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch,
+        mock_export_cache
+    ):
+        """Test that each rendering mode has its own ETag and cache entry"""
+        url = "/api/v1/watches/export/pdf"
+        responses = [
+            client.get(url, headers=auth_headers, params=params)
+            for params in ({}, {"stream": True}, {"parallel": True})
+        ]
+        etags = {response.headers["etag"] for response in responses}
+
+        assert len(etags) == 3
+        assert len([p for p in mock_export_cache.rglob("*") if p.is_file()]) == 3
+
+        response = client.get(
+            url,
+            headers={**auth_headers, "If-None-Match": responses[0].headers["etag"]},
+            params={"stream": True},
+        )
+        assert response.status_code == 200
+
+    def test_collection_pdf_etag_changes_on_brand_rename(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch,
+        test_brand: Brand, test_db: Session
+    ):
+        """Test that renamed reference data invalidates cached exports"""
+        url = "/api/v1/watches/export/pdf"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        test_brand.name = "Tudor"
+        test_db.commit()
+        reload_reference_snapshot(test_db)
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_evicted_entry_rendered_again(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch, monkeypatch
+    ):
+        """Test that an entry evicted by another worker after lookup is re-rendered"""
+        url = f"/api/v1/watches/{test_watch.id}/export/pdf"
+        first = client.get(url, headers=auth_headers)
+
+        lookup = export_cache.get
+
+        def get_then_evict(etag):
+            path = lookup(etag)
+            if path is not None:
+                path.unlink()
+            return path
+
+        monkeypatch.setattr(export_cache, "get", get_then_evict)
+        response = client.get(url, headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.content.startswith(b"%PDF")
+        assert response.headers["etag"] == first.headers["etag"]
+        assert int(response.headers["content-length"]) == len(response.content)
+
+    def test_collection_pdf_not_visible_to_other_users(
+        self, client: TestClient, auth_headers: dict, auth_headers2: dict, test_watch: Watch
+    ):
+        """Test that ETags are scoped per user"""
+        etag = client.get("/api/v1/watches/export/pdf", headers=auth_headers).headers[
+            "etag"
+        ]
+
+        response = client.get(
+            "/api/v1/watches/export/pdf",
+            headers={**auth_headers2, "If-None-Match": etag},
+        )
+        assert response.status_code == 404
+
+
+class TestWatchConditionalGet:
+    """Test ETag / If-None-Match support on watch reads"""
+
+    def test_get_watch_not_modified(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that an unchanged watch is answered with 304"""
+        url = f"/api/v1/watches/{test_watch.id}"
+        first = client.get(url, headers=auth_headers)
+        assert first.headers["cache-control"] == "private, no-cache"
+        etag = first.headers["etag"]
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    def test_get_watch_etag_changes_on_update(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that editing the watch invalidates its ETag"""
+        url = f"/api/v1/watches/{test_watch.id}"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        client.put(url, headers=auth_headers, json={"notes": "Serviced"})
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["notes"] == "Serviced"
+
+    def test_get_watch_etag_changes_with_collection(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that renaming the watch's collection invalidates its ETag"""
+        url = f"/api/v1/watches/{test_watch.id}"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        client.put(
+            f"/api/v1/collections/{test_watch.collection_id}",
+            headers=auth_headers,
+            json={"name": "Divers"},
+        )
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["collection"]["name"] == "Divers"
+
+    def test_get_watch_other_user(
+        self, client: TestClient, auth_headers: dict, auth_headers2: dict, test_watch: Watch
+    ):
+        """Test that another user's ETag does not reveal the watch"""
+        url = f"/api/v1/watches/{test_watch.id}"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        response = client.get(url, headers={**auth_headers2, "If-None-Match": etag})
+        assert response.status_code == 404
+
+    def test_get_watch_missing_with_wildcard(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that If-None-Match: * does not hide a missing watch"""
+        response = client.get(
+            "/api/v1/watches/00000000-0000-0000-0000-000000000000",
+            headers={**auth_headers, "If-None-Match": "*"},
+        )
+        assert response.status_code == 404
+
+    def test_etags_change_on_brand_rename(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_brand: Brand,
+        test_db: Session,
+    ):
+        """Test that renamed reference data invalidates watch ETags"""
+        urls = [f"/api/v1/watches/{test_watch.id}", "/api/v1/watches/"]
+        etags = [client.get(url, headers=auth_headers).headers["etag"] for url in urls]
+
+        test_brand.name = "Tudor"
+        test_db.commit()
+        reload_reference_snapshot(test_db)
+
+        for url, etag in zip(urls, etags):
+            response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+            assert response.status_code == 200
+        assert response.json()["items"][0]["brand"]["name"] == "Tudor"
+
+    def test_etag_changes_when_earlier_writer_commits(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that a write committed after the ETag was issued invalidates it"""
+        url = "/api/v1/watches/"
+        session_a = TestingSessionLocal()
+        try:
+            watch = session_a.get(Watch, test_watch.id)
+            watch.notes = "Written before the read, committed after it"
+            session_a.flush()
+
+            etag = client.get(url, headers=auth_headers).headers["etag"]
+            session_a.commit()
+        finally:
+            session_a.close()
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+
+    def test_list_watches_not_modified(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that an unchanged list is answered with 304"""
+        url = "/api/v1/watches/?limit=10"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        # Other query parameters get their own validator
+        response = client.get(
+            "/api/v1/watches/?limit=5", headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+    def test_list_watches_etag_changes_on_delete(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that deleting a watch invalidates the list ETag"""
+        url = "/api/v1/watches/"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        client.delete(f"/api/v1/watches/{test_watch.id}", headers=auth_headers)
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
+
+class TestWatchQRCode:
+    """Test watch QR code endpoint"""
+
+    def test_qr_code_cache_headers(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that QR codes are served as cacheable PNGs"""
+        response = client.get(
+            f"/api/v1/watches/{test_watch.id}/qr-code", headers=auth_headers
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+        assert "max-age=31536000" in response.headers["cache-control"]
+        assert response.headers["etag"].startswith('"')
+
+    def test_qr_code_not_modified(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that a matching If-None-Match returns 304"""
+        url = f"/api/v1/watches/{test_watch.id}/qr-code"
+        etag = client.get(url, headers=auth_headers).headers["etag"]
+
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = client.get(
+            url,
+            headers={**auth_headers, "If-None-Match": etag},
+            params={"size": 5},
+        )
+        assert response.status_code == 200
+
+    def test_qr_code_svg(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test requesting a vector QR code"""
+        response = client.get(
+            f"/api/v1/watches/{test_watch.id}/qr-code",
+            headers=auth_headers,
+            params={"format": "svg"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/svg+xml"
+        assert b"<svg" in response.content
+
+    def test_qr_code_invalid_format(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test that unknown formats are rejected"""
+        response = client.get(
+            f"/api/v1/watches/{test_watch.id}/qr-code",
+            headers=auth_headers,
+            params={"format": "gif"},
+        )
+        assert response.status_code == 422
+
+    def test_qr_code_other_user(
+        self, client: TestClient, auth_headers2: dict, test_watch: Watch
+    ):
+        """Test that other users cannot get a watch's QR code"""
+        response = client.get(
+            f"/api/v1/watches/{test_watch.id}/qr-code", headers=auth_headers2
+        )
+        assert response.status_code == 404
+
+
+@pytest.mark.usefixtures("mock_export_cache")
+class TestExportQRLabels:
+    """Test QR label sheet export"""
+
+    def test_export_qr_labels(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test exporting a label sheet for all watches"""
+        response = client.get("/api/v1/watches/export/qr-labels", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF")
+
+        etag = response.headers["etag"]
+        response = client.get(
+            "/api/v1/watches/export/qr-labels",
+            headers={**auth_headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+    def test_export_qr_labels_no_watches(self, client: TestClient, auth_headers: dict):
+        """Test label sheet export with no watches"""
+        response = client.get("/api/v1/watches/export/qr-labels", headers=auth_headers)
+        assert response.status_code == 404
+
+
+class TestImportWatches:
+    """Test bulk watch import"""
+
+    def test_import_csv(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_db: Session,
+        test_brand: Brand,
+        test_movement_type,
+        test_collection: Collection,
+    ):
+        """Test importing watches from CSV using reference names"""
+        body = (
+            "brand,model,reference_number,movement_type,collection,purchase_price,complications\n"
+            "rolex,Submariner,126610LN,Automatic,Test Collection,9500.00,Date;GMT\n"
+            "Rolex,Explorer,,,,,\n"
+        )
+        response = client.post(
+            "/api/v1/watches/import",
+            headers={**auth_headers, "Content-Type": "text/csv"},
+            content=body,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data == {"imported": 2, "failed": 0, "errors": []}
+
+        submariner = test_db.query(Watch).filter(Watch.model == "Submariner").one()
+        assert submariner.brand_id == test_brand.id
+        assert submariner.movement_type_id == test_movement_type.id
+        assert submariner.collection_id == test_collection.id
+        assert submariner.complications == ["Date", "GMT"]
+        assert submariner.purchase_currency == "USD"
+
+    def test_import_ndjson(
+        self, client: TestClient, auth_headers: dict, test_db: Session, test_brand: Brand
+    ):
+        """Test importing watches from JSON lines with ids"""
+        lines = [
+            {"brand_id": str(test_brand.id), "model": f"Model {i}"} for i in range(3)
+        ]
+        body = "\n".join(json.dumps(line) for line in lines)
+        response = client.post(
+            "/api/v1/watches/import",
+            headers=auth_headers,
+            params={"format": "ndjson"},
+            content=body,
+        )
+        assert response.status_code == 200
+        assert response.json()["imported"] == 3
+        assert test_db.query(Watch).count() == 3
+
+    def test_import_reports_row_errors(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        auth_headers2: dict,
+        test_db: Session,
+        test_brand: Brand,
+        test_collection: Collection,
+    ):
+        """Test that invalid rows are reported and valid rows still imported"""
+        body = (
+            "brand,model,purchase_price,collection_id\n"
+            "Rolex,Good,100,\n"
+            "Omega,Unknown brand,100,\n"
+            "Rolex,,100,\n"
+            "Rolex,Negative,-5,\n"
+            f"Rolex,Other users collection,,{test_collection.id}\n"
+        )
+        response = client.post(
+            "/api/v1/watches/import",
+            headers={**auth_headers2, "Content-Type": "text/csv"},
+            content=body,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["imported"] == 1
+        assert data["failed"] == 4
+        assert [error["row"] for error in data["errors"]] == [3, 4, 5, 6]
+        assert "brand: Brand 'Omega' not found" in data["errors"][0]["errors"]
+        assert data["errors"][1]["errors"][0].startswith("model:")
+        assert data["errors"][2]["errors"][0].startswith("purchase_price:")
+        assert data["errors"][3]["errors"] == ["collection_id: Collection not found"]
+
+    def test_import_invalid_json_line(
+        self, client: TestClient, auth_headers: dict, test_brand: Brand
+    ):
+        """Test that unparseable JSON lines are reported"""
+        body = f'{{"brand_id": "{test_brand.id}", "model": "Ok"}}\nnot json\n[1]\n'
+        response = client.post(
+            "/api/v1/watches/import",
+            headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+            content=body,
+        )
+        data = response.json()
+        assert data["imported"] == 1
+        assert [error["row"] for error in data["errors"]] == [2, 3]
+
+    def test_import_batches(
+        self, client: TestClient, auth_headers: dict, test_db: Session, test_brand: Brand
+    ):
+        """Test importing more rows than one insert batch"""
+        body = "brand,model\n" + "".join(f"Rolex,Model {i}\n" for i in range(1200))
+        response = client.post(
+            "/api/v1/watches/import",
+            headers={**auth_headers, "Content-Type": "text/csv"},
+            content=body,
+        )
+        assert response.json()["imported"] == 1200
+        assert test_db.query(Watch).count() == 1200
+
+    def test_import_malformed_csv(
+        self, client: TestClient, auth_headers: dict, test_db: Session, test_brand: Brand
+    ):
+        """Test that a CSV the parser rejects is a bad request, not a server error"""
+        body = "brand,model\nRolex,Good\n" + f'Rolex,"{"x" * 200_000}"\n'
+        response = client.post(
+            "/api/v1/watches/import",
+            headers={**auth_headers, "Content-Type": "text/csv"},
+            content=body,
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"].startswith("Malformed CSV")
+        assert test_db.query(Watch).count() == 0
+
+    def test_import_unsupported_format(self, client: TestClient, auth_headers: dict):
+        """Test that an unknown content type is rejected"""
+        response = client.post(
+            "/api/v1/watches/import",
+            headers={**auth_headers, "Content-Type": "application/xml"},
+            content="<watches/>",
+        )
+        assert response.status_code == 415
+
+
+class TestExportWatchesData:
+    """Test CSV / JSON lines watch export"""
+
+    def test_export_csv(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test exporting watches as CSV"""
+        response = client.get("/api/v1/watches/export", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(test_watch.id)
+        assert rows[0]["model"] == test_watch.model
+        assert rows[0]["brand"] == "Rolex"
+        assert "market_values" not in rows[0]
+
+    def test_export_ndjson_with_history(
+        self, client: TestClient, auth_headers: dict, test_watch: Watch
+    ):
+        """Test exporting watches as JSON lines with market value history"""
+        client.post(
+            f"/api/v1/watches/{test_watch.id}/market-values",
+            headers=auth_headers,
+            json={"value": "12000.00"},
+        )
+
+        response = client.get(
+            "/api/v1/watches/export",
+            headers=auth_headers,
+            params={"format": "ndjson", "include": ["market_values", "service_history"]},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert len(records) == 1
+        assert records[0]["market_values"][0]["value"] == "12000.00"
+        assert records[0]["service_history"] == []
+        assert "accuracy_readings" not in records[0]
+
+    def test_export_csv_round_trips_through_import(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_watch: Watch,
+        test_db: Session,
+    ):
+        """Test that a CSV export can be imported again"""
+        exported = client.get("/api/v1/watches/export", headers=auth_headers).text
+
+        response = client.post(
+            "/api/v1/watches/import",
+            headers={**auth_headers, "Content-Type": "text/csv"},
+            content=exported,
+        )
+        assert response.json()["imported"] == 1
+
+        copy = test_db.query(Watch).filter(Watch.id != test_watch.id).one()
+        assert copy.model == test_watch.model
+        assert copy.collection_id == test_watch.collection_id
+
+    def test_export_streams_many_watches(
+        self, client: TestClient, auth_headers: dict, test_db: Session, test_watch: Watch
+    ):
+        """Test exporting more watches than one cursor batch"""
+        test_db.add_all(
+            Watch(user_id=test_watch.user_id, brand_id=test_watch.brand_id, model=f"M{i}")
+            for i in range(1200)
+        )
+        test_db.commit()
+
+        response = client.get(
+            "/api/v1/watches/export", headers=auth_headers, params={"format": "ndjson"}
+        )
+        assert len(response.text.splitlines()) == 1201
+
+    def test_export_invalid_include(self, client: TestClient, auth_headers: dict):
+        """Test that unknown history names are rejected"""
+        response = client.get(
+            "/api/v1/watches/export", headers=auth_headers, params={"include": "photos"}
+        )
+        assert response.status_code == 422
+
+    def test_export_only_own_watches(
+        self, client: TestClient, auth_headers2: dict, test_watch: Watch
+    ):
+        """Test that other users' watches are not exported"""
+        response = client.get(
+            "/api/v1/watches/export", headers=auth_headers2, params={"format": "ndjson"}
+        )
+        assert response.status_code == 200
+        assert response.text == ""